@@ -1,43 +1,12 @@
 import logging
-import re
-
-from openai import OpenAI
+from collections.abc import Iterator
 
 from .config import Config
+from .writer_engine import GenerationEngine, GenerationRequest, StreamEvent, get_engine
 
 logger = logging.getLogger(__name__)
 
 
-def _parse_title_content(response_text: str) -> tuple[str, str]:
-    """GPT 응답에서 제목과 본문을 분리합니다.
-
-    다양한 형식에 대응합니다:
-    - '# 제목' / '## 제목' (마크다운 헤더)
-    - '제목: ...'
-    - 첫 줄 텍스트 그대로
-    """
-    text = response_text.strip()
-    lines = text.split("\n", 1)
-
-    title_line = lines[0].strip()
-
-    # 마크다운 헤더 제거: "### 제목" → "제목"
-    title = re.sub(r'^#{1,6}\s*', '', title_line).strip()
-    # 앞뒤 따옴표 제거
-    title = title.strip('"').strip("'").strip()
-    # "제목: ..." 형식 처리
-    if title.lower().startswith("제목:") or title.lower().startswith("title:"):
-        title = title.split(":", 1)[1].strip()
-
-    content = lines[1].strip() if len(lines) > 1 else ""
-    # 본문 시작이 빈 줄이면 제거
-    content = content.lstrip("\n")
-
-    if not title:
-        title = "제목 없음"
-
-    return title, content
-
 BLOG_SYSTEM_PROMPT = """당신은 전문 블로그 작가입니다.
 주어진 주제에 대해 매력적이고 정보가 풍부한 블로그 글을 작성합니다.
 
@@ -60,46 +29,59 @@ BLOG_SYSTEM_PROMPT = """당신은 전문 블로그 작가입니다.
 class AIWriter:
     """OpenAI GPT API를 사용하여 블로그 글을 생성합니다."""
 
-    def __init__(self):
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    def __init__(self, engine: GenerationEngine | None = None):
+        self.engine = engine or get_engine()
+
+    def build_request(self, topic: str, keywords: list[str] | None = None) -> GenerationRequest:
+        """범용 글쓰기 프롬프트를 구성합니다."""
+        user_prompt = f"주제: {topic}"
+        if keywords:
+            user_prompt += f"\n키워드: {', '.join(keywords)}"
 
-    def generate_post(self, topic: str, keywords: list[str] | None = None) -> dict:
+        return GenerationRequest(
+            mode="write",
+            system_prompt=BLOG_SYSTEM_PROMPT,
+            user_prompt=user_prompt,
+            max_tokens=Config.GPT_MAX_COMPLETION_TOKENS,
+            label=topic,
+        )
+
+    def generate_post(
+        self, topic: str, keywords: list[str] | None = None, force_regenerate: bool = False
+    ) -> dict:
         """주어진 주제로 블로그 글을 생성합니다.
 
         Args:
             topic: 블로그 글 주제
             keywords: SEO 키워드 목록 (선택사항)
+            force_regenerate: True면 생성 캐시를 무시하고 GPT로 새로 생성
 
         Returns:
             {"title": str, "content": str} 형태의 딕셔너리
         """
-        user_prompt = f"주제: {topic}"
-        if keywords:
-            user_prompt += f"\n키워드: {', '.join(keywords)}"
+        request = self.build_request(topic, keywords)
 
         logger.info("GPT API로 글 생성 요청: %s", topic)
+        post = self.engine.generate(request, force_regenerate)
+
+        logger.info("글 생성 완료: %s (%d자)", post["title"], len(post["content"]))
+        return post
 
-        try:
-            response = self.client.chat.completions.create(
-                model=Config.GPT_MODEL,
-                max_completion_tokens=Config.GPT_MAX_COMPLETION_TOKENS,
-                reasoning_effort=Config.GPT_REASONING_EFFORT,
-                messages=[
-                    {"role": "system", "content": BLOG_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-            )
-        except Exception as e:
-            logger.error("GPT API 호출 실패: %s", e)
-            raise RuntimeError(f"GPT API 호출 실패: {e}") from e
-
-        choice = response.choices[0]
-        if choice.finish_reason == "content_filter":
-            raise RuntimeError("GPT 콘텐츠 필터에 의해 응답이 차단되었습니다.")
-        if not choice.message.content:
-            raise RuntimeError("GPT 응답이 비어있습니다. 다시 시도해주세요.")
-
-        title, content = _parse_title_content(choice.message.content)
-
-        logger.info("글 생성 완료: %s (%d자)", title, len(content))
-        return {"title": title, "content": content}
+    def generate_post_stream(
+        self, topic: str, keywords: list[str] | None = None, force_regenerate: bool = False
+    ) -> Iterator[StreamEvent]:
+        """generate_post 의 스트리밍 버전입니다.
+
+        제목이 완성되면 "title", 이후 본문 조각마다 "content" 이벤트를 내보내고,
+        마지막 "done" 이벤트의 post 에 {"title", "content"} 를 담습니다.
+        제목이 먼저 도착해야 하므로 항상 일반 텍스트로 요청합니다
+        (GPT_STRUCTURED_OUTPUT 의 summary·keywords·tags 는 없음).
+        """
+        request = self.build_request(topic, keywords)
+
+        logger.info("GPT API로 글 생성 요청 (스트리밍): %s", topic)
+        for event in self.engine.stream(request, force_regenerate):
+            if event.kind == "done":
+                logger.info("글 생성 완료: %s (%d자)",
+                            event.post["title"], len(event.post["content"]))
+            yield event
@@ -0,0 +1,237 @@
+"""기사 원문 본문 추출
+
+검색 API의 description은 한두 문장으로 잘려 있어 GPT가 사실을 충분히 얻지 못합니다.
+각 기사의 원문 링크를 병렬로 받아 본문을 추출하고, 토큰 예산에 맞게 잘라
+description 대신 사용합니다.
+
+- 전체 동시 요청 수와 언론사(호스트)별 동시 요청 수를 모두 제한합니다.
+- 추출 결과는 URL 기준으로 캐시(cache/fulltext.db)해 같은 기사를 다시 받지 않습니다.
+"""
+
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import CACHE_DIR, Config
+from .context_packer import count_tokens, truncate_to_tokens
+from .response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+_FETCH_TIMEOUT = 8
+# 추출 결과 캐시 유지 시간 (기사 본문은 거의 바뀌지 않으므로 길게)
+_CACHE_TTL = 7 * 24 * 3600
+# 수집·추출 실패 캐시 유지 시간 (일시적 장애일 수 있으므로 짧게)
+_MISS_TTL = 10 * 60
+# 본문 추출 실패로 볼 최소 길이 (자)
+_MIN_BODY_CHARS = 200
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# 본문이 아닌 영역 (내용 전체를 무시)
+_SKIP_TAGS = {
+    "script", "style", "noscript", "iframe", "svg", "form",
+    "header", "footer", "nav", "aside", "button", "select", "figcaption",
+}
+# 텍스트를 모으는 단위가 되는 블록 컨테이너
+_CONTAINER_TAGS = {"div", "article", "section", "main", "td", "body"}
+# 내용이 없는 태그 (닫는 태그가 오지 않음)
+_VOID_TAGS = {
+    "br", "img", "hr", "meta", "link", "input", "source", "wbr", "area", "col", "embed",
+}
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+_host_semaphores: dict[str, threading.Semaphore] = {}
+_host_lock = threading.Lock()
+
+
+class _MainTextParser(HTMLParser):
+    """텍스트를 가장 가까운 블록 컨테이너에 모아, 가장 긴 컨테이너를 본문으로 고릅니다.
+
+    <p>로 나뉜 본문과 <br>로 줄바꿈한 본문(국내 언론사에 흔함)을 모두 처리합니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._stack: list[str] = []
+        self._container_stack: list[int] = []
+        self._skip_depth = 0
+        self.blocks: list[list[str]] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _VOID_TAGS:
+            if tag == "br" and self._container_stack and not self._skip_depth:
+                self.blocks[self._container_stack[-1]].append("\n")
+            return
+        self._stack.append(tag)
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _CONTAINER_TAGS:
+            self.blocks.append([])
+            self._container_stack.append(len(self.blocks) - 1)
+        elif tag in ("p", "h2", "h3", "li") and self._container_stack:
+            self.blocks[self._container_stack[-1]].append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _VOID_TAGS or tag not in self._stack:
+            return
+        # 닫히지 않은 태그가 섞여 있어도 스택을 맞춤
+        while self._stack:
+            open_tag = self._stack.pop()
+            if open_tag in _SKIP_TAGS:
+                self._skip_depth -= 1
+            elif open_tag in _CONTAINER_TAGS and self._container_stack:
+                self._container_stack.pop()
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth or not self._container_stack:
+            return
+        if data.strip():
+            self.blocks[self._container_stack[-1]].append(data)
+
+    def main_text(self) -> str:
+        best = ""
+        for parts in self.blocks:
+            text = "".join(parts)
+            text = re.sub(r"[ \t\r\f\v]+", " ", text)
+            text = "\n".join(line.strip() for line in text.split("\n") if line.strip())
+            if len(text) > len(best):
+                best = text
+        return best
+
+
+def extract_main_text(html_text: str) -> str:
+    """HTML 문서에서 본문으로 보이는 텍스트를 추출합니다."""
+    parser = _MainTextParser()
+    try:
+        parser.feed(html_text)
+        parser.close()
+    except Exception as e:  # 깨진 HTML
+        logger.debug("HTML 파싱 중 오류: %s", e)
+    return parser.main_text()
+
+
+# ── 공유 자원 ────────────────────────────────────────────────────────────
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_size = max(1, Config.FULLTEXT_WORKERS)
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=Config.FULLTEXT_PER_HOST)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = _USER_AGENT
+            _session = session
+        return _session
+
+
+def _get_cache() -> ResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                max_entries=256,
+                ttls={"fulltext-miss": _MISS_TTL},
+                default_ttl=_CACHE_TTL,
+                db_path=CACHE_DIR / "fulltext.db",
+            )
+        return _cache
+
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    host = (urlsplit(url).hostname or "").lower()
+    with _host_lock:
+        sem = _host_semaphores.get(host)
+        if sem is None:
+            sem = threading.Semaphore(max(1, Config.FULLTEXT_PER_HOST))
+            _host_semaphores[host] = sem
+        return sem
+
+
+# ── 본문 수집 ────────────────────────────────────────────────────────────
+
+
+def fetch_article_text(url: str) -> str:
+    """기사 URL의 본문 텍스트를 반환합니다. 실패하면 빈 문자열.
+
+    성공한 결과는 URL 기준으로 7일간, 실패(타임아웃·5xx·본문 추출 실패 등)는 10분간 캐시됩니다.
+    """
+    if not url.startswith(("http://", "https://")):
+        return ""
+
+    cache = _get_cache()
+    cached = cache.get(("fulltext", url))
+    if cached is not None:
+        return cached
+    if cache.get(("fulltext-miss", url)) is not None:
+        return ""
+
+    text = ""
+    with _host_semaphore(url):
+        try:
+            resp = _get_session().get(url, timeout=_FETCH_TIMEOUT)
+            resp.raise_for_status()
+            # 국내 언론사는 EUC-KR 이면서 charset을 명시하지 않는 경우가 있음
+            if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
+                resp.encoding = resp.apparent_encoding
+            text = extract_main_text(resp.text)
+        except Exception as e:
+            logger.debug("원문 수집 실패: %s (%s)", url, e)
+
+    if len(text) < _MIN_BODY_CHARS:
+        cache.set(("fulltext-miss", url), True)
+        return ""
+    cache.set(("fulltext", url), text)
+    return text
+
+
+def fetch_full_texts(articles: list[dict], max_tokens: int | None = None) -> list[dict]:
+    """기사 원문을 병렬로 받아 description을 본문으로 교체한 새 목록을 반환합니다.
+
+    본문 추출에 성공한 기사만 교체하며, 원래 요약은 "snippet" 키에 남깁니다.
+    순서는 입력과 같습니다.
+
+    Args:
+        articles: fetch_news 형식의 기사 목록
+        max_tokens: 기사당 본문 최대 토큰 수 (기본값: Config.FULLTEXT_MAX_TOKENS)
+    """
+    if not articles:
+        return []
+    max_tokens = max_tokens or Config.FULLTEXT_MAX_TOKENS
+
+    workers = max(1, min(Config.FULLTEXT_WORKERS, len(articles)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        bodies = list(pool.map(lambda a: fetch_article_text(a.get("link", "")), articles))
+
+    result = []
+    enriched = 0
+    for article, body in zip(articles, bodies):
+        if body and len(body) > len(article.get("description", "")):
+            body = truncate_to_tokens(body, max_tokens, Config.GPT_MODEL)
+            article = {**article, "snippet": article.get("description", ""), "description": body}
+            enriched += 1
+        result.append(article)
+
+    logger.info(
+        "기사 원문 수집: %d/%d건 본문 확보 (약 %d 토큰)",
+        enriched, len(articles),
+        sum(count_tokens(a["description"], Config.GPT_MODEL) for a in result if "snippet" in a),
+    )
+    return result
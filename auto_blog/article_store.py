@@ -0,0 +1,153 @@
+"""수집한 뉴스 기사 로컬 저장소 (SQLite + FTS5)
+
+검색 API로 받은 기사를 링크 기준으로 누적 저장해 두고,
+이후 실행이나 다른 모드에서 네트워크 없이 주제로 다시 찾을 수 있게 합니다.
+수집 파이프라인 오프라인 벤치마크용 말뭉치로도 사용합니다.
+
+전문 검색 색인에는 news_fetcher와 같은 문자 2-gram 토큰을 넣으므로
+"반도체가" 처럼 조사가 붙은 한국어도 검색됩니다.
+FTS5를 지원하지 않는 SQLite에서는 LIKE 검색으로 대체합니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .tokenizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+_ARTICLE_FIELDS = ("title", "description", "source", "link", "date")
+
+
+class ArticleStore:
+    """링크를 키로 기사를 저장·검색하는 스레드 안전 SQLite 저장소입니다.
+
+    Args:
+        db_path: SQLite 파일 경로 (":memory:" 가능)
+    """
+
+    def __init__(self, db_path: "Path | str"):
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                link        TEXT PRIMARY KEY,
+                title       TEXT NOT NULL,
+                description TEXT,
+                source      TEXT,
+                date        TEXT,
+                query       TEXT,
+                fetched_at  REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date);
+            CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+            """
+        )
+        self.has_fts = self._create_fts()
+        self._db.commit()
+
+    def _create_fts(self) -> bool:
+        try:
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts "
+                "USING fts5(link UNINDEXED, tokens)"
+            )
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning("SQLite FTS5 미지원 → LIKE 검색 사용: %s", e)
+            return False
+
+    # ── 저장 ─────────────────────────────────────────────────────────────
+
+    def upsert(self, articles: list[dict], query: str = "") -> int:
+        """기사를 저장합니다. 같은 링크가 있으면 최신 내용으로 갱신합니다.
+
+        Args:
+            articles: fetch_news 형식의 기사 목록 (link 없는 기사는 건너뜀)
+            query: 이 기사들을 찾은 검색어 (기록용)
+
+        Returns:
+            저장된 기사 수
+        """
+        rows = [a for a in articles if a.get("link") and a.get("title")]
+        if not rows:
+            return 0
+
+        now = time.time()
+        with self._lock:
+            for a in rows:
+                self._db.execute(
+                    "INSERT INTO articles (link, title, description, source, date, query, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(link) DO UPDATE SET "
+                    "title = excluded.title, description = excluded.description, "
+                    "source = excluded.source, date = excluded.date, "
+                    "query = excluded.query, fetched_at = excluded.fetched_at",
+                    (a["link"], a["title"], a.get("description", ""), a.get("source", ""),
+                     a.get("date", ""), query, now),
+                )
+                if self.has_fts:
+                    tokens = " ".join(tokenize(f"{a['title']} {a.get('description', '')}"))
+                    self._db.execute("DELETE FROM articles_fts WHERE link = ?", (a["link"],))
+                    self._db.execute(
+                        "INSERT INTO articles_fts (link, tokens) VALUES (?, ?)",
+                        (a["link"], tokens),
+                    )
+            self._db.commit()
+        return len(rows)
+
+    # ── 검색 ─────────────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 15, since: str | None = None) -> list[dict]:
+        """주제로 저장된 기사를 관련도순으로 검색합니다.
+
+        Args:
+            query: 검색어 (주제·키워드)
+            limit: 최대 반환 수
+            since: 이 날짜("YYYY-MM-DD") 이후 기사만
+
+        Returns:
+            [{"title", "description", "source", "link", "date"}] 형태의 리스트
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+
+        date_clause = " AND a.date >= ?" if since else ""
+        date_args = [since] if since else []
+
+        with self._lock:
+            if self.has_fts:
+                match = " OR ".join('"' + t.replace('"', '""') + '"' for t in terms)
+                rows = self._db.execute(
+                    "SELECT a.* FROM articles_fts f JOIN articles a ON a.link = f.link "
+                    f"WHERE articles_fts MATCH ?{date_clause} "
+                    "ORDER BY bm25(articles_fts), a.date DESC LIMIT ?",
+                    [match, *date_args, limit],
+                ).fetchall()
+            else:
+                like = " OR ".join("(a.title LIKE ? OR a.description LIKE ?)" for _ in terms)
+                args = [arg for t in terms for arg in (f"%{t}%", f"%{t}%")]
+                rows = self._db.execute(
+                    f"SELECT a.* FROM articles a WHERE ({like}){date_clause} "
+                    "ORDER BY a.date DESC LIMIT ?",
+                    [*args, *date_args, limit],
+                ).fetchall()
+
+        return [{k: row[k] for k in _ARTICLE_FIELDS} for row in rows]
+
+    def count(self) -> int:
+        """저장된 기사 수를 반환합니다."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,378 @@
+"""예약 발행용 배치 글 생성
+
+스케줄러가 발행 시각마다 글을 동기로 생성하면 정가의 토큰 비용과 생성 시간을
+발행 시점에 그대로 치릅니다. 주제 목록 전체를 OpenAI Batch API 작업 하나로 미리 제출하고
+(비동기, 토큰 단가 할인), 완료되면 결과를 saved_posts/ 에 저장해 두었다가
+발행 시각에는 저장된 글을 올리기만 합니다.
+
+작업 상태는 saved_posts/batch/<이름>.json (매니페스트)에 기록되므로
+프로그램을 다시 실행해도 같은 작업을 이어서 확인합니다.
+
+백엔드:
+    openai  OpenAI Batch API (입력 JSONL 업로드 → 배치 생성 → 결과 파일 다운로드)
+    local   같은 JSONL 형식을 Chat Completions 로 바로 처리 (오프라인 테스트, 호환 서버용)
+"""
+
+import json
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from openai import OpenAI
+
+from . import telemetry
+from .config import CACHE_DIR, Config
+from .html_renderer import render_html
+from .openai_client import get_client
+from .post_saver import SAVE_DIR, save_post
+from .resilience import call_with_retry, default_policy
+from .writer_engine import (
+    GenerationEngine,
+    estimate_tokens,
+    get_engine,
+    get_gpt_limiter,
+    limited_create,
+    parse_post,
+    sdk_kwargs,
+    settle_lease,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_DIR = SAVE_DIR / "batch"
+
+# 더 이상 바뀌지 않는 배치 상태
+FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class OpenAIBatchBackend:
+    """OpenAI Batch API 백엔드 (24시간 완료 창)."""
+
+    name = "openai"
+
+    def __init__(self, client: OpenAI | None = None):
+        self._client = client
+
+    @property
+    def client(self) -> OpenAI:
+        return self._client or get_client()
+
+    def submit(self, lines: list[dict]) -> str:
+        """입력 줄을 JSONL 파일로 올리고 배치를 만들어 배치 ID를 반환합니다."""
+        payload = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+        input_file = self._call(lambda: self.client.files.create(
+            file=("auto_blog_batch.jsonl", payload.encode("utf-8")),
+            purpose="batch",
+        ))
+        batch = self._call(lambda: self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        ))
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        return self._call(lambda: self.client.batches.retrieve(batch_id)).status
+
+    def results(self, batch_id: str) -> str:
+        """결과 JSONL 전체(성공 + 오류 파일)를 반환합니다."""
+        batch = self._call(lambda: self.client.batches.retrieve(batch_id))
+        parts = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                parts.append(self._call(lambda: self.client.files.content(file_id)).text)
+        return "\n".join(parts)
+
+    @staticmethod
+    def _call(fn):
+        return call_with_retry(fn, endpoint="openai:batch", policy=default_policy())
+
+
+class LocalBatchBackend:
+    """Batch API 대신 같은 입력을 Chat Completions 로 바로 처리하는 백엔드.
+
+    결과는 Batch API 결과 파일과 같은 형식으로 cache/batches/ 에 저장되므로
+    매니페스트·결과 처리 과정을 오프라인(주입한 클라이언트, OPENAI_BASE_URL 테스트 서버)에서 그대로 확인할 수 있습니다.
+    """
+
+    name = "local"
+
+    def __init__(self, client: OpenAI | None = None, workers: int = 4):
+        self._client = client
+        self._workers = max(1, workers)
+        self._dir = CACHE_DIR / "batches"
+
+    @property
+    def client(self) -> OpenAI:
+        return self._client or get_client()
+
+    def submit(self, lines: list[dict]) -> str:
+        batch_id = f"local-{uuid.uuid4().hex[:12]}"
+        with ThreadPoolExecutor(max_workers=min(self._workers, len(lines) or 1)) as pool:
+            outputs = list(pool.map(self._run, lines))
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._path(batch_id).write_text(
+            "".join(json.dumps(o, ensure_ascii=False) + "\n" for o in outputs),
+            encoding="utf-8",
+        )
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        return "completed" if self._path(batch_id).exists() else "failed"
+
+    def results(self, batch_id: str) -> str:
+        return self._path(batch_id).read_text(encoding="utf-8")
+
+    def _path(self, batch_id: str) -> Path:
+        return self._dir / f"{batch_id}.jsonl"
+
+    def _run(self, line: dict) -> dict:
+        body = line["body"]
+        # 다른 글쓰기 호출과 같은 동시 호출·분당 토큰 한도를 공유
+        with get_gpt_limiter().lease(estimate_tokens(body)) as lease:
+            try:
+                response = call_with_retry(
+                    lambda: limited_create(self.client, sdk_kwargs(body)),
+                    endpoint=f"openai:{body['model']}",
+                    policy=default_policy(Config.GPT_DEADLINE_SECONDS),
+                )
+            except Exception as e:
+                return {"custom_id": line["custom_id"], "response": None,
+                        "error": {"message": str(e)}}
+            settle_lease(lease, getattr(response, "usage", None))
+        choice = response.choices[0]
+        usage = getattr(response, "usage", None)
+        return {
+            "custom_id": line["custom_id"],
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{
+                    "finish_reason": choice.finish_reason,
+                    "message": {"content": choice.message.content},
+                }], "usage": usage.model_dump() if hasattr(usage, "model_dump") else None},
+            },
+            "error": None,
+        }
+
+
+def get_backend(name: str | None = None):
+    """BATCH_BACKEND 설정에 맞는 배치 백엔드를 만듭니다."""
+    name = (name or Config.BATCH_BACKEND).lower()
+    if name == "local":
+        # 실제 동시 호출 수는 공유 제한기가 계정 한도에 맞춰 조절
+        return LocalBatchBackend(workers=Config.GPT_MAX_CONCURRENCY)
+    if name == "openai":
+        return OpenAIBatchBackend()
+    raise RuntimeError(f"알 수 없는 배치 백엔드입니다: {name} (openai 또는 local)")
+
+
+class BatchGenerator:
+    """주제 목록을 배치 작업으로 제출하고, 완료된 결과를 글 파일로 저장합니다."""
+
+    def __init__(self, mode: str, backend=None, engine: GenerationEngine | None = None):
+        """
+        Args:
+            mode: 글쓰기 모드 ("write" | "issue" | "opinion")
+            backend: 배치 백엔드 (기본값: BATCH_BACKEND 설정)
+            engine: 요청 본문 구성·응답 파싱에 쓰는 생성 엔진
+        """
+        self.mode = mode
+        self.backend = backend or get_backend()
+        self.engine = engine or get_engine()
+
+    # ── 제출 ─────────────────────────────────────────────────────────────
+
+    def load_or_submit(self, items: list[dict], name: str) -> dict:
+        """같은 주제 목록으로 제출한 작업이 있으면 이어서 쓰고, 없으면 새로 제출합니다."""
+        manifest = load_manifest(name)
+        if (
+            manifest is not None
+            and manifest["mode"] == self.mode
+            and manifest["backend"] == self.backend.name
+            and [i["topic"] for i in manifest["items"]] == [i["topic"] for i in items]
+            and manifest["status"] not in FINAL_STATUSES - {"completed"}
+        ):
+            logger.info("기존 배치 작업 사용: %s (%s)", manifest["batch_id"], manifest["status"])
+            return manifest
+        return self.submit(items, name)
+
+    def submit(self, items: list[dict], name: str) -> dict:
+        """모든 주제의 생성 요청을 배치 하나로 제출하고 매니페스트를 저장합니다.
+
+        이슈 모드는 제출 시점에 뉴스 자료를 수집해 프롬프트에 넣습니다.
+
+        Args:
+            items: {"topic", "thoughts"(opinion), "keywords"(선택)} 목록
+            name: 매니페스트 이름 (saved_posts/batch/<name>.json)
+        """
+        writer = _make_writer(self.mode, self.engine)
+        model = self.engine.router.primary(self.mode)
+        lines, entries = [], []
+        for index, item in enumerate(items):
+            if self.mode == "opinion":
+                request = writer.build_request(item["topic"], item["thoughts"], item.get("keywords"))
+            else:
+                request = writer.build_request(item["topic"], item.get("keywords"))
+            request = self.engine.prepare(request, model)
+            custom_id = f"{name}-{index}"
+            lines.append({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self.engine.request_body(request, model),
+            })
+            entries.append({
+                **item,
+                "custom_id": custom_id,
+                "structured": request.response_format is not None,
+                "file": None,
+                "error": None,
+            })
+
+        logger.info("배치 제출: %d개 주제 (%s, 백엔드: %s)", len(lines), self.mode, self.backend.name)
+        batch_id = self.backend.submit(lines)
+        manifest = {
+            "name": name,
+            "mode": self.mode,
+            "backend": self.backend.name,
+            "batch_id": batch_id,
+            "model": model,
+            "status": "submitted",
+            "submitted_at": datetime.now().isoformat(timespec="seconds"),
+            "items": entries,
+        }
+        save_manifest(manifest)
+        return self.refresh(manifest)
+
+    # ── 상태 확인 / 결과 저장 ──────────────────────────────────────────────
+
+    def refresh(self, manifest: dict) -> dict:
+        """배치 상태를 확인하고, 완료됐으면 결과를 글 파일로 저장합니다."""
+        if manifest["status"] in FINAL_STATUSES:
+            return manifest
+        status = self.backend.status(manifest["batch_id"])
+        if status == "completed":
+            self._collect(manifest)
+        manifest["status"] = status
+        save_manifest(manifest)
+        logger.info("배치 상태: %s (%s)", manifest["batch_id"], status)
+        return manifest
+
+    def wait(self, manifest: dict, poll_seconds: float | None = None) -> dict:
+        """배치가 끝날 때까지 주기적으로 상태를 확인합니다."""
+        interval = max(1.0, poll_seconds if poll_seconds is not None else Config.BATCH_POLL_SECONDS)
+        manifest = self.refresh(manifest)
+        while manifest["status"] not in FINAL_STATUSES:
+            time.sleep(interval)
+            manifest = self.refresh(manifest)
+        return manifest
+
+    def _collect(self, manifest: dict) -> None:
+        outputs = {}
+        for line in self.backend.results(manifest["batch_id"]).splitlines():
+            if line.strip():
+                record = json.loads(line)
+                outputs[record["custom_id"]] = record
+
+        saved = 0
+        for entry in manifest["items"]:
+            if entry["file"]:
+                continue
+            record = outputs.get(entry["custom_id"])
+            text, error = _output_text(record)
+            self._emit(manifest, entry, record, error)
+            if error:
+                entry["error"] = error
+                logger.warning("배치 결과 오류 [%s]: %s", entry["topic"], error)
+                continue
+            post = parse_post(text, entry["structured"])
+            # 범용 글은 스타일을 변환하지 않음
+            if self.mode in ("issue", "opinion"):
+                post["content"] = render_html(post["content"], self.mode)
+            entry["file"] = str(save_post(post["title"], post["content"]))
+            entry["error"] = None
+            saved += 1
+        logger.info("배치 결과 저장: %d/%d개", saved, len(manifest["items"]))
+
+    def _emit(self, manifest: dict, entry: dict, record: dict | None, error: str | None) -> None:
+        """배치 결과 한 건을 호출 기록으로 남깁니다 (Batch API는 할인 단가)."""
+        if not Config.TELEMETRY_ENABLED:
+            return
+        body = ((record or {}).get("response") or {}).get("body") or {}
+        choice = (body.get("choices") or [{}])[0]
+        tokens = telemetry.usage_tokens(body.get("usage"))
+        discounted = manifest["backend"] == OpenAIBatchBackend.name
+        telemetry.record(telemetry.GenerationRecord(
+            mode=manifest["mode"],
+            model=manifest["model"],
+            label=entry["topic"],
+            ok=error is None,
+            error=error or "",
+            finish_reason=choice.get("finish_reason") or "",
+            batch=True,
+            prompt_tokens=tokens[0],
+            cached_tokens=tokens[1],
+            completion_tokens=tokens[2],
+            reasoning_tokens=tokens[3],
+            cost=telemetry.estimate_cost(
+                manifest["model"], tokens[0], tokens[1], tokens[2], batch=discounted
+            ),
+        ))
+
+
+def _output_text(record: dict | None) -> tuple[str, str | None]:
+    """Batch 결과 한 줄에서 (응답 텍스트, 오류 메시지)를 꺼냅니다."""
+    if record is None:
+        return "", "결과에 없음"
+    if record.get("error"):
+        return "", str(record["error"].get("message") or record["error"])
+    response = record.get("response") or {}
+    if response.get("status_code") != 200:
+        return "", f"HTTP {response.get('status_code')}"
+    choice = (response.get("body", {}).get("choices") or [{}])[0]
+    if choice.get("finish_reason") == "content_filter":
+        return "", "콘텐츠 필터에 의해 차단됨"
+    text = (choice.get("message") or {}).get("content") or ""
+    if not text:
+        return "", "빈 응답"
+    return text, None
+
+
+def _make_writer(mode: str, engine: GenerationEngine):
+    from .ai_writer import AIWriter
+    from .issue_writer import IssueWriter
+    from .opinion_writer import OpinionWriter
+
+    return {"issue": IssueWriter, "opinion": OpinionWriter}.get(mode, AIWriter)(engine=engine)
+
+
+# ── 매니페스트 ───────────────────────────────────────────────────────────
+
+
+def manifest_name(topics_file: str, mode: str) -> str:
+    """주제 파일·모드별 매니페스트 이름."""
+    return f"{Path(topics_file).stem}-{mode}"
+
+
+def load_manifest(name: str) -> dict | None:
+    path = BATCH_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("배치 매니페스트를 읽을 수 없습니다: %s (%s)", path, e)
+        return None
+
+
+def save_manifest(manifest: dict) -> Path:
+    path = BATCH_DIR / f"{manifest['name']}.json"
+    try:
+        BATCH_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    except OSError as e:
+        raise RuntimeError(f"배치 매니페스트 저장 실패: {path}\n원인: {e}") from e
+    return path
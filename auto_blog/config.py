@@ -1,9 +1,27 @@
 import os
+import sys
+from pathlib import Path
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+def _get_app_dir() -> Path:
+    """실행 방식(.exe / 일반 실행)에 관계없이 앱 루트 디렉토리를 반환합니다."""
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).parent
+    return Path(__file__).resolve().parent.parent
+
+
+APP_DIR = _get_app_dir()
+# 검색 캐시 등 로컬 데이터 저장 폴더
+CACHE_DIR = APP_DIR / "cache"
+
+# 작업별 p95 응답 시간 한도 기본값 (초)
+_DEFAULT_P95_LIMITS = "trend=30,outline=30,section=90,write=180,issue=240,opinion=180"
+
+
 def _safe_int(value: str, default: int) -> int:
     """환경변수 문자열을 int로 안전하게 변환합니다."""
     try:
@@ -12,6 +30,21 @@ def _safe_int(value: str, default: int) -> int:
         return default
 
 
+def _safe_float(value: str, default: float) -> float:
+    """환경변수 문자열을 float로 안전하게 변환합니다."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_bool(value: str, default: bool) -> bool:
+    """환경변수 문자열을 bool로 변환합니다 ("1", "true", "yes", "on" → True)."""
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 class Config:
     """환경 변수에서 설정을 로드합니다."""
 
@@ -27,6 +60,84 @@ class Config:
         os.getenv("GPT_MAX_COMPLETION_TOKENS", ""), 4096
     )
     GPT_REASONING_EFFORT: str = os.getenv("GPT_REASONING_EFFORT", "medium")
+    # 작업별 모델: 짧은 작업(GPT_FAST_MODES)은 빠른 모델, 실패 시 GPT_FALLBACK_MODELS 순서로 대체
+    GPT_FAST_MODEL: str = os.getenv("GPT_FAST_MODEL", "gpt-4.1-mini")
+    GPT_FAST_MODES: str = os.getenv("GPT_FAST_MODES", "trend,outline")
+    GPT_FALLBACK_MODELS: str = os.getenv("GPT_FALLBACK_MODELS", "")
+    # 작업별 p95 응답 시간 한도(초). 넘은 모델은 대체 모델 뒤로 밀림
+    GPT_P95_LIMITS: str = os.getenv("GPT_P95_LIMITS", _DEFAULT_P95_LIMITS)
+    # 글 생성 시 JSON 스키마 구조화 출력 사용 (미지원 서버면 false)
+    GPT_STRUCTURED_OUTPUT: bool = _safe_bool(os.getenv("GPT_STRUCTURED_OUTPUT", ""), True)
+
+    # OpenAI 연결 (공유 클라이언트). BASE_URL 미지정 시 공식 API 사용
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")
+    OPENAI_POOL_SIZE: int = _safe_int(os.getenv("OPENAI_POOL_SIZE", ""), 10)
+    OPENAI_CONNECT_TIMEOUT: float = _safe_float(os.getenv("OPENAI_CONNECT_TIMEOUT", ""), 10.0)
+    OPENAI_READ_TIMEOUT: float = _safe_float(os.getenv("OPENAI_READ_TIMEOUT", ""), 300.0)
+    OPENAI_HTTP2: bool = _safe_bool(os.getenv("OPENAI_HTTP2", ""), True)
+    # GPT 동시 호출 상한 (429·지연에 따라 이 안에서 자동 조절), 분당 토큰 예산 (0 = 제한 없음)
+    GPT_MAX_CONCURRENCY: int = _safe_int(os.getenv("GPT_MAX_CONCURRENCY", ""), 8)
+    GPT_TOKENS_PER_MINUTE: int = _safe_int(os.getenv("GPT_TOKENS_PER_MINUTE", ""), 0)
+
+    # 네이버 검색 API HTTP 연결 풀 크기 (동시 검색 수에 맞춰 조정)
+    NAVER_HTTP_POOL_SIZE: int = _safe_int(os.getenv("NAVER_HTTP_POOL_SIZE", ""), 10)
+
+    # 검색 결과 캐시 (TTL 단위: 초)
+    SEARCH_CACHE_ENABLED: bool = _safe_bool(os.getenv("SEARCH_CACHE_ENABLED", ""), True)
+    SEARCH_CACHE_MAX_ENTRIES: int = _safe_int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", ""), 512)
+    SEARCH_CACHE_NEWS_TTL: int = _safe_int(os.getenv("SEARCH_CACHE_NEWS_TTL", ""), 600)
+    SEARCH_CACHE_BLOG_TTL: int = _safe_int(os.getenv("SEARCH_CACHE_BLOG_TTL", ""), 3600)
+    SEARCH_CACHE_PERSIST: bool = _safe_bool(os.getenv("SEARCH_CACHE_PERSIST", ""), False)
+
+    # 네이버 검색 API 호출 속도 / 일일 한도
+    NAVER_RATE_PER_SEC: int = _safe_int(os.getenv("NAVER_RATE_PER_SEC", ""), 10)
+    NAVER_RATE_BURST: int = _safe_int(os.getenv("NAVER_RATE_BURST", ""), 10)
+    NAVER_DAILY_QUOTA: int = _safe_int(os.getenv("NAVER_DAILY_QUOTA", ""), 25000)
+
+    # 추가 언론사 도메인 매핑 JSON 파일 (미지정 시 앱 폴더의 news_sources.json)
+    NEWS_SOURCES_FILE: str = os.getenv("NEWS_SOURCES_FILE", "")
+
+    # 프롬프트에 넣을 뉴스/블로그 자료 토큰 예산
+    NEWS_CONTEXT_TOKEN_BUDGET: int = _safe_int(os.getenv("NEWS_CONTEXT_TOKEN_BUDGET", ""), 3000)
+    BLOG_CONTEXT_TOKEN_BUDGET: int = _safe_int(os.getenv("BLOG_CONTEXT_TOKEN_BUDGET", ""), 800)
+    # 관련도(BM25) 상위 몇 건의 기사만 프롬프트 후보로 남길지
+    NEWS_TOP_K: int = _safe_int(os.getenv("NEWS_TOP_K", ""), 12)
+
+    # 수집한 기사를 cache/articles.db 에 누적 저장 (오프라인 검색·벤치마크용)
+    ARTICLE_STORE_ENABLED: bool = _safe_bool(os.getenv("ARTICLE_STORE_ENABLED", ""), True)
+    # 실시간 뉴스를 하나도 받지 못했을 때 저장된 기사 중 최근 며칠 것으로 대신 작성 (0 = 사용 안 함)
+    NEWS_STORE_FALLBACK_DAYS: int = _safe_int(os.getenv("NEWS_STORE_FALLBACK_DAYS", ""), 0)
+
+    # 기사 원문 본문 수집 (이슈 정리글)
+    FULLTEXT_ENABLED: bool = _safe_bool(os.getenv("FULLTEXT_ENABLED", ""), False)
+    FULLTEXT_WORKERS: int = _safe_int(os.getenv("FULLTEXT_WORKERS", ""), 8)
+    FULLTEXT_PER_HOST: int = _safe_int(os.getenv("FULLTEXT_PER_HOST", ""), 2)
+    FULLTEXT_MAX_TOKENS: int = _safe_int(os.getenv("FULLTEXT_MAX_TOKENS", ""), 400)
+
+    # 외부 호출 재시도 / 서킷 브레이커
+    RETRY_MAX_ATTEMPTS: int = _safe_int(os.getenv("RETRY_MAX_ATTEMPTS", ""), 3)
+    RETRY_BASE_DELAY: float = _safe_float(os.getenv("RETRY_BASE_DELAY", ""), 1.0)
+    CIRCUIT_FAILURE_THRESHOLD: int = _safe_int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", ""), 5)
+    CIRCUIT_RESET_SECONDS: int = _safe_int(os.getenv("CIRCUIT_RESET_SECONDS", ""), 60)
+    # GPT 호출 1건의 재시도 포함 전체 제한 시간 (초)
+    GPT_DEADLINE_SECONDS: int = _safe_int(os.getenv("GPT_DEADLINE_SECONDS", ""), 600)
+
+    # 이슈 정리글 개요 → 섹션 병렬 생성 모드 (동시 생성 섹션 수)
+    ISSUE_PARALLEL_SECTIONS: bool = _safe_bool(os.getenv("ISSUE_PARALLEL_SECTIONS", ""), False)
+    ISSUE_SECTION_WORKERS: int = _safe_int(os.getenv("ISSUE_SECTION_WORKERS", ""), 4)
+
+    # 예약 발행 배치 생성 (openai: Batch API | local: 즉시 처리), 상태 확인 주기(초)
+    BATCH_BACKEND: str = os.getenv("BATCH_BACKEND", "openai")
+    BATCH_POLL_SECONDS: int = _safe_int(os.getenv("BATCH_POLL_SECONDS", ""), 300)
+
+    # GPT 호출 기록 (토큰·지연 시간·비용, cache/telemetry.db)
+    TELEMETRY_ENABLED: bool = _safe_bool(os.getenv("TELEMETRY_ENABLED", ""), True)
+
+    # GPT 생성 결과 캐시 (cache/generations.db, 같은 모델·프롬프트면 재사용)
+    GENERATION_CACHE_ENABLED: bool = _safe_bool(os.getenv("GENERATION_CACHE_ENABLED", ""), True)
+    # 유지 시간 (초, 0 이하이면 만료 없음)
+    GENERATION_CACHE_TTL: int = _safe_int(os.getenv("GENERATION_CACHE_TTL", ""), 7 * 24 * 3600)
+    GENERATION_CACHE_MAX_ENTRIES: int = _safe_int(os.getenv("GENERATION_CACHE_MAX_ENTRIES", ""), 200)
 
     @classmethod
     def validate(cls) -> list[str]:
@@ -53,3 +164,47 @@ class Config:
             os.getenv("GPT_MAX_COMPLETION_TOKENS", ""), 4096
         )
         cls.GPT_REASONING_EFFORT = os.getenv("GPT_REASONING_EFFORT", "medium")
+        cls.GPT_FAST_MODEL = os.getenv("GPT_FAST_MODEL", "gpt-4.1-mini")
+        cls.GPT_FAST_MODES = os.getenv("GPT_FAST_MODES", "trend,outline")
+        cls.GPT_FALLBACK_MODELS = os.getenv("GPT_FALLBACK_MODELS", "")
+        cls.GPT_P95_LIMITS = os.getenv("GPT_P95_LIMITS", _DEFAULT_P95_LIMITS)
+        cls.GPT_STRUCTURED_OUTPUT = _safe_bool(os.getenv("GPT_STRUCTURED_OUTPUT", ""), True)
+        cls.OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "")
+        cls.OPENAI_POOL_SIZE = _safe_int(os.getenv("OPENAI_POOL_SIZE", ""), 10)
+        cls.OPENAI_CONNECT_TIMEOUT = _safe_float(os.getenv("OPENAI_CONNECT_TIMEOUT", ""), 10.0)
+        cls.OPENAI_READ_TIMEOUT = _safe_float(os.getenv("OPENAI_READ_TIMEOUT", ""), 300.0)
+        cls.OPENAI_HTTP2 = _safe_bool(os.getenv("OPENAI_HTTP2", ""), True)
+        cls.GPT_MAX_CONCURRENCY = _safe_int(os.getenv("GPT_MAX_CONCURRENCY", ""), 8)
+        cls.GPT_TOKENS_PER_MINUTE = _safe_int(os.getenv("GPT_TOKENS_PER_MINUTE", ""), 0)
+        cls.NAVER_HTTP_POOL_SIZE = _safe_int(os.getenv("NAVER_HTTP_POOL_SIZE", ""), 10)
+        cls.SEARCH_CACHE_ENABLED = _safe_bool(os.getenv("SEARCH_CACHE_ENABLED", ""), True)
+        cls.SEARCH_CACHE_MAX_ENTRIES = _safe_int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", ""), 512)
+        cls.SEARCH_CACHE_NEWS_TTL = _safe_int(os.getenv("SEARCH_CACHE_NEWS_TTL", ""), 600)
+        cls.SEARCH_CACHE_BLOG_TTL = _safe_int(os.getenv("SEARCH_CACHE_BLOG_TTL", ""), 3600)
+        cls.SEARCH_CACHE_PERSIST = _safe_bool(os.getenv("SEARCH_CACHE_PERSIST", ""), False)
+        cls.NAVER_RATE_PER_SEC = _safe_int(os.getenv("NAVER_RATE_PER_SEC", ""), 10)
+        cls.NAVER_RATE_BURST = _safe_int(os.getenv("NAVER_RATE_BURST", ""), 10)
+        cls.NAVER_DAILY_QUOTA = _safe_int(os.getenv("NAVER_DAILY_QUOTA", ""), 25000)
+        cls.NEWS_SOURCES_FILE = os.getenv("NEWS_SOURCES_FILE", "")
+        cls.NEWS_CONTEXT_TOKEN_BUDGET = _safe_int(os.getenv("NEWS_CONTEXT_TOKEN_BUDGET", ""), 3000)
+        cls.BLOG_CONTEXT_TOKEN_BUDGET = _safe_int(os.getenv("BLOG_CONTEXT_TOKEN_BUDGET", ""), 800)
+        cls.NEWS_TOP_K = _safe_int(os.getenv("NEWS_TOP_K", ""), 12)
+        cls.ARTICLE_STORE_ENABLED = _safe_bool(os.getenv("ARTICLE_STORE_ENABLED", ""), True)
+        cls.NEWS_STORE_FALLBACK_DAYS = _safe_int(os.getenv("NEWS_STORE_FALLBACK_DAYS", ""), 0)
+        cls.FULLTEXT_ENABLED = _safe_bool(os.getenv("FULLTEXT_ENABLED", ""), False)
+        cls.FULLTEXT_WORKERS = _safe_int(os.getenv("FULLTEXT_WORKERS", ""), 8)
+        cls.FULLTEXT_PER_HOST = _safe_int(os.getenv("FULLTEXT_PER_HOST", ""), 2)
+        cls.FULLTEXT_MAX_TOKENS = _safe_int(os.getenv("FULLTEXT_MAX_TOKENS", ""), 400)
+        cls.RETRY_MAX_ATTEMPTS = _safe_int(os.getenv("RETRY_MAX_ATTEMPTS", ""), 3)
+        cls.RETRY_BASE_DELAY = _safe_float(os.getenv("RETRY_BASE_DELAY", ""), 1.0)
+        cls.CIRCUIT_FAILURE_THRESHOLD = _safe_int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", ""), 5)
+        cls.CIRCUIT_RESET_SECONDS = _safe_int(os.getenv("CIRCUIT_RESET_SECONDS", ""), 60)
+        cls.GPT_DEADLINE_SECONDS = _safe_int(os.getenv("GPT_DEADLINE_SECONDS", ""), 600)
+        cls.ISSUE_PARALLEL_SECTIONS = _safe_bool(os.getenv("ISSUE_PARALLEL_SECTIONS", ""), False)
+        cls.ISSUE_SECTION_WORKERS = _safe_int(os.getenv("ISSUE_SECTION_WORKERS", ""), 4)
+        cls.BATCH_BACKEND = os.getenv("BATCH_BACKEND", "openai")
+        cls.BATCH_POLL_SECONDS = _safe_int(os.getenv("BATCH_POLL_SECONDS", ""), 300)
+        cls.TELEMETRY_ENABLED = _safe_bool(os.getenv("TELEMETRY_ENABLED", ""), True)
+        cls.GENERATION_CACHE_ENABLED = _safe_bool(os.getenv("GENERATION_CACHE_ENABLED", ""), True)
+        cls.GENERATION_CACHE_TTL = _safe_int(os.getenv("GENERATION_CACHE_TTL", ""), 7 * 24 * 3600)
+        cls.GENERATION_CACHE_MAX_ENTRIES = _safe_int(os.getenv("GENERATION_CACHE_MAX_ENTRIES", ""), 200)
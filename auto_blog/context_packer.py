@@ -0,0 +1,192 @@
+"""토큰 예산 기반 프롬프트 컨텍스트 구성
+
+수집한 기사·블로그 글을 모두 이어 붙이면 프롬프트 길이(= 지연 시간, 비용)가
+수집 건수에 따라 끝없이 늘어납니다. 관련도·최신순으로 정렬한 뒤
+정해진 토큰 예산 안에서만 채우고, 넘치는 항목은 설명을 잘라 맞춥니다.
+
+토큰 수는 tiktoken이 설치되어 있으면 모델 토크나이저로 정확히 세고,
+없거나 인코딩 파일을 받을 수 없으면 문자 수 기반 추정치를 사용합니다.
+"""
+
+import functools
+import logging
+import math
+import re
+from collections.abc import Callable
+from datetime import date
+from typing import NamedTuple
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# 최신성 점수 반감기 (일)
+_RECENCY_HALF_LIFE_DAYS = 3
+# 정렬 점수 = 관련도 × (1 - w) + 최신성 × w
+_RECENCY_WEIGHT = 0.3
+# 설명을 자를 때 최소한 남길 토큰 수 (이보다 적게 남으면 항목을 넣지 않음)
+_MIN_TRIMMED_TOKENS = 30
+
+
+class PackedContext(NamedTuple):
+    """pack_items 결과."""
+
+    text: str
+    tokens: int
+    included: int
+    total: int
+    trimmed: int
+
+
+# ── 토큰 계산 ────────────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """모델에 맞는 tiktoken 인코딩을 반환합니다. 사용할 수 없으면 None."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:  # 인코딩 파일 다운로드 실패 등
+        logger.debug("tiktoken 인코딩 로드 실패 → 추정치 사용: %s", e)
+        return None
+
+
+def count_tokens(text: str, model: str = "") -> int:
+    """텍스트의 토큰 수를 셉니다 (tiktoken이 없으면 추정치)."""
+    if not text:
+        return 0
+    enc = _get_encoding(model)
+    if enc is not None:
+        return len(enc.encode(text))
+    # 추정: 한글 등 비 ASCII 문자는 약 0.8토큰, ASCII는 4자당 1토큰
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return math.ceil(non_ascii * 0.8 + (len(text) - non_ascii) / 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "") -> str:
+    """텍스트를 max_tokens 이하로 잘라 "…"를 붙여 반환합니다."""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    enc = _get_encoding(model)
+    if enc is not None:
+        return enc.decode(enc.encode(text)[: max_tokens - 1]).rstrip() + "…"
+
+    # 추정치 기반 이진 탐색
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(text[:mid], model) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + "…"
+
+
+# ── 정렬 ─────────────────────────────────────────────────────────────────
+
+
+def _parse_item_date(value: str) -> date | None:
+    """"YYYY-MM-DD" 또는 "YYYYMMDD"(블로그 postdate) 형식을 date로 변환합니다."""
+    digits = re.sub(r"\D", "", value or "")
+    if len(digits) < 8:
+        return None
+    try:
+        return date(int(digits[:4]), int(digits[4:6]), int(digits[6:8]))
+    except ValueError:
+        return None
+
+
+def recency_scores(items: list[dict], today: date | None = None) -> list[float]:
+    """항목별 최신성 점수(0~1, 반감기 _RECENCY_HALF_LIFE_DAYS일)를 계산합니다."""
+    today = today or date.today()
+    scores = []
+    for item in items:
+        d = _parse_item_date(item.get("date", ""))
+        if d is None:
+            scores.append(0.0)
+        else:
+            age = max(0, (today - d).days)
+            scores.append(0.5 ** (age / _RECENCY_HALF_LIFE_DAYS))
+    return scores
+
+
+def rank_items(items: list[dict], relevance: list[float]) -> list[dict]:
+    """관련도와 최신성을 합산한 점수 내림차순으로 정렬합니다 (동점 시 원래 순서)."""
+    if not items:
+        return []
+    top = max(relevance) or 1.0
+    recency = recency_scores(items)
+    combined = [
+        (r / top) * (1 - _RECENCY_WEIGHT) + rec * _RECENCY_WEIGHT
+        for r, rec in zip(relevance, recency)
+    ]
+    order = sorted(range(len(items)), key=lambda i: -combined[i])
+    return [items[i] for i in order]
+
+
+# ── 예산 채우기 ──────────────────────────────────────────────────────────
+
+
+def pack_items(
+    items: list[dict],
+    render: Callable[[int, dict], str],
+    header: Callable[[int], str],
+    token_budget: int,
+    trim_field: str = "description",
+    model: str = "",
+) -> PackedContext:
+    """정렬된 항목을 토큰 예산 안에서 순서대로 채워 하나의 텍스트로 만듭니다.
+
+    예산을 넘는 항목은 trim_field 를 잘라 남은 예산에 맞추고, 그래도 안 맞으면 멈춥니다.
+
+    Args:
+        items: 우선순위 순으로 정렬된 항목
+        render: (번호, 항목) → 항목 텍스트
+        header: 포함 건수 → 머리말 텍스트
+        token_budget: 최대 토큰 수
+        trim_field: 예산 초과 시 잘라낼 필드
+        model: 토큰 계산에 사용할 모델명
+    """
+    if not items:
+        return PackedContext("", 0, 0, 0, 0)
+
+    # 머리말은 건수에 따라 길이가 거의 같으므로 전체 건수 기준으로 미리 예약
+    used = count_tokens(header(len(items)), model)
+    entries: list[str] = []
+    trimmed = 0
+
+    for item in items:
+        entry = render(len(entries) + 1, item)
+        cost = count_tokens("\n" + entry, model)
+        if used + cost <= token_budget:
+            entries.append(entry)
+            used += cost
+            continue
+
+        field = item.get(trim_field, "")
+        base_cost = count_tokens("\n" + render(len(entries) + 1, {**item, trim_field: ""}), model)
+        room = token_budget - used - base_cost
+        if field and room >= _MIN_TRIMMED_TOKENS:
+            short = truncate_to_tokens(field, room, model)
+            entry = render(len(entries) + 1, {**item, trim_field: short})
+            entries.append(entry)
+            used += count_tokens("\n" + entry, model)
+            trimmed += 1
+        break
+
+    if not entries:
+        return PackedContext("", 0, 0, len(items), 0)
+
+    text = "\n".join([header(len(entries))] + entries)
+    return PackedContext(text, count_tokens(text, model), len(entries), len(items), trimmed)
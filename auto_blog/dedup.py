@@ -0,0 +1,115 @@
+"""유사 기사 묶기 (SimHash + LSH)
+
+같은 통신사 기사가 여러 언론사에 제목만 조금 바뀌어 재게재되면
+제목 완전 일치 중복 제거로는 걸러지지 않아 프롬프트가 같은 내용으로 채워집니다.
+제목+요약의 SimHash 지문으로 거의 같은 기사를 묶어 대표 기사 하나만 남기고,
+나머지 언론사는 "같은 내용 보도" 출처로 기록합니다.
+"""
+
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_SIMHASH_BITS = 64
+
+
+def _shingles(text: str, n: int = 3) -> list[str]:
+    """공백·문장부호를 제거한 문자 n-gram 목록을 반환합니다."""
+    text = re.sub(r"[\W_]+", "", text.lower())
+    if len(text) <= n:
+        return [text] if text else []
+    return [text[i:i + n] for i in range(len(text) - n + 1)]
+
+
+def simhash(text: str) -> int:
+    """문자 3-gram 기반 64비트 SimHash 지문을 계산합니다."""
+    weights = [0] * _SIMHASH_BITS
+    for gram in _shingles(text):
+        h = int.from_bytes(
+            hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(_SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def cluster_articles(articles: list[dict], max_distance: int = 12) -> list[dict]:
+    """거의 같은 기사를 묶어 묶음별 대표 기사 목록을 반환합니다.
+
+    지문을 (max_distance + 1)개 구간으로 나눠 구간이 하나라도 같은 기사끼리만
+    비교합니다 (비둘기집 원리로 거리 max_distance 이하인 쌍은 반드시 후보가 됨).
+    대표는 입력 순서상 가장 앞선 기사이며, 입력 순서는 유지됩니다.
+
+    Args:
+        articles: fetch_news 형식의 기사 목록
+        max_distance: 같은 기사로 볼 최대 해밍 거리 (64비트 기준)
+
+    Returns:
+        대표 기사 목록. 묶인 기사가 있으면 대표 기사에
+        "related_sources"(같은 내용을 보도한 다른 언론사 목록) 키가 추가됩니다.
+    """
+    if len(articles) < 2:
+        return list(articles)
+
+    fingerprints = [
+        simhash(f"{a.get('title', '')} {a.get('description', '')}") for a in articles
+    ]
+
+    bands = min(max_distance + 1, _SIMHASH_BITS)
+    # 64비트를 bands개 구간으로 고르게 나눔: [(시작 비트, 마스크), ...]
+    band_ranges = []
+    for band in range(bands):
+        lo = band * _SIMHASH_BITS // bands
+        hi = (band + 1) * _SIMHASH_BITS // bands
+        band_ranges.append((lo, (1 << (hi - lo)) - 1))
+
+    # Union-Find
+    parent = list(range(len(articles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets: dict[tuple[int, int], list[int]] = {}
+    for i, fp in enumerate(fingerprints):
+        for band, (lo, mask) in enumerate(band_ranges):
+            key = (band, (fp >> lo) & mask)
+            for j in buckets.get(key, []):
+                if find(i) != find(j) and _hamming(fp, fingerprints[j]) <= max_distance:
+                    # 더 앞선 기사를 대표로 유지
+                    ri, rj = find(i), find(j)
+                    parent[max(ri, rj)] = min(ri, rj)
+            buckets.setdefault(key, []).append(i)
+
+    members: dict[int, list[int]] = {}
+    for i in range(len(articles)):
+        members.setdefault(find(i), []).append(i)
+
+    result = []
+    for root in sorted(members):
+        rep = dict(articles[root])
+        others = []
+        for i in members[root][1:]:
+            source = articles[i].get("source", "")
+            if source and source != rep.get("source") and source not in others:
+                others.append(source)
+        if len(members[root]) > 1:
+            rep["related_sources"] = others
+        result.append(rep)
+
+    if len(result) < len(articles):
+        logger.info("유사 기사 묶기: %d건 → %d건", len(articles), len(result))
+    return result
@@ -0,0 +1,515 @@
+"""로컬 가짜 GPT 서버 (오프라인 벤치마크·부하 테스트용)
+
+OpenAI Chat Completions 호환 엔드포인트(POST /v1/chat/completions)를 흉내 내는 HTTP 서버입니다.
+실제 토큰을 쓰지 않고 AIWriter·IssueWriter·OpinionWriter·TrendFinder 와 섹션 병렬 생성,
+로컬 배치까지 전체 생성 과정을 네트워크 없이 돌려 처리량·지연 시간을 측정할 수 있습니다.
+
+- 응답: 요청의 prompt_cache_key 로 모드를 알아내 모드별 형식(제목 줄 + 시맨틱 HTML,
+  트렌드·개요 JSON, 구조화 출력 JSON)에 맞는 고정 글을 만듭니다.
+- 지연: 첫 토큰까지 시간은 로그정규분포(중앙값 latency, 퍼짐 jitter), 이후 초당 tokens_per_second 토큰.
+- 스트리밍: stream=true 면 SSE 조각으로 나눠 보내고, include_usage 면 마지막에 usage 조각을 붙입니다.
+- 장애 주입: rate_429 비율로 429(Retry-After 포함), rate_timeout 비율로 응답 없이 대기 후 연결 끊기.
+
+같은 seed 와 같은 요청이면 응답 내용·지연·장애 여부가 항상 같습니다 (같은 요청을 다시 보내면
+시도 횟수별로 새로 뽑으므로 재시도는 성공할 수 있음).
+
+사용:
+    python -m auto_blog.fake_llm_server --port 8765 --latency 0.8 --tps 80 --rate-429 0.05
+    .env 에 OPENAI_BASE_URL=http://127.0.0.1:8765/v1 (OPENAI_API_KEY는 아무 값)
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+from .context_packer import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# 제공자 프롬프트 캐시 흉내: 이 길이 이상인 시스템 프롬프트가 다시 오면 128토큰 단위로 캐시 적중
+_CACHE_MIN_TOKENS = 1024
+_CACHE_BLOCK_TOKENS = 128
+
+_SENTENCES = [
+    "{topic} 관련 소식이 하루 종일 화제가 되고 있는데요.",
+    "연합뉴스에 따르면 관계 기관은 이번 주 안에 추가 설명을 내놓을 예정입니다.",
+    "현장에서는 아직 구체적인 일정이 정해지지 않았다는 반응이 많거든요.",
+    "전문가들은 단기적인 영향보다 장기적인 흐름을 봐야 한다고 말합니다.",
+    "지난해 같은 시기와 비교하면 관심도가 두 배 가까이 늘었습니다.",
+    "해외 언론도 이번 사안을 비중 있게 다루고 있는 상황입니다.",
+    "다만 아직 추가 보도가 필요한 부분도 남아 있습니다.",
+    "저도 처음에는 반신반의했는데, 자료를 찾아볼수록 생각이 달라지더라고요.",
+]
+
+_ISSUE_HEADINGS = [
+    "🔎 왜 지금 이 이슈인가", "📌 배경과 맥락", "🔥 핵심 내용 정리",
+    "📊 숫자로 보는 변화", "💬 각계 반응", "🚀 앞으로의 전망", "✅ 마무리",
+]
+_OPINION_HEADINGS = ["처음 든 생각", "제가 주목한 부분", "그래서 저는 이렇게 봅니다", "마치며"]
+_WRITE_HEADINGS = ["들어가며", "핵심 정리", "알아두면 좋은 점", "마무리"]
+
+
+class FakeProfile(NamedTuple):
+    """가짜 서버의 응답 특성.
+
+    Attributes:
+        latency: 첫 토큰까지 걸리는 시간의 중앙값 (초)
+        jitter: 첫 토큰 시간 로그정규분포의 sigma (0이면 항상 latency)
+        tokens_per_second: 출력 속도 (0이면 즉시)
+        output_tokens: 글 본문 목표 길이 (토큰, max_completion_tokens 를 넘으면 잘리고 "length")
+        rate_429: 429 응답 비율 (0~1)
+        rate_timeout: 응답 없이 hang_seconds 동안 멈췄다 연결을 끊는 비율 (0~1)
+        retry_after: 429 응답의 Retry-After (초)
+        hang_seconds: 시간 초과 주입 시 대기 시간 (초)
+        seed: 난수 시드
+    """
+
+    latency: float = 0.5
+    jitter: float = 0.3
+    tokens_per_second: float = 80.0
+    output_tokens: int = 1200
+    rate_429: float = 0.0
+    rate_timeout: float = 0.0
+    retry_after: float = 1.0
+    hang_seconds: float = 30.0
+    seed: int = 0
+
+
+class FakeLLMServer:
+    """OpenAI 호환 가짜 GPT 서버. 백그라운드 스레드로 띄워 테스트·벤치마크에 씁니다.
+
+    Args:
+        profile: 응답 특성
+        host: 바인드 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+
+    사용:
+        with FakeLLMServer(FakeProfile(latency=0.2)) as server:
+            Config.OPENAI_BASE_URL = server.base_url
+            ...
+    """
+
+    def __init__(self, profile: FakeProfile | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.profile = profile or FakeProfile()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._attempts: dict[str, int] = {}
+        self._seen_prefixes: set[str] = set()
+        self._stats = {"requests": 0, "completed": 0, "streamed": 0, "rate_limited": 0, "timeouts": 0}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self) -> str:
+        """백그라운드에서 서버를 시작하고 base_url 을 반환합니다."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="fake-llm-server", daemon=True
+            )
+            self._thread.start()
+        return self.base_url
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeLLMServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _attempt_rng(self, digest: str) -> random.Random:
+        """같은 요청의 n번째 시도마다 정해진 난수 (지연·장애 주입용)."""
+        with self._lock:
+            attempt = self._attempts.get(digest, 0)
+            self._attempts[digest] = attempt + 1
+        return random.Random(f"{self.profile.seed}:{digest}:{attempt}")
+
+    def _cached_tokens(self, body: dict, system_tokens: int) -> int:
+        key = f"{body.get('prompt_cache_key', '')}:{_system_prompt(body)}"
+        with self._lock:
+            seen = key in self._seen_prefixes
+            self._seen_prefixes.add(key)
+        if not seen or system_tokens < _CACHE_MIN_TOKENS:
+            return 0
+        return system_tokens // _CACHE_BLOCK_TOKENS * _CACHE_BLOCK_TOKENS
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeLLM/1.0"
+
+    @property
+    def fake(self) -> FakeLLMServer:
+        return self.server.fake
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": []})
+        else:
+            self._send_error(404, "not_found", f"알 수 없는 경로: {self.path}")
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_error(404, "not_found", f"지원하지 않는 경로: {self.path}")
+            return
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            self._send_error(400, "invalid_request_error", "요청 본문이 JSON이 아닙니다.")
+            return
+
+        fake = self.fake
+        profile = fake.profile
+        fake._count("requests")
+        digest = hashlib.sha256(raw).hexdigest()
+        rng = fake._attempt_rng(digest)
+
+        fault = rng.random()
+        if fault < profile.rate_429:
+            fake._count("rate_limited")
+            self._send_error(
+                429, "requests", "Rate limit reached (fake server)",
+                code="rate_limit_exceeded",
+                headers={"Retry-After": f"{profile.retry_after:g}"},
+            )
+            return
+        if fault < profile.rate_429 + profile.rate_timeout:
+            fake._count("timeouts")
+            time.sleep(profile.hang_seconds)
+            self.close_connection = True
+            return
+
+        model = body.get("model", "fake-model")
+        text = _canned_output(body, random.Random(f"{profile.seed}:{digest}"), profile.output_tokens)
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens")
+        completion_tokens = count_tokens(text)
+        finish_reason = "stop"
+        if max_tokens and completion_tokens > max_tokens:
+            text = truncate_to_tokens(text, max_tokens).rstrip("…")
+            completion_tokens = max_tokens
+            finish_reason = "length"
+
+        system_tokens = count_tokens(_system_prompt(body))
+        prompt_tokens = system_tokens + sum(
+            count_tokens(m.get("content") or "")
+            for m in body.get("messages", []) if m.get("role") != "system"
+        )
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": fake._cached_tokens(body, system_tokens)},
+            "completion_tokens_details": {"reasoning_tokens": 0},
+        }
+
+        ttft = rng.lognormvariate(math.log(profile.latency), profile.jitter) if profile.latency > 0 else 0.0
+        decode = completion_tokens / profile.tokens_per_second if profile.tokens_per_second > 0 else 0.0
+        completion_id = f"chatcmpl-fake-{digest[:24]}"
+
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            self._stream(completion_id, model, text, finish_reason, usage if include_usage else None,
+                         ttft, decode, completion_tokens)
+            fake._count("streamed")
+        else:
+            time.sleep(ttft + decode)
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text, "refusal": None},
+                    "finish_reason": finish_reason,
+                    "logprobs": None,
+                }],
+                "usage": usage,
+            })
+        fake._count("completed")
+
+    def _stream(
+        self,
+        completion_id: str,
+        model: str,
+        text: str,
+        finish_reason: str,
+        usage: dict | None,
+        ttft: float,
+        decode: float,
+        completion_tokens: int,
+    ) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        created = int(time.time())
+
+        def event(choices: list, usage_value: dict | None = None) -> None:
+            chunk = {
+                "id": completion_id, "object": "chat.completion.chunk",
+                "created": created, "model": model, "choices": choices,
+            }
+            if usage_value is not None:
+                chunk["usage"] = usage_value
+            self._write_chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n")
+
+        time.sleep(ttft)
+        event([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+        # 토큰 수만큼 조각으로 나눠 출력 속도에 맞춰 보냄
+        pieces = max(1, min(completion_tokens, len(text)))
+        size = math.ceil(len(text) / pieces) if text else 0
+        parts = [text[i:i + size] for i in range(0, len(text), size)] if size else []
+        delay = decode / len(parts) if parts else 0.0
+        for part in parts:
+            time.sleep(delay)
+            event([{"index": 0, "delta": {"content": part}, "finish_reason": None}])
+        event([{"index": 0, "delta": {}, "finish_reason": finish_reason}])
+        if usage is not None:
+            event([], usage)
+        self._write_chunk("data: [DONE]\n\n")
+        self._write_chunk("")
+
+    def _write_chunk(self, data: str) -> None:
+        encoded = data.encode("utf-8")
+        self.wfile.write(f"{len(encoded):x}\r\n".encode("ascii") + encoded + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, payload: dict, headers: dict | None = None) -> None:
+        encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _send_error(
+        self, status: int, error_type: str, message: str,
+        code: str | None = None, headers: dict | None = None,
+    ) -> None:
+        self._send_json(
+            status,
+            {"error": {"message": message, "type": error_type, "param": None, "code": code}},
+            headers,
+        )
+
+
+# ── 모드별 고정 응답 ───────────────────────────────────────────────────────
+
+
+def _system_prompt(body: dict) -> str:
+    return "\n".join(
+        m.get("content") or "" for m in body.get("messages", []) if m.get("role") == "system"
+    )
+
+
+def _user_prompt(body: dict) -> str:
+    return "\n".join(
+        m.get("content") or "" for m in body.get("messages", []) if m.get("role") == "user"
+    )
+
+
+def _request_mode(body: dict) -> tuple[str, bool]:
+    """(모드, 구조화 출력 여부). prompt_cache_key("auto_blog-{mode}[-json]-v{N}")로 판별합니다."""
+    structured = (body.get("response_format") or {}).get("type") == "json_schema"
+    match = re.match(r"auto_blog-([a-z]+)", body.get("prompt_cache_key") or "")
+    return (match.group(1) if match else "write"), structured
+
+
+def _find(pattern: str, text: str, default: str) -> str:
+    match = re.search(pattern, text)
+    return match.group(1).strip() if match else default
+
+
+def _paragraphs(topic: str, rng: random.Random, target_tokens: int) -> list[str]:
+    """목표 토큰 수를 채울 때까지 <p> 문단을 만듭니다."""
+    paragraphs, tokens = [], 0
+    while tokens < target_tokens:
+        sentences = [rng.choice(_SENTENCES).format(topic=topic) for _ in range(3)]
+        paragraph = f"<p>{' '.join(sentences)}</p>"
+        paragraphs.append(paragraph)
+        tokens += count_tokens(paragraph)
+    return paragraphs
+
+
+def _sectioned(headings: list[str], topic: str, rng: random.Random, target_tokens: int) -> list[str]:
+    per_section = max(1, target_tokens // len(headings))
+    parts = []
+    for heading in headings:
+        parts.append(f"<h2>{heading}</h2>")
+        parts.extend(_paragraphs(topic, rng, per_section))
+    return parts
+
+
+def _post_body(mode: str, topic: str, rng: random.Random, target_tokens: int) -> str:
+    if mode == "issue":
+        parts = [
+            '<div class="summary-box">'
+            f"<li>{topic} 핵심 정리</li><li>각계 반응 한눈에 보기</li><li>앞으로의 전망</li></div>"
+        ]
+        parts.extend(_sectioned(_ISSUE_HEADINGS, topic, rng, target_tokens))
+        parts.insert(4, f'<div class="key-point">{topic}의 핵심은 일정과 규모입니다.</div>')
+        parts.insert(
+            6, "<blockquote>\"추가 발표를 검토하고 있다\" — <strong>연합뉴스</strong> (오늘)</blockquote>"
+        )
+        parts.append(f'<div class="sources"><li>연합뉴스 — "{topic} 관련 보도" (오늘)</li></div>')
+    elif mode == "opinion":
+        parts = _sectioned(_OPINION_HEADINGS, topic, rng, target_tokens)
+        parts.insert(2, f'<div class="my-thought">{topic}, 결국 방향은 맞다고 생각합니다.</div>')
+    else:
+        parts = _sectioned(_WRITE_HEADINGS, topic, rng, target_tokens)
+    if mode in ("issue", "opinion"):
+        parts.append('<div class="cta"></div>')
+    return "\n".join(parts)
+
+
+def _trend_output(user: str) -> str:
+    count = int(_find(r"선정할 주제 수:\s*(\d+)", user, "5"))
+    topics = [
+        {
+            "topic": f"테스트 트렌드 주제 {i + 1}",
+            "reason": "가짜 서버가 만든 주제입니다. 벤치마크용으로만 사용하세요.",
+            "category": ["사회", "경제", "기술", "라이프", "연예"][i % 5],
+            "keywords": [f"키워드{i + 1}", "트렌드", "이슈"],
+            "search_volume": "high" if i % 2 == 0 else "medium",
+            "hook_title": f"테스트 트렌드 주제 {i + 1} 총정리",
+        }
+        for i in range(count)
+    ]
+    return json.dumps(
+        {
+            "analysis_date": time.strftime("%Y-%m-%d"),
+            "topics": topics,
+            "best_pick_index": 0,
+            "best_pick_reason": "가짜 서버 기본 추천",
+        },
+        ensure_ascii=False,
+    )
+
+
+def _outline_output(topic: str) -> str:
+    sections = [
+        {"heading": heading, "brief": f"{topic}의 {heading[2:]}을(를) 다룹니다.", "query": topic}
+        for heading in _ISSUE_HEADINGS[:6]
+    ]
+    return json.dumps(
+        {
+            "title": f"{topic} 한눈에 보기",
+            "summary": [f"{topic} 핵심 정리", "각계 반응", "앞으로의 전망"],
+            "sections": sections,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _canned_output(body: dict, rng: random.Random, output_tokens: int) -> str:
+    """요청 모드의 출력 형식에 맞는 고정 응답 텍스트."""
+    mode, structured = _request_mode(body)
+    user = _user_prompt(body)
+    topic = _find(r"주제:\s*(.+)", user, "테스트 주제")
+
+    if mode == "trend":
+        return _trend_output(user)
+    if mode == "outline":
+        return _outline_output(topic)
+    if mode == "section":
+        heading = _find(r"섹션 제목:\s*(.+)", user, "🔥 핵심 내용 정리")
+        return "\n".join([f"<h2>{heading}</h2>", *_paragraphs(topic, rng, output_tokens // 4)])
+
+    title = f"{topic} 총정리"
+    content = _post_body(mode, topic, rng, output_tokens)
+    if structured:
+        return json.dumps(
+            {
+                "title": title,
+                "content": content,
+                "summary": f"{topic}의 배경과 반응, 전망을 정리했습니다.",
+                "keywords": [topic, "총정리", "이슈"],
+                "tags": [topic, "이슈", "정리", "트렌드", "블로그"],
+            },
+            ensure_ascii=False,
+        )
+    return f"{title}\n\n{content}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크용 OpenAI 호환 가짜 GPT 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="포트 (기본값: 8765)")
+    parser.add_argument("--latency", type=float, default=0.5, help="첫 토큰 시간 중앙값, 초 (기본값: 0.5)")
+    parser.add_argument("--jitter", type=float, default=0.3, help="첫 토큰 시간 퍼짐 sigma (기본값: 0.3)")
+    parser.add_argument("--tps", type=float, default=80.0, help="초당 출력 토큰, 0이면 즉시 (기본값: 80)")
+    parser.add_argument("--output-tokens", type=int, default=1200, help="글 본문 목표 토큰 (기본값: 1200)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 비율 0~1 (기본값: 0)")
+    parser.add_argument("--rate-timeout", type=float, default=0.0, help="무응답 비율 0~1 (기본값: 0)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 Retry-After 초 (기본값: 1)")
+    parser.add_argument("--hang", type=float, default=30.0, help="무응답 주입 시 대기 초 (기본값: 30)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (기본값: 0)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    profile = FakeProfile(
+        latency=args.latency,
+        jitter=args.jitter,
+        tokens_per_second=args.tps,
+        output_tokens=args.output_tokens,
+        rate_429=args.rate_429,
+        rate_timeout=args.rate_timeout,
+        retry_after=args.retry_after,
+        hang_seconds=args.hang,
+        seed=args.seed,
+    )
+    server = FakeLLMServer(profile, args.host, args.port)
+    logger.info("가짜 GPT 서버 시작: %s", server.base_url)
+    logger.info(".env 에 OPENAI_BASE_URL=%s 로 설정하세요 (OPENAI_API_KEY는 아무 값)", server.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        logger.info("종료 — 요청 통계: %s", server.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""시맨틱 마크업 → 네이버 블로그용 인라인 스타일 HTML 변환
+
+GPT가 모든 태그에 긴 style="..." 속성을 반복해서 쓰면 출력 토큰의 상당 부분이
+CSS 복사에 쓰이고 최대 토큰에도 빨리 도달합니다.
+GPT는 스타일 없는 태그와 몇 가지 class(summary-box 등)만 출력하고,
+이 모듈이 테마별 인라인 스타일과 고정 문구를 채워 넣습니다.
+
+지원하는 블록 (div class):
+    summary-box  상단 요약 박스 (안에 <li> 항목)
+    key-point    핵심 강조 박스
+    global-box   해외 언론 보도 박스
+    my-thought   내 생각 강조 박스
+    sources      참고 자료 박스 (안에 <li> 항목)
+    cta          마무리 박스 (내용은 테마 고정 문구로 대체)
+
+이미 style 속성이 있는 태그는 그대로 둡니다(기존 글을 다시 변환해도 안전).
+"""
+
+import html
+from html.parser import HTMLParser
+from typing import NamedTuple
+
+_BOX = "border-radius:6px;padding:14px 18px;margin:16px 0;"
+_CTA_BOX = (
+    "background:#F4F6F7;border-radius:8px;padding:20px 24px;margin:32px 0 0;"
+    "text-align:center;border:1px solid #EAECEE;"
+)
+_CTA_TITLE = "margin:0 0 6px;font-weight:bold;color:#2C3E50;"
+_CTA_TEXT = "margin:0;color:#666;font-size:14px;"
+_PARAGRAPH = "line-height:1.95;margin-bottom:14px;color:#333;"
+
+_VOID_TAGS = {"br", "hr", "img", "meta", "link", "input", "source", "wbr", "area", "col", "embed"}
+
+
+class _Block(NamedTuple):
+    """div class 하나를 펼치는 방법.
+
+    kind: "wrap" (내용을 감쌈) | "list" (안의 <li>를 스타일 있는 <ul>로 감쌈) | "fixed" (내용 무시)
+    """
+
+    kind: str
+    open: str
+    close: str = "</div>"
+
+
+def _list_block(box: str, title_style: str, title: str, list_style: str) -> _Block:
+    return _Block(
+        "list",
+        f'<div style="{box}">\n<p style="{title_style}">{title}</p>\n<ul style="{list_style}">',
+        "</ul>\n</div>",
+    )
+
+
+def _cta_block(title: str, text: str) -> _Block:
+    return _Block(
+        "fixed",
+        f'<div style="{_CTA_BOX}">\n'
+        f'<p style="{_CTA_TITLE}">{title}</p>\n'
+        f'<p style="{_CTA_TEXT}">{text}</p>\n'
+        "</div>",
+        "",
+    )
+
+
+class Theme(NamedTuple):
+    """태그별 스타일과 class 블록 정의."""
+
+    tags: dict[str, str]
+    blocks: dict[str, _Block]
+
+
+_ISSUE_THEME = Theme(
+    tags={
+        "h2": "font-size:20px;font-weight:bold;border-left:5px solid #2980B9;"
+              "padding-left:13px;margin:32px 0 14px;color:#1A5276;",
+        "h3": "font-size:16px;font-weight:bold;color:#2C3E50;margin:20px 0 10px;"
+              "padding-bottom:6px;border-bottom:1px dashed #AED6F1;",
+        "p": _PARAGRAPH,
+        "blockquote": "border-left:4px solid #2980B9;background:#F2F3F4;padding:13px 18px;"
+                      "margin:16px 0;color:#555;font-style:italic;border-radius:0 6px 6px 0;",
+        "table": "width:100%;border-collapse:collapse;margin:16px 0;font-size:14px;",
+        "tr_head": "background:#2980B9;color:white;",
+        "th": "padding:11px 14px;border:1px solid #ddd;text-align:left;",
+        "td_first": "padding:10px 14px;border:1px solid #ddd;background:#F8F9FA;font-weight:bold;",
+        "td": "padding:10px 14px;border:1px solid #ddd;",
+        "hr": "border:0;border-top:2px solid #EBF3FB;margin:30px 0;",
+    },
+    blocks={
+        "summary-box": _list_block(
+            "background:#EBF3FB;border:1px solid #AED6F1;border-radius:8px;"
+            "padding:18px 22px;margin:0 0 24px;",
+            "font-weight:bold;font-size:15px;margin:0 0 10px;color:#1A5276;",
+            "📋 이 글에서 알 수 있는 것",
+            "margin:0;padding-left:20px;line-height:2.0;color:#2C3E50;",
+        ),
+        "key-point": _Block(
+            "wrap",
+            f'<div style="background:#FEF9E7;border:1px solid #F7DC6F;{_BOX}">\n'
+            "💡 <strong>핵심 포인트:</strong> ",
+        ),
+        "global-box": _Block(
+            "wrap",
+            f'<div style="background:#E8F6F3;border:1px solid #76D7C4;{_BOX}">\n'
+            "🌍 <strong>해외 언론 보도:</strong> ",
+        ),
+        "sources": _list_block(
+            "background:#F8F9FA;border:1px solid #E5E7EB;border-radius:6px;"
+            "padding:14px 18px;margin:24px 0 16px;",
+            "font-weight:bold;margin:0 0 8px;color:#555;font-size:13px;",
+            "📰 참고 자료",
+            "margin:0;padding-left:18px;color:#666;font-size:13px;line-height:1.8;",
+        ),
+        "cta": _cta_block(
+            "이 글이 도움이 되셨나요? 😊",
+            '공감 <strong style="color:#E74C3C;">♥</strong> 와 댓글은 '
+            "더 좋은 글을 쓰는 데 큰 힘이 됩니다!",
+        ),
+    },
+)
+
+_OPINION_THEME = Theme(
+    tags={
+        "h2": "font-size:20px;font-weight:bold;border-left:5px solid #8E44AD;"
+              "padding-left:13px;margin:32px 0 14px;color:#4A235A;",
+        "h3": "font-size:16px;font-weight:bold;color:#4A235A;margin:20px 0 10px;",
+        "p": _PARAGRAPH,
+        "blockquote": "border-left:4px solid #8E44AD;background:#F9F5FC;padding:13px 18px;"
+                      "margin:16px 0;color:#555;font-style:italic;border-radius:0 6px 6px 0;",
+        "hr": "border:0;border-top:2px solid #F5EEF8;margin:30px 0;",
+    },
+    blocks={
+        "my-thought": _Block(
+            "wrap",
+            f'<div style="background:#F5EEF8;border:1px solid #D2B4DE;{_BOX}">\n'
+            "💭 <strong>내 생각:</strong> ",
+        ),
+        "key-point": _Block(
+            "wrap",
+            f'<div style="background:#F5EEF8;border:1px solid #D2B4DE;{_BOX}">\n'
+            "💡 <strong>핵심 포인트:</strong> ",
+        ),
+        "cta": _cta_block(
+            "여러분의 생각은 어떠신가요? 😊",
+            "댓글로 의견 남겨주시면 감사하겠습니다!",
+        ),
+    },
+)
+
+THEMES: dict[str, Theme] = {"issue": _ISSUE_THEME, "opinion": _OPINION_THEME}
+
+
+class _SemanticRenderer(HTMLParser):
+    """태그를 그대로 다시 쓰면서 테마 스타일과 class 블록을 채워 넣습니다."""
+
+    def __init__(self, theme: Theme):
+        super().__init__(convert_charrefs=False)
+        self.theme = theme
+        self.out: list[str] = []
+        # div/ul/ol 닫는 태그 자리에 출력할 내용
+        self._stack: list[tuple[str, str]] = []
+        self._list_blocks = 0
+        # 고정 블록(cta) 안의 div 중첩 깊이 (0이면 건너뛰는 중 아님).
+        # 모델이 쓴 다른 태그는 닫히지 않을 수 있으므로 div만 셈
+        self._skip_depth = 0
+        self._row_index: int | None = None
+        self._cell_count = 0
+
+    # ── 태그 처리 ───────────────────────────────────────────────────────
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip_depth:
+            if tag == "div":
+                self._skip_depth += 1
+            return
+
+        attr_map = dict(attrs)
+        if tag == "div":
+            block = self.theme.blocks.get((attr_map.get("class") or "").strip())
+            if block is not None:
+                self._open_block(block)
+                return
+
+        if tag in ("ul", "ol"):
+            if self._list_blocks and self._stack and self._stack[-1][0] == "div-list":
+                # 블록이 이미 스타일 있는 <ul>을 열었으므로 모델이 쓴 목록 태그는 생략
+                self._stack.append((tag, ""))
+                return
+            self._stack.append((tag, f"</{tag}>"))
+        elif tag == "div":
+            self._stack.append((tag, "</div>"))
+
+        style_key = tag
+        if tag == "tr":
+            # 제목 행 여부는 첫 셀을 봐야 알 수 있으므로 자리만 잡아 둠
+            self._row_index = len(self.out)
+            self._cell_count = 0
+            self.out.append(self._format_start(tag, attrs, None))
+            return
+        if tag in ("th", "td"):
+            if tag == "th" and self._cell_count == 0:
+                self._style_header_row()
+            if tag == "td" and self._cell_count == 0:
+                style_key = "td_first"
+            self._cell_count += 1
+        self.out.append(self._format_start(tag, attrs, self.theme.tags.get(style_key)))
+
+    def handle_startendtag(self, tag, attrs):
+        if self._skip_depth:
+            return
+        self.out.append(self._format_start(tag, attrs, self.theme.tags.get(tag)))
+
+    def handle_endtag(self, tag):
+        if self._skip_depth:
+            if tag == "div":
+                self._skip_depth -= 1
+            return
+        if tag in ("div", "ul", "ol"):
+            if not any(t.startswith(tag) for t, _ in self._stack):
+                return
+            while self._stack:
+                open_tag, close = self._stack.pop()
+                if open_tag == "div-list":
+                    self._list_blocks -= 1
+                self.out.append(close)
+                if open_tag.startswith(tag):
+                    break
+            return
+        if tag in _VOID_TAGS:
+            return
+        self.out.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.out.append(data)
+
+    def handle_entityref(self, name):
+        if not self._skip_depth:
+            self.out.append(f"&{name};")
+
+    def handle_charref(self, name):
+        if not self._skip_depth:
+            self.out.append(f"&#{name};")
+
+    def handle_comment(self, data):
+        if not self._skip_depth:
+            self.out.append(f"<!--{data}-->")
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self.out.append(self._stack.pop()[1])
+
+    # ── 내부 구현 ─────────────────────────────────────────────────────────
+
+    def _open_block(self, block: _Block) -> None:
+        self.out.append(block.open)
+        if block.kind == "fixed":
+            self._skip_depth = 1
+        elif block.kind == "list":
+            self._list_blocks += 1
+            self._stack.append(("div-list", block.close))
+        else:
+            self._stack.append(("div", block.close))
+
+    def _style_header_row(self) -> None:
+        style = self.theme.tags.get("tr_head")
+        if self._row_index is not None and style and "style=" not in self.out[self._row_index]:
+            self.out[self._row_index] = self.out[self._row_index][:-1] + f' style="{style}">'
+
+    @staticmethod
+    def _format_start(tag: str, attrs: list, style: str | None) -> str:
+        parts = [tag]
+        has_style = False
+        for name, value in attrs:
+            has_style = has_style or name == "style"
+            parts.append(name if value is None else f'{name}="{html.escape(value, quote=True)}"')
+        if style and not has_style:
+            parts.append(f'style="{style}"')
+        return f"<{' '.join(parts)}>"
+
+
+def render_html(content: str, theme: str) -> str:
+    """GPT가 출력한 시맨틱 마크업을 테마 스타일이 적용된 HTML로 변환합니다.
+
+    Args:
+        content: 스타일 없는 HTML 본문 (class 블록 포함)
+        theme: "issue" (파란색) | "opinion" (보라색)
+    """
+    renderer = _SemanticRenderer(THEMES[theme])
+    renderer.feed(content)
+    renderer.close()
+    return "".join(renderer.out)
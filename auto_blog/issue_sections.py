@@ -0,0 +1,254 @@
+"""이슈 정리글 섹션 병렬 생성
+
+긴 이슈 정리글을 한 번의 응답으로 만들면 모든 섹션의 생성 시간이 더해집니다.
+먼저 짧은 개요(제목·요약·섹션 목록)를 만들고, 각 섹션을 관련 기사만 넣어
+동시에 생성한 뒤 순서대로 이어 붙입니다. 전체 시간이 가장 느린 섹션 하나 수준으로 줄어듭니다.
+
+요약 박스·참고 자료·CTA 박스는 개요와 기사 목록으로 로컬에서 만들어 출력 토큰을 아낍니다.
+"""
+
+import html
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import Config
+from .news_fetcher import pack_news_context, rank_articles
+from .writer_engine import GenerationEngine, GenerationRequest
+
+logger = logging.getLogger(__name__)
+
+OUTLINE_MAX_TOKENS = 1500
+SECTION_MAX_TOKENS = 2000
+# 섹션마다 프롬프트에 넣을 관련 기사 수
+_SECTION_TOP_K = 5
+_MAX_SECTIONS = 9
+
+OUTLINE_SYSTEM_PROMPT = """당신은 네이버 블로그 시사/트렌드 정리글의 구성을 설계하는 편집자입니다.
+사용자 메시지로 주어지는 "실제 뉴스 자료"와 "작성 요청"(주제·키워드)을 보고 글의 개요를 만듭니다.
+
+규칙:
+1. 뉴스 자료에 있는 사실만으로 다룰 수 있는 섹션만 만듭니다.
+2. 섹션은 아래 순서 중 자료가 뒷받침하는 것으로 5~8개를 고릅니다.
+   🔎 도입(왜 지금 이 이슈인가) → 📌 배경/맥락 → 🔥 핵심 내용 정리 → 📊 데이터/비교
+   → 💬 각계 반응 → 🌍 해외 시각(해외 보도가 있을 때만) → 🚀 향후 전망 → ✅ 마무리
+3. 제목은 40자 이내, "총정리", "한눈에 보기", 숫자 활용 등 네이버 인기 제목 전략을 따릅니다.
+4. summary 는 "이 글에서 알 수 있는 것" 3~4개 (각 40자 이내)입니다.
+5. query 는 해당 섹션에 필요한 기사를 찾을 검색어(핵심 명사 2~4개)입니다.
+
+반드시 아래 JSON 형식만 출력하세요 (```json 코드블록 없이 순수 JSON):
+{
+  "title": "글 제목",
+  "summary": ["핵심 포인트 1", "핵심 포인트 2", "핵심 포인트 3"],
+  "sections": [
+    {"heading": "🔎 섹션 제목", "brief": "이 섹션에서 다룰 내용 (1~2문장)", "query": "검색어"}
+  ]
+}"""
+
+SECTION_SYSTEM_PROMPT = """당신은 네이버 블로그에서 시사/트렌드 정리글을 전문적으로 작성하는 블로거입니다.
+여러 사람이 나눠 쓰는 글에서 지정된 섹션 하나만 작성합니다.
+
+■ 핵심 원칙 — 팩트 기반 글쓰기
+1. 사용자 메시지의 "실제 뉴스 자료"에 있는 사실만 작성합니다. 없는 사실을 지어내거나 추측하지 않습니다.
+2. 정보의 출처를 본문에 자연스럽게 밝힙니다. (예: "연합뉴스에 따르면...", "BBC는 ~라고 보도했다.")
+3. 통계나 수치를 인용할 때는 반드시 출처를 함께 적습니다.
+4. 자료가 부족한 부분은 "아직 추가 보도가 필요한 부분"으로 솔직하게 처리합니다.
+5. 개요의 다른 섹션에서 다룰 내용은 반복하지 않습니다.
+
+■ 글 스타일
+• 블로거가 직접 리서치해서 정리한 느낌으로, "~인데요", "~거든요" 같은 구어체를 적절히 섞습니다.
+• 짧은 문장 위주로 리듬감 있게. 한 문단은 3~4문장 이내. 섹션 분량은 400~800자.
+
+■ HTML 포맷 (style 속성과 CSS는 절대 쓰지 않음, 서식은 자동 적용)
+• 섹션 헤더: <h2>지정된 섹션 제목</h2> 로 시작
+• 서브 헤더: <h3>, 일반 단락: <p>
+• 출처 인용: <blockquote>"인용 내용" — <strong>언론사</strong> (날짜)</blockquote>
+• 비교표: <table><tr><th>항목</th><th>내용</th></tr><tr><td>항목명</td><td>내용</td></tr></table>
+• 핵심 강조: <div class="key-point">내용</div>
+• 해외 언론 보도: <div class="global-box">내용</div>
+
+■ 출력 형식
+이 섹션의 HTML 본문만 출력합니다. 글 제목 줄, 요약 박스, 참고 자료, CTA 박스는 자동으로 추가되므로 쓰지 않습니다."""
+
+
+def generate_sectioned_post(
+    engine: GenerationEngine,
+    topic: str,
+    keywords: list[str] | None,
+    news_articles: list[dict],
+    force_regenerate: bool = False,
+) -> dict | None:
+    """개요 → 섹션 병렬 생성 → 이어 붙이기로 이슈 정리글을 만듭니다.
+
+    Args:
+        engine: GPT 생성 엔진
+        topic: 이슈 주제
+        keywords: SEO 키워드 목록
+        news_articles: 관련도순으로 정리된 기사 목록
+        force_regenerate: True면 생성 캐시를 무시
+
+    Returns:
+        스타일 적용 전의 {"title", "content"}.
+        개요를 만들지 못했거나 섹션 생성이 하나라도 실패하면 None (호출 측에서 한 번에 생성)
+    """
+    outline = _generate_outline(engine, topic, keywords, news_articles, force_regenerate)
+    if outline is None:
+        return None
+
+    sections = outline["sections"]
+    workers = max(1, min(Config.ISSUE_SECTION_WORKERS, len(sections)))
+    logger.info("섹션 병렬 생성: %d개 섹션 (동시 %d개)", len(sections), workers)
+
+    def write(index: int) -> tuple[str, list[dict]] | None:
+        try:
+            return _generate_section(
+                engine, topic, keywords, outline, index, news_articles, force_regenerate
+            )
+        except RuntimeError as e:
+            logger.warning("섹션 생성 실패 [%s]: %s", sections[index]["heading"], e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(write, range(len(sections))))
+
+    failed = sum(1 for r in results if r is None)
+    if failed:
+        logger.warning("섹션 %d/%d개 생성 실패 → 한 번에 생성합니다.", failed, len(sections))
+        return None
+
+    # 섹션에서 실제로 사용한 기사만 참고 자료로 (처음 등장한 순서)
+    used: dict[str, dict] = {}
+    for _, articles in results:
+        for a in articles:
+            used.setdefault(a.get("link") or a["title"], a)
+
+    parts = [_summary_box(outline["summary"])] if outline["summary"] else []
+    parts.extend(body for body, _ in results)
+    if used:
+        parts.append(_sources_box(list(used.values())))
+    parts.append('<div class="cta"></div>')
+    return {"title": outline["title"], "content": "\n\n".join(parts)}
+
+
+def _generate_outline(
+    engine: GenerationEngine,
+    topic: str,
+    keywords: list[str] | None,
+    news_articles: list[dict],
+    force_regenerate: bool,
+) -> dict | None:
+    packed = pack_news_context(
+        news_articles, Config.NEWS_CONTEXT_TOKEN_BUDGET // 2, topic, keywords
+    )
+    user_prompt = "\n\n".join([
+        packed.text or "━━ 실제 뉴스 자료 (0건) ━━\n수집하지 못했습니다.",
+        _request_block(topic, keywords),
+    ])
+    try:
+        text = engine.complete(
+            GenerationRequest(
+                mode="outline",
+                system_prompt=OUTLINE_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+                max_tokens=OUTLINE_MAX_TOKENS,
+                label=topic,
+            ),
+            force_regenerate,
+        )
+    except RuntimeError as e:
+        logger.warning("개요 생성 실패 → 한 번에 생성합니다: %s", e)
+        return None
+    outline = _parse_outline(text)
+    if outline is None:
+        logger.warning("개요 파싱 실패 → 한 번에 생성합니다. 원본: %s", text[:300])
+    return outline
+
+
+def _parse_outline(text: str) -> dict | None:
+    """개요 JSON을 검증해 {"title", "summary", "sections"} 로 반환합니다. 형식이 틀리면 None."""
+    match = re.search(r"\{[\s\S]*\}", text)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group())
+    except json.JSONDecodeError:
+        return None
+
+    title = str(data.get("title") or "").strip()
+    sections = [
+        {
+            "heading": str(s["heading"]).strip(),
+            "brief": str(s.get("brief") or "").strip(),
+            "query": str(s.get("query") or "").strip(),
+        }
+        for s in data.get("sections") or []
+        if isinstance(s, dict) and str(s.get("heading") or "").strip()
+    ][:_MAX_SECTIONS]
+    if not title or not sections:
+        return None
+    summary = [str(p).strip() for p in data.get("summary") or [] if str(p).strip()]
+    return {"title": title, "summary": summary, "sections": sections}
+
+
+def _generate_section(
+    engine: GenerationEngine,
+    topic: str,
+    keywords: list[str] | None,
+    outline: dict,
+    index: int,
+    news_articles: list[dict],
+    force_regenerate: bool,
+) -> tuple[str, list[dict]]:
+    """섹션 하나를 해당 섹션 관련 기사만으로 생성합니다. (본문, 사용한 기사) 반환."""
+    section = outline["sections"][index]
+    query = f"{section['heading']} {section['query']} {section['brief']}"
+    relevant = rank_articles(news_articles, query, [topic], top_k=_SECTION_TOP_K)
+    packed = pack_news_context(
+        relevant, Config.NEWS_CONTEXT_TOKEN_BUDGET // 2, query, [topic]
+    )
+
+    plan = "\n".join(
+        f"{i + 1}. {s['heading']}" + (" ← 이번에 작성할 섹션" if i == index else "")
+        for i, s in enumerate(outline["sections"])
+    )
+    user_prompt = "\n\n".join([
+        packed.text or "━━ 실제 뉴스 자료 (0건) ━━\n수집하지 못했습니다.",
+        f"━━ 글 개요 ━━\n제목: {outline['title']}\n{plan}",
+        _request_block(topic, keywords)
+        + f"\n섹션 제목: {section['heading']}\n다룰 내용: {section['brief']}",
+    ])
+    body = engine.complete(
+        GenerationRequest(
+            mode="section",
+            system_prompt=SECTION_SYSTEM_PROMPT,
+            user_prompt=user_prompt,
+            max_tokens=SECTION_MAX_TOKENS,
+            label=f"{topic} — {section['heading']}",
+        ),
+        force_regenerate,
+    ).strip()
+    if not body.lstrip().startswith("<h2"):
+        body = f"<h2>{html.escape(section['heading'])}</h2>\n{body}"
+    return body, relevant
+
+
+def _request_block(topic: str, keywords: list[str] | None) -> str:
+    lines = [f"━━ 작성 요청 ━━\n이슈 주제: {topic}"]
+    if keywords:
+        lines.append(f"SEO 키워드: {', '.join(keywords)}")
+    return "\n".join(lines)
+
+
+def _summary_box(points: list[str]) -> str:
+    items = "\n".join(f"<li>{html.escape(p)}</li>" for p in points)
+    return f'<div class="summary-box">\n{items}\n</div>'
+
+
+def _sources_box(articles: list[dict]) -> str:
+    items = "\n".join(
+        f'<li>{html.escape(a.get("source", ""))} — "{html.escape(a["title"])}" '
+        f'({html.escape(a.get("date", ""))})</li>'
+        for a in articles
+    )
+    return f'<div class="sources">\n{items}\n</div>'
@@ -5,17 +5,24 @@
 """
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 
-from openai import OpenAI
-
-from .ai_writer import _parse_title_content
+from .article_extractor import fetch_full_texts
 from .config import Config
+from .dedup import cluster_articles
+from .html_renderer import render_html
+from .issue_sections import generate_sectioned_post
 from .news_fetcher import (
     fetch_blog_references,
     fetch_news,
-    format_blog_context,
-    format_news_context,
+    pack_blog_context,
+    pack_news_context,
+    rank_articles,
+    search_stored_news,
 )
+from .writer_engine import GenerationEngine, GenerationRequest, StreamEvent, get_engine
 
 logger = logging.getLogger(__name__)
 
@@ -68,72 +75,23 @@ ISSUE_SYSTEM_PROMPT = """당신은 네이버 블로그에서 시사/트렌드 
 9. ✅ 마무리 + CTA
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-■ HTML 포맷 규칙 (Naver Blog 최적화)
+■ HTML 포맷 규칙 (스타일은 자동 적용)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-[요약 박스 — 글 최상단 필수]
-<div style="background:#EBF3FB;border:1px solid #AED6F1;border-radius:8px;padding:18px 22px;margin:0 0 24px;">
-<p style="font-weight:bold;font-size:15px;margin:0 0 10px;color:#1A5276;">📋 이 글에서 알 수 있는 것</p>
-<ul style="margin:0;padding-left:20px;line-height:2.0;color:#2C3E50;">
-<li>포인트 1</li>
-<li>포인트 2</li>
-<li>포인트 3</li>
-</ul>
-</div>
-
-[섹션 헤더 h2]
-<h2 style="font-size:20px;font-weight:bold;border-left:5px solid #2980B9;padding-left:13px;margin:32px 0 14px;color:#1A5276;">🔥 섹션 제목</h2>
-
-[서브 헤더 h3]
-<h3 style="font-size:16px;font-weight:bold;color:#2C3E50;margin:20px 0 10px;padding-bottom:6px;border-bottom:1px dashed #AED6F1;">서브 제목</h3>
-
-[일반 단락]
-<p style="line-height:1.95;margin-bottom:14px;color:#333;">내용</p>
-
-[출처 인용 — 뉴스 보도를 인용할 때 필수 사용]
-<blockquote style="border-left:4px solid #2980B9;background:#F2F3F4;padding:13px 18px;margin:16px 0;color:#555;font-style:italic;border-radius:0 6px 6px 0;">
-"인용 내용" — <strong>연합뉴스</strong> (2026.02.21)
-</blockquote>
-
-[핵심 강조 박스]
-<div style="background:#FEF9E7;border:1px solid #F7DC6F;border-radius:6px;padding:14px 18px;margin:16px 0;">
-💡 <strong>핵심 포인트:</strong> 내용
-</div>
-
-[해외 뉴스 박스 — 해외 언론 보도 인용 시]
-<div style="background:#E8F6F3;border:1px solid #76D7C4;border-radius:6px;padding:14px 18px;margin:16px 0;">
-🌍 <strong>해외 언론 보도:</strong> BBC/CNN/NHK 등의 보도 내용
-</div>
-
-[비교표]
-<table style="width:100%;border-collapse:collapse;margin:16px 0;font-size:14px;">
-<tr style="background:#2980B9;color:white;">
-<th style="padding:11px 14px;border:1px solid #ddd;text-align:left;">항목</th>
-<th style="padding:11px 14px;border:1px solid #ddd;text-align:left;">내용</th>
-</tr>
-<tr>
-<td style="padding:10px 14px;border:1px solid #ddd;background:#F8F9FA;font-weight:bold;">항목명</td>
-<td style="padding:10px 14px;border:1px solid #ddd;">내용</td>
-</tr>
-</table>
-
-[참고 자료 — 글 마무리 전, 주요 출처 정리]
-<div style="background:#F8F9FA;border:1px solid #E5E7EB;border-radius:6px;padding:14px 18px;margin:24px 0 16px;">
-<p style="font-weight:bold;margin:0 0 8px;color:#555;font-size:13px;">📰 참고 자료</p>
-<ul style="margin:0;padding-left:18px;color:#666;font-size:13px;line-height:1.8;">
-<li>연합뉴스 — "기사 제목" (날짜)</li>
-<li>BBC — "기사 제목" (날짜)</li>
-</ul>
-</div>
-
-[섹션 구분선]
-<hr style="border:0;border-top:2px solid #EBF3FB;margin:30px 0;">
-
-[마무리 CTA 박스 — 글 최하단 필수]
-<div style="background:#F4F6F7;border-radius:8px;padding:20px 24px;margin:32px 0 0;text-align:center;border:1px solid #EAECEE;">
-<p style="margin:0 0 6px;font-weight:bold;color:#2C3E50;">이 글이 도움이 되셨나요? 😊</p>
-<p style="margin:0;color:#666;font-size:14px;">공감 <strong style="color:#E74C3C;">♥</strong> 와 댓글은 더 좋은 글을 쓰는 데 큰 힘이 됩니다!</p>
-</div>
+style 속성과 CSS는 절대 쓰지 마세요. 아래 태그와 class만 사용하면 발행 시 서식이 자동으로 입혀집니다.
+
+• 섹션 헤더: <h2>🔥 섹션 제목</h2>
+• 서브 헤더: <h3>서브 제목</h3>
+• 일반 단락: <p>내용</p>
+• 출처 인용 (뉴스 인용 시 필수): <blockquote>"인용 내용" — <strong>연합뉴스</strong> (2026.02.21)</blockquote>
+• 비교표: <table><tr><th>항목</th><th>내용</th></tr><tr><td>항목명</td><td>내용</td></tr></table>
+• 섹션 구분선: <hr>
+
+[특수 박스 — div class로 지정]
+<div class="summary-box"><li>포인트 1</li><li>포인트 2</li><li>포인트 3</li></div>   ← 글 최상단 필수 (요약 박스)
+<div class="key-point">핵심 강조 내용</div>
+<div class="global-box">BBC/CNN/NHK 등 해외 언론 보도 내용</div>
+<div class="sources"><li>연합뉴스 — "기사 제목" (날짜)</li><li>BBC — "기사 제목" (날짜)</li></div>   ← 마무리 전 참고 자료
+<div class="cta"></div>   ← 글 최하단 필수 (마무리 CTA 박스, 문구 자동 삽입)
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 ■ SEO & 가독성 규칙
@@ -142,6 +100,16 @@ ISSUE_SYSTEM_PROMPT = """당신은 네이버 블로그에서 시사/트렌드 
 • 모바일 가독성을 위해 한 단락은 3~4문장 이내
 • 글 길이: HTML 태그 제외 순수 텍스트 기준 3000~5000자
 
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+■ 제공 자료 사용 방법
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+사용자 메시지에는 "실제 뉴스 자료", "참고 블로그 글"(있는 경우), "작성 요청"(주제·키워드)이 차례로 주어집니다.
+• 반드시 "실제 뉴스 자료"에 있는 사실만을 기반으로 글을 작성합니다.
+• 각 정보의 출처(언론사명)를 본문에 자연스럽게 포함하고, 글 하단 참고 자료 박스에 주요 출처를 정리합니다.
+• 뉴스 자료가 0건이면 확실히 알려진 일반적 사실만 작성하고, 불확실한 내용은 "추가 확인이 필요합니다"로 처리합니다.
+• "참고 블로그 글"은 톤·구성·표현 방식만 참고하고, 내용은 뉴스 자료만을 기반으로 합니다.
+• 요약 박스, 출처 인용, 해외 언론 박스, 비교표, 참고 자료, CTA 박스를 포함합니다.
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 ■ 출력 형식
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -153,108 +121,167 @@ ISSUE_SYSTEM_PROMPT = """당신은 네이버 블로그에서 시사/트렌드 
 class IssueWriter:
     """실제 뉴스 자료를 수집한 후 팩트 기반 이슈 정리글을 생성합니다."""
 
-    def __init__(self):
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    def __init__(self, engine: GenerationEngine | None = None):
+        self.engine = engine or get_engine()
 
-    def generate_post(self, topic: str, keywords: list[str] | None = None) -> dict:
+    def generate_post(
+        self, topic: str, keywords: list[str] | None = None, force_regenerate: bool = False
+    ) -> dict:
         """이슈 정리글을 생성합니다.
 
         1) 네이버 뉴스 API로 실제 기사 수집
         2) 네이버 블로그 검색으로 인기 글 스타일 참고
         3) 수집된 자료를 GPT에 전달해 팩트 기반 글 작성
 
+        ISSUE_PARALLEL_SECTIONS가 켜져 있으면 3)을 개요 → 섹션 병렬 생성으로 대신합니다.
+
         Args:
             topic: 이슈 주제
             keywords: SEO 키워드 목록 (선택사항)
+            force_regenerate: True면 생성 캐시를 무시하고 GPT로 새로 생성
 
         Returns:
             {"title": str, "content": str} 형태의 딕셔너리
         """
-        # ── 1단계: 실제 뉴스 자료 수집 ──
-        logger.info("뉴스 자료 수집 중: %s", topic)
-        news_articles = fetch_news(topic, count=15)
+        news_articles, blog_refs = self._prepare_research(topic, keywords)
+        post = None
+        if Config.ISSUE_PARALLEL_SECTIONS:
+            post = generate_sectioned_post(
+                self.engine, topic, keywords, news_articles, force_regenerate
+            )
+        if post is None:
+            request = self._compose_request(topic, keywords, news_articles, blog_refs)
+            post = self.engine.generate(request, force_regenerate)
+        post["content"] = render_html(post["content"], "issue")
 
-        # 키워드로 추가 검색 (다각적 자료 확보)
-        if keywords:
-            for kw in keywords[:2]:
-                extra = fetch_news(kw, count=5)
-                # 중복 제거 (제목 기준)
-                existing_titles = {a["title"] for a in news_articles}
-                for a in extra:
-                    if a["title"] not in existing_titles:
-                        news_articles.append(a)
-                        existing_titles.add(a["title"])
+        logger.info("이슈 정리글 생성 완료: %s (%d자)", post["title"], len(post["content"]))
+        return post
 
-        news_context = format_news_context(news_articles)
+    def generate_post_stream(
+        self, topic: str, keywords: list[str] | None = None, force_regenerate: bool = False
+    ) -> Iterator[StreamEvent]:
+        """generate_post 의 스트리밍 버전입니다.
 
-        # ── 2단계: 블로그 스타일 참조 ──
-        logger.info("블로그 스타일 참조 수집 중: %s", topic)
-        blog_refs = fetch_blog_references(topic, count=5)
-        blog_context = format_blog_context(blog_refs)
+        자료 수집이 끝나면 GPT 응답을 도착하는 대로 "title" / "content" 이벤트로 내보내고,
+        마지막 "done" 이벤트의 post 에 스타일을 적용한 {"title", "content"} 를 담습니다.
+        "content" 조각은 스타일 적용 전의 시맨틱 마크업입니다.
+        generate_post 와 달리 항상 일반 텍스트로 한 번에 생성합니다
+        (GPT_STRUCTURED_OUTPUT, ISSUE_PARALLEL_SECTIONS 는 적용되지 않음).
+        """
+        request = self.build_request(topic, keywords)
+        for event in self.engine.stream(request, force_regenerate):
+            if event.kind == "done":
+                event = event._replace(
+                    post={**event.post, "content": render_html(event.post["content"], "issue")}
+                )
+                logger.info("이슈 정리글 생성 완료: %s (%d자)",
+                            event.post["title"], len(event.post["content"]))
+            yield event
+
+    def build_request(self, topic: str, keywords: list[str] | None = None) -> GenerationRequest:
+        """뉴스·블로그 자료를 수집해 이슈 정리글 프롬프트를 구성합니다."""
+        news_articles, blog_refs = self._prepare_research(topic, keywords)
+        return self._compose_request(topic, keywords, news_articles, blog_refs)
+
+    def _prepare_research(
+        self, topic: str, keywords: list[str] | None
+    ) -> tuple[list[dict], list[dict]]:
+        """자료를 수집하고 중복 정리·관련도 선별·원문 보강까지 마친 (기사, 블로그) 목록."""
+        # ── 1~2단계: 뉴스 자료 + 블로그 스타일 참조 병렬 수집 ──
+        news_articles, blog_refs = self._collect_research(topic, keywords)
+        # 같은 기사 재게재분은 대표 기사 하나로 묶고 다른 언론사는 출처로 기록
+        news_articles = cluster_articles(news_articles)
+        # 주제·키워드 관련도(BM25) 상위 기사만 남김
+        news_articles = rank_articles(news_articles, topic, keywords, top_k=Config.NEWS_TOP_K)
+        if Config.FULLTEXT_ENABLED:
+            # 잘린 요약 대신 기사 원문 본문 사용
+            news_articles = fetch_full_texts(news_articles)
+        return news_articles, blog_refs
+
+    def _compose_request(
+        self,
+        topic: str,
+        keywords: list[str] | None,
+        news_articles: list[dict],
+        blog_refs: list[dict],
+    ) -> GenerationRequest:
+        # 관련도·최신순으로 토큰 예산만큼만 프롬프트에 포함
+        packed_news = pack_news_context(
+            news_articles, Config.NEWS_CONTEXT_TOKEN_BUDGET, topic, keywords
+        )
+        packed_blogs = pack_blog_context(
+            blog_refs, Config.BLOG_CONTEXT_TOKEN_BUDGET, topic, keywords
+        )
+        news_context = packed_news.text
+        blog_context = packed_blogs.text
 
         # ── 3단계: GPT 프롬프트 구성 ──
-        user_prompt = f"이슈 주제: {topic}\n"
-        if keywords:
-            user_prompt += f"SEO 키워드: {', '.join(keywords)}\n"
-
-        user_prompt += "\n"
-
-        if news_context:
-            user_prompt += (
-                "아래는 이 이슈에 대한 실제 뉴스 기사입니다.\n"
-                "반드시 이 뉴스 자료에 있는 사실만을 기반으로 글을 작성하세요.\n"
-                "각 정보의 출처(언론사명)를 본문에 자연스럽게 포함하세요.\n"
-                "글 하단에 '참고 자료' 섹션을 추가해 주요 출처를 정리하세요.\n\n"
-                f"{news_context}\n\n"
-            )
-        else:
-            user_prompt += (
-                "⚠️ 뉴스 자료를 수집하지 못했습니다.\n"
-                "확실히 알려진 일반적 사실만 작성하고, "
-                "불확실한 내용은 '추가 확인이 필요합니다'로 처리하세요.\n\n"
-            )
-
+        # 지시문은 모두 시스템 프롬프트(고정 접두부)에 있고, 여기에는 가변 자료만 넣음
+        sections = [news_context or "━━ 실제 뉴스 자료 (0건) ━━\n수집하지 못했습니다."]
         if blog_context:
-            user_prompt += (
-                "아래는 같은 주제의 인기 블로그 글입니다. "
-                "글의 톤·구성·표현 방식을 참고하되, "
-                "내용은 위 뉴스 자료만을 기반으로 작성하세요.\n\n"
-                f"{blog_context}\n\n"
-            )
+            sections.append(blog_context)
 
-        user_prompt += (
-            "위 자료를 기반으로 팩트에 충실한 이슈 정리글을 작성해주세요.\n"
-            "요약 박스, 출처 인용, 해외 언론 박스, 비교표, 참고 자료, CTA 박스를 포함하세요."
+        request_lines = [f"━━ 작성 요청 ━━\n이슈 주제: {topic}"]
+        if keywords:
+            request_lines.append(f"SEO 키워드: {', '.join(keywords)}")
+        sections.append("\n".join(request_lines))
+        user_prompt = "\n\n".join(sections)
+
+        logger.info("이슈 정리글 생성 요청: %s (뉴스 %d건, 블로그 참조 %d건, 자료 %d토큰)",
+                     topic, packed_news.included, packed_blogs.included,
+                     packed_news.tokens + packed_blogs.tokens)
+
+        return GenerationRequest(
+            mode="issue",
+            system_prompt=ISSUE_SYSTEM_PROMPT,
+            user_prompt=user_prompt,
+            max_tokens=ISSUE_MAX_TOKENS,
+            label=topic,
         )
 
-        logger.info("이슈 정리글 생성 요청: %s (뉴스 %d건, 블로그 참조 %d건)",
-                     topic, len(news_articles), len(blog_refs))
-
-        # ── 4단계: GPT 호출 ──
-        try:
-            response = self.client.chat.completions.create(
-                model=Config.GPT_MODEL,
-                max_completion_tokens=ISSUE_MAX_TOKENS,
-                reasoning_effort=Config.GPT_REASONING_EFFORT,
-                messages=[
-                    {"role": "system", "content": ISSUE_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-            )
-        except Exception as e:
-            logger.error("GPT API 호출 실패: %s", e)
-            raise RuntimeError(f"GPT API 호출 실패: {e}") from e
+    def _collect_research(
+        self, topic: str, keywords: list[str] | None
+    ) -> tuple[list[dict], list[dict]]:
+        """뉴스·키워드·블로그 검색을 동시에 실행하고 결과를 병합합니다.
+
+        각 검색은 서로 독립적이므로 스레드 풀에서 한꺼번에 요청해
+        수집 시간을 검색 1회 왕복 수준으로 줄입니다.
+        병합 순서는 순차 실행과 같습니다: 주제 검색 결과 → 키워드 순서대로 추가 결과.
+
+        Returns:
+            (news_articles, blog_refs) 튜플
+        """
+        extra_keywords = (keywords or [])[:2]
+
+        logger.info("뉴스·블로그 자료 병렬 수집 중: %s", topic)
+        with ThreadPoolExecutor(max_workers=2 + len(extra_keywords)) as pool:
+            primary_future = pool.submit(fetch_news, topic, count=15)
+            # 키워드로 추가 검색 (다각적 자료 확보)
+            extra_futures = [pool.submit(fetch_news, kw, count=5) for kw in extra_keywords]
+            blog_future = pool.submit(fetch_blog_references, topic, count=5)
+
+            news_articles = list(primary_future.result())
+            # 중복 제거 (제목 기준)
+            existing_titles = {a["title"] for a in news_articles}
+            for future in extra_futures:
+                for a in future.result():
+                    if a["title"] not in existing_titles:
+                        news_articles.append(a)
+                        existing_titles.add(a["title"])
 
-        choice = response.choices[0]
-        if choice.finish_reason == "content_filter":
-            raise RuntimeError("GPT 콘텐츠 필터에 의해 응답이 차단되었습니다.")
-        if not choice.message.content:
-            raise RuntimeError("GPT 응답이 비어있습니다. 다시 시도해주세요.")
+            blog_refs = blog_future.result()
 
-        title, content = _parse_title_content(choice.message.content)
+        if not news_articles and Config.NEWS_STORE_FALLBACK_DAYS > 0:
+            # 오래된 기사가 최신 소식처럼 쓰이지 않도록 최근 기사만
+            since = (date.today() - timedelta(days=Config.NEWS_STORE_FALLBACK_DAYS)).isoformat()
+            news_articles = search_stored_news(topic, count=15, since=since)
+            if news_articles:
+                logger.warning(
+                    "실시간 뉴스를 받지 못해 저장된 기사 %d건(%s 이후)으로 작성합니다: %s",
+                    len(news_articles), since, topic,
+                )
 
-        logger.info("이슈 정리글 생성 완료: %s (%d자)", title, len(content))
-        return {"title": title, "content": content}
+        return news_articles, blog_refs
 
     def generate_trending_post(self) -> dict:
         """트렌드를 자동으로 분석해 지금 가장 조회수가 높을 이슈 정리글을 작성합니다.
@@ -2,6 +2,7 @@ import argparse
 import logging
 import os
 import sys
+import time
 
 from .config import Config
 from .ai_writer import AIWriter
@@ -9,7 +10,7 @@ from .issue_writer import IssueWriter
 from .opinion_writer import OpinionWriter
 from .naver_blog import NaverBlogClient
 from .post_saver import save_post
-from .scheduler import run_scheduler
+from .scheduler import read_topics, run_scheduler
 from .trend_finder import TrendFinder
 
 os.makedirs("logs", exist_ok=True)
@@ -58,7 +59,10 @@ def select_category_interactive() -> str:
 
 
 def write_and_publish(
-    topic: str, keywords: list[str] | None = None, category: str | None = None
+    topic: str,
+    keywords: list[str] | None = None,
+    category: str | None = None,
+    regenerate: bool = False,
 ) -> None:
     """블로그 글을 생성하고 네이버 블로그에 발행합니다."""
     writer = AIWriter()
@@ -68,7 +72,7 @@ def write_and_publish(
         category = select_category_interactive()
 
     print(f"\n글 생성 중: {topic}")
-    post = writer.generate_post(topic, keywords)
+    post = writer.generate_post(topic, keywords, force_regenerate=regenerate)
 
     print(f"제목: {post['title']}")
     print(f"본문 길이: {len(post['content'])}자")
@@ -82,14 +86,17 @@ def write_and_publish(
 
 
 def write_issue_and_publish(
-    topic: str, keywords: list[str] | None = None, category: str = ISSUE_CATEGORY
+    topic: str,
+    keywords: list[str] | None = None,
+    category: str = ISSUE_CATEGORY,
+    regenerate: bool = False,
 ) -> None:
     """이슈 정리글을 생성하고 네이버 블로그에 발행합니다."""
     writer = IssueWriter()
     blog_client = NaverBlogClient()
 
     print(f"\n[이슈 정리글] 생성 중: {topic}")
-    post = writer.generate_post(topic, keywords)
+    post = writer.generate_post(topic, keywords, force_regenerate=regenerate)
 
     print(f"제목: {post['title']}")
     print(f"본문 길이: {len(post['content'])}자")
@@ -139,6 +146,7 @@ def write_opinion_and_publish(
     thoughts: str,
     keywords: list[str] | None = None,
     category: str | None = None,
+    regenerate: bool = False,
 ) -> None:
     """개인 의견 글을 생성하고 네이버 블로그에 발행합니다."""
     writer = OpinionWriter()
@@ -148,7 +156,7 @@ def write_opinion_and_publish(
         category = select_category_interactive()
 
     print(f"\n[내 생각 정리글] 생성 중: {topic}")
-    post = writer.generate_post(topic, thoughts, keywords)
+    post = writer.generate_post(topic, thoughts, keywords, force_regenerate=regenerate)
 
     print(f"제목: {post['title']}")
     print(f"본문 길이: {len(post['content'])}자")
@@ -162,6 +170,77 @@ def write_opinion_and_publish(
     print(f"발행 완료: {result}")
 
 
+def run_batch(
+    topics_file: str, mode: str, backend: str | None = None, wait: bool = False
+) -> None:
+    """주제 목록을 배치로 제출(또는 기존 작업 확인)하고 결과를 저장합니다."""
+    from .batch_generator import BatchGenerator, get_backend, manifest_name
+
+    items = read_topics(topics_file, mode)
+    if not items:
+        print("유효한 주제가 없습니다.")
+        return
+
+    generator = BatchGenerator(mode, backend=get_backend(backend))
+    manifest = generator.load_or_submit(items, manifest_name(topics_file, mode))
+    if wait:
+        print(f"배치 완료 대기 중: {manifest['batch_id']}")
+        manifest = generator.wait(manifest)
+    else:
+        manifest = generator.refresh(manifest)
+
+    print(f"\n배치 작업: {manifest['batch_id']} ({manifest['status']})")
+    for entry in manifest["items"]:
+        if entry.get("file"):
+            print(f"  ✓ {entry['topic']} → {entry['file']}")
+        elif entry.get("error"):
+            print(f"  ✗ {entry['topic']}: {entry['error']}")
+        else:
+            print(f"  … {entry['topic']}")
+
+
+def print_stats(days: float = 7, group_by: str = "mode") -> None:
+    """GPT 호출 기록을 모드·모델·주제별로 요약해 출력합니다."""
+    from .telemetry import get_store
+
+    store = get_store()
+    if store is None:
+        print("TELEMETRY_ENABLED=false 로 호출 기록이 꺼져 있습니다.")
+        return
+
+    since = time.time() - days * 86400 if days > 0 else None
+    rows = store.summary(since, group_by)
+    period = f"최근 {days:g}일" if days > 0 else "전체 기간"
+    if not rows:
+        print(f"{period} GPT 호출 기록이 없습니다.")
+        return
+
+    def num(value, fmt="{:,.0f}"):
+        return "-" if value is None else fmt.format(value)
+
+    print(f"\n=== GPT 호출 요약 ({period}, {group_by}별, 비용 큰 순) ===")
+    header = (
+        f"{'구분':<16} {'호출':>5} {'실패':>4} {'캐시':>4} {'입력':>10} {'(캐시)':>10} "
+        f"{'출력':>9} {'(추론)':>9} {'시스템/사용자 평균':>18} {'평균초':>6} {'최대초':>6} "
+        f"{'첫응답':>6} {'비용$':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    total_cost = 0.0
+    for row in rows:
+        total_cost += row["cost"] or 0.0
+        prompt_parts = f"{num(row['system_tokens'])}/{num(row['user_tokens'])}"
+        print(
+            f"{str(row['key'])[:16]:<16} {row['calls']:>5} {row['failures']:>4} "
+            f"{row['cache_hits']:>4} {num(row['prompt_tokens']):>10} {num(row['cached_tokens']):>10} "
+            f"{num(row['completion_tokens']):>9} {num(row['reasoning_tokens']):>9} "
+            f"{prompt_parts:>18} {num(row['avg_seconds'], '{:.1f}'):>6} "
+            f"{num(row['max_seconds'], '{:.1f}'):>6} {num(row['avg_ttft'], '{:.1f}'):>6} "
+            f"{num(row['cost'], '{:.4f}'):>8}"
+        )
+    print(f"\n총 추정 비용: ${total_cost:.4f} (가격표에 없는 모델 제외)")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="자동 블로그 글 작성 및 네이버 블로그 업로드 프로그램"
@@ -177,6 +256,9 @@ def main() -> None:
     write_parser.add_argument(
         "-c", "--category", help="게시판(카테고리) 이름 (미입력 시 직접 선택)", default=None
     )
+    write_parser.add_argument(
+        "--regenerate", action="store_true", help="생성 캐시를 무시하고 글을 새로 생성"
+    )
 
     # issue 명령어 (이슈 정리글)
     issue_parser = subparsers.add_parser(
@@ -194,6 +276,9 @@ def main() -> None:
         help=f"게시판(카테고리) 이름 (기본값: {ISSUE_CATEGORY})",
         default=ISSUE_CATEGORY,
     )
+    issue_parser.add_argument(
+        "--regenerate", action="store_true", help="생성 캐시를 무시하고 글을 새로 생성"
+    )
 
     # opinion 명령어 (내 생각 정리글)
     opinion_parser = subparsers.add_parser(
@@ -210,6 +295,9 @@ def main() -> None:
     opinion_parser.add_argument(
         "-c", "--category", help="게시판(카테고리) 이름 (미입력 시 직접 선택)", default=None
     )
+    opinion_parser.add_argument(
+        "--regenerate", action="store_true", help="생성 캐시를 무시하고 글을 새로 생성"
+    )
 
     # auto 명령어 (자동 트렌드 분석 + 작성 + 발행)
     auto_parser = subparsers.add_parser(
@@ -237,6 +325,47 @@ def main() -> None:
         default="write",
         help="글쓰기 모드 선택 (기본값: write)",
     )
+    schedule_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="모든 주제를 배치 작업으로 미리 생성하고 실행 시각에는 발행만 함",
+    )
+    schedule_parser.add_argument(
+        "--regenerate", action="store_true", help="생성 캐시를 무시하고 매번 글을 새로 생성"
+    )
+
+    # batch 명령어 (예약 발행용 글 미리 생성)
+    batch_parser = subparsers.add_parser(
+        "batch", help="주제 목록을 배치 작업으로 제출하고 결과를 saved_posts/ 에 저장"
+    )
+    batch_parser.add_argument(
+        "topics_file", help="주제 목록 파일 경로 (schedule 명령과 같은 형식)"
+    )
+    batch_parser.add_argument(
+        "--mode",
+        choices=["issue", "opinion", "write"],
+        default="write",
+        help="글쓰기 모드 선택 (기본값: write)",
+    )
+    batch_parser.add_argument(
+        "--backend", choices=["openai", "local"], default=None,
+        help="배치 백엔드 (기본값: BATCH_BACKEND 설정)",
+    )
+    batch_parser.add_argument(
+        "--wait", action="store_true", help="배치가 끝날 때까지 기다림"
+    )
+
+    # stats 명령어 (GPT 호출 기록 요약)
+    stats_parser = subparsers.add_parser("stats", help="GPT 토큰·지연 시간·비용 요약")
+    stats_parser.add_argument(
+        "-d", "--days", type=float, default=7, help="최근 며칠 기록 (기본값: 7, 0이면 전체)"
+    )
+    stats_parser.add_argument(
+        "--by",
+        choices=["mode", "model", "label"],
+        default="mode",
+        help="묶는 기준 (기본값: mode, label은 주제별)",
+    )
 
     args = parser.parse_args()
 
@@ -246,7 +375,7 @@ def main() -> None:
             for e in errors:
                 print(f"[오류] {e}")
             sys.exit(1)
-        write_and_publish(args.topic, args.keywords, args.category)
+        write_and_publish(args.topic, args.keywords, args.category, args.regenerate)
 
     elif args.command == "issue":
         errors = Config.validate()
@@ -254,7 +383,7 @@ def main() -> None:
             for e in errors:
                 print(f"[오류] {e}")
             sys.exit(1)
-        write_issue_and_publish(args.topic, args.keywords, args.category)
+        write_issue_and_publish(args.topic, args.keywords, args.category, args.regenerate)
 
     elif args.command == "opinion":
         errors = Config.validate()
@@ -262,7 +391,9 @@ def main() -> None:
             for e in errors:
                 print(f"[오류] {e}")
             sys.exit(1)
-        write_opinion_and_publish(args.topic, args.thoughts, args.keywords, args.category)
+        write_opinion_and_publish(
+            args.topic, args.thoughts, args.keywords, args.category, args.regenerate
+        )
 
     elif args.command == "auto":
         errors = Config.validate()
@@ -278,7 +409,18 @@ def main() -> None:
             for e in errors:
                 print(f"[오류] {e}")
             sys.exit(1)
-        run_scheduler(args.topics_file, args.time, args.mode)
+        run_scheduler(args.topics_file, args.time, args.mode, args.batch, args.regenerate)
+
+    elif args.command == "batch":
+        errors = Config.validate()
+        if errors:
+            for e in errors:
+                print(f"[오류] {e}")
+            sys.exit(1)
+        run_batch(args.topics_file, args.mode, args.backend, args.wait)
+
+    elif args.command == "stats":
+        print_stats(args.days, args.by)
 
     else:
         parser.print_help()
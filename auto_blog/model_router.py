@@ -0,0 +1,182 @@
+"""작업별 GPT 모델 선택과 대체 모델 순서
+
+트렌드 JSON·글 개요처럼 짧은 작업은 빠르고 저렴한 모델(GPT_FAST_MODEL)로,
+본문 작성은 기본 모델(GPT_MODEL)로 보냅니다.
+각 작업에는 대체 모델 순서(GPT_FALLBACK_MODELS)가 붙어, 앞 모델이 실패하면 다음 모델로 다시 요청합니다.
+
+최근 응답 시간의 p95가 작업별 한도(GPT_P95_LIMITS)를 넘었거나 서킷이 열린 모델은
+순서의 뒤로 보냅니다. 응답 시간은 최근 15분 것만 보므로, 밀려난 모델도 시간이 지나면 다시 앞으로 옵니다.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+
+from .config import Config
+from .resilience import get_breaker
+
+logger = logging.getLogger(__name__)
+
+# p95 계산에 필요한 최소 표본 수
+_MIN_SAMPLES = 5
+
+_router: "ModelRouter | None" = None
+_router_key: tuple | None = None
+_router_lock = threading.Lock()
+
+
+class LatencyTracker:
+    """(모델, 작업)별 최근 응답 시간을 모아 p95를 계산하는 스레드 안전 기록기입니다.
+
+    Args:
+        window_seconds: 이 시간보다 오래된 표본은 버림
+        max_samples: 키별 최대 표본 수
+    """
+
+    def __init__(self, window_seconds: float = 900, max_samples: int = 100):
+        self.window_seconds = window_seconds
+        self.max_samples = max_samples
+        self._samples: dict[tuple[str, str], deque] = {}
+        self._lock = threading.Lock()
+
+    def add(self, model: str, mode: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.setdefault((model, mode), deque(maxlen=self.max_samples))
+            samples.append((time.monotonic(), seconds))
+
+    def p95(self, model: str, mode: str) -> float | None:
+        """최근 응답 시간의 95번째 백분위수. 표본이 부족하면 None."""
+        with self._lock:
+            values = self._recent(model, mode)
+        if len(values) < _MIN_SAMPLES:
+            return None
+        values.sort()
+        return values[math.ceil(0.95 * len(values)) - 1]
+
+    def snapshot(self) -> dict[str, dict[str, dict]]:
+        """{모델: {작업: {"samples", "p95"}}} 형태의 현재 상태."""
+        with self._lock:
+            keys = list(self._samples)
+        result: dict[str, dict[str, dict]] = {}
+        for model, mode in keys:
+            with self._lock:
+                count = len(self._recent(model, mode))
+            result.setdefault(model, {})[mode] = {
+                "samples": count, "p95": self.p95(model, mode),
+            }
+        return result
+
+    def _recent(self, model: str, mode: str) -> list[float]:
+        samples = self._samples.get((model, mode))
+        if not samples:
+            return []
+        cutoff = time.monotonic() - self.window_seconds
+        while samples and samples[0][0] < cutoff:
+            samples.popleft()
+        return [seconds for _, seconds in samples]
+
+
+class ModelRouter:
+    """작업(mode)별로 호출할 모델 순서를 정합니다.
+
+    Args:
+        model: 기본 모델 (본문 작성)
+        fast_model: 짧은 작업용 모델 (빈 문자열이면 기본 모델 사용)
+        fast_modes: fast_model 로 보낼 작업 목록 (예: {"trend", "outline"})
+        fallbacks: 실패 시 차례로 시도할 모델 목록
+        p95_limits: 작업별 p95 응답 시간 한도(초). 넘으면 그 모델을 순서 뒤로 보냄
+        tracker: 응답 시간 기록기
+    """
+
+    def __init__(
+        self,
+        model: str,
+        fast_model: str = "",
+        fast_modes: frozenset[str] = frozenset(),
+        fallbacks: tuple[str, ...] = (),
+        p95_limits: dict[str, float] | None = None,
+        tracker: LatencyTracker | None = None,
+    ):
+        self.model = model
+        self.fast_model = fast_model
+        self.fast_modes = fast_modes
+        self.fallbacks = fallbacks
+        self.p95_limits = dict(p95_limits or {})
+        self.tracker = tracker or LatencyTracker()
+
+    def primary(self, mode: str) -> str:
+        """작업의 기본 모델."""
+        if self.fast_model and mode in self.fast_modes:
+            return self.fast_model
+        return self.model
+
+    def candidates(self, mode: str) -> list[str]:
+        """호출할 모델 순서. 느리거나 서킷이 열린 모델은 뒤로 보냅니다 (순서 유지)."""
+        chain = []
+        # 빠른 모델이 실패하면 기본 모델로 대체
+        for name in (self.primary(mode), *self.fallbacks, self.model):
+            if name and name not in chain:
+                chain.append(name)
+        healthy = [m for m in chain if not self._degraded(m, mode)]
+        if healthy and healthy[0] != chain[0]:
+            logger.info("[%s] %s 대신 %s 우선 사용 (지연 또는 장애)", mode, chain[0], healthy[0])
+        return healthy + [m for m in chain if m not in healthy]
+
+    def observe(self, model: str, mode: str, seconds: float) -> None:
+        """정상 응답의 소요 시간을 기록합니다."""
+        self.tracker.add(model, mode, seconds)
+
+    def _degraded(self, model: str, mode: str) -> bool:
+        if get_breaker(f"openai:{model}").state == "open":
+            return True
+        limit = self.p95_limits.get(mode)
+        if not limit:
+            return False
+        p95 = self.tracker.p95(model, mode)
+        return p95 is not None and p95 > limit
+
+
+def _parse_list(value: str) -> tuple[str, ...]:
+    return tuple(v.strip() for v in value.split(",") if v.strip())
+
+
+def _parse_limits(value: str) -> dict[str, float]:
+    """"trend=30,issue=240" → {"trend": 30.0, "issue": 240.0} (잘못된 항목은 무시)."""
+    limits = {}
+    for item in _parse_list(value):
+        mode, _, seconds = item.partition("=")
+        try:
+            limits[mode.strip()] = float(seconds)
+        except ValueError:
+            logger.warning("GPT_P95_LIMITS 항목을 해석할 수 없습니다: %s", item)
+    return limits
+
+
+_tracker = LatencyTracker()
+
+
+def get_router() -> ModelRouter:
+    """프로세스 전역 모델 라우터를 반환합니다. 설정이 바뀌면 새로 만들되 응답 시간 기록은 유지합니다."""
+    global _router, _router_key
+
+    key = (
+        Config.GPT_MODEL,
+        Config.GPT_FAST_MODEL,
+        Config.GPT_FAST_MODES,
+        Config.GPT_FALLBACK_MODELS,
+        Config.GPT_P95_LIMITS,
+    )
+    with _router_lock:
+        if _router is None or _router_key != key:
+            _router = ModelRouter(
+                model=Config.GPT_MODEL,
+                fast_model=Config.GPT_FAST_MODEL,
+                fast_modes=frozenset(_parse_list(Config.GPT_FAST_MODES)),
+                fallbacks=_parse_list(Config.GPT_FALLBACK_MODELS),
+                p95_limits=_parse_limits(Config.GPT_P95_LIMITS),
+                tracker=_tracker,
+            )
+            _router_key = key
+        return _router
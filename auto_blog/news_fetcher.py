@@ -5,17 +5,56 @@
 """
 
 import html as html_lib
+import json
 import logging
+import math
 import re
-from datetime import datetime
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .config import Config
+from .config import APP_DIR, CACHE_DIR, Config
+from .context_packer import PackedContext, pack_items, rank_items
+from .rate_limiter import DailyQuota, QuotaExceededError, TokenBucket, parse_retry_after
+from .resilience import call_with_retry, default_policy
+from .response_cache import ResponseCache
+from .tokenizer import tokenize
 
 logger = logging.getLogger(__name__)
 
 _NAVER_API_BASE = "https://openapi.naver.com/v1/search"
+_NAVER_TIMEOUT = 10
+# 재시도를 포함한 검색 1건의 제한 시간 (초)
+_NAVER_DEADLINE = 30
+# 뉴스 검색 API 페이지 제한: display 최대 100, start 최대 1000
+_NEWS_PAGE_MAX = 100
+_NEWS_START_MAX = 1000
+# BM25 파라미터
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
+_session: requests.Session | None = None
+_session_key: tuple | None = None
+_session_lock = threading.Lock()
+
+_cache: ResponseCache | None = None
+_cache_key: tuple | None = None
+_cache_lock = threading.Lock()
+
+_limiter: TokenBucket | None = None
+_quota: DailyQuota | None = None
+_limiter_key: tuple | None = None
+_limiter_lock = threading.Lock()
+
+_store = None  # ArticleStore (지연 생성)
+_store_lock = threading.Lock()
 
 
 def _strip_html(text: str) -> str:
@@ -37,6 +76,183 @@ def _has_naver_api() -> bool:
     return bool(Config.NAVER_CLIENT_ID and Config.NAVER_CLIENT_SECRET)
 
 
+# ── HTTP 세션 (연결 풀 + keep-alive) ──────────────────────────────────────
+
+
+def _get_session() -> requests.Session:
+    """네이버 검색 API 전용 공유 세션을 반환합니다.
+
+    연결 풀과 keep-alive를 유지해 검색마다 TCP/TLS 핸드셰이크를 반복하지 않습니다.
+    인증 정보나 풀 크기가 바뀌면(Config.reload) 세션을 새로 만듭니다.
+    """
+    global _session, _session_key
+
+    headers = _naver_headers()
+    key = (
+        headers["X-Naver-Client-Id"],
+        headers["X-Naver-Client-Secret"],
+        Config.NAVER_HTTP_POOL_SIZE,
+    )
+    with _session_lock:
+        if _session is not None and _session_key == key:
+            return _session
+
+        if _session is not None:
+            _session.close()
+
+        pool_size = max(1, Config.NAVER_HTTP_POOL_SIZE)
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=pool_size),
+        )
+        session.headers.update(headers)
+        session.headers["Connection"] = "keep-alive"
+
+        _session, _session_key = session, key
+        logger.debug("네이버 검색 API 세션 생성 (풀 크기: %d)", pool_size)
+        return session
+
+
+def close_session() -> None:
+    """공유 세션의 연결을 모두 닫습니다. 다음 검색 시 다시 만들어집니다."""
+    global _session, _session_key
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session, _session_key = None, None
+
+
+# ── 검색 결과 캐시 ──────────────────────────────────────────────────────
+
+
+def _get_cache() -> ResponseCache | None:
+    """검색 응답 캐시를 반환합니다. SEARCH_CACHE_ENABLED가 꺼져 있으면 None.
+
+    캐시 설정이 바뀌면(Config.reload) 새로 만듭니다.
+    """
+    global _cache, _cache_key
+
+    if not Config.SEARCH_CACHE_ENABLED:
+        return None
+
+    key = (
+        Config.SEARCH_CACHE_MAX_ENTRIES,
+        Config.SEARCH_CACHE_NEWS_TTL,
+        Config.SEARCH_CACHE_BLOG_TTL,
+        Config.SEARCH_CACHE_PERSIST,
+    )
+    with _cache_lock:
+        if _cache is None or _cache_key != key:
+            if _cache is not None:
+                _cache.close()
+            _cache = ResponseCache(
+                max_entries=Config.SEARCH_CACHE_MAX_ENTRIES,
+                ttls={
+                    "news": Config.SEARCH_CACHE_NEWS_TTL,
+                    "blog": Config.SEARCH_CACHE_BLOG_TTL,
+                },
+                default_ttl=Config.SEARCH_CACHE_NEWS_TTL,
+                db_path=CACHE_DIR / "search_cache.db" if Config.SEARCH_CACHE_PERSIST else None,
+            )
+            _cache_key = key
+        return _cache
+
+
+def search_cache_stats() -> dict:
+    """검색 캐시 적중/미스 통계를 반환합니다. 캐시가 꺼져 있으면 빈 딕셔너리."""
+    cache = _get_cache()
+    return cache.stats() if cache is not None else {}
+
+
+# ── 호출 속도 제한 / 일일 호출량 ──────────────────────────────────────────
+
+
+def _get_limiter() -> tuple[TokenBucket, DailyQuota]:
+    """프로세스 전역 토큰 버킷과 일일 호출량 카운터를 반환합니다."""
+    global _limiter, _quota, _limiter_key
+
+    key = (Config.NAVER_RATE_PER_SEC, Config.NAVER_RATE_BURST, Config.NAVER_DAILY_QUOTA)
+    with _limiter_lock:
+        if _limiter is None or _limiter_key != key:
+            _limiter = TokenBucket(Config.NAVER_RATE_PER_SEC, Config.NAVER_RATE_BURST)
+            _quota = DailyQuota(Config.NAVER_DAILY_QUOTA, CACHE_DIR / "naver_quota.json")
+            _limiter_key = key
+        return _limiter, _quota
+
+
+def naver_quota_status() -> dict:
+    """네이버 검색 API 호출량 현황을 반환합니다.
+
+    Returns:
+        {"date", "used", "limit", "remaining", "rate_per_sec", "burst"}
+    """
+    limiter, quota = _get_limiter()
+    status = quota.status()
+    status["rate_per_sec"] = limiter.rate
+    status["burst"] = limiter.burst
+    return status
+
+
+def _naver_get(endpoint: str, params: dict) -> dict:
+    """네이버 검색 API를 호출하고 JSON 응답을 반환합니다.
+
+    (endpoint, query, display, sort, start) 가 같은 요청은 TTL 동안 캐시된 응답을 돌려줍니다.
+    실제 호출은 공유 세션을 사용하며, 토큰 버킷으로 호출 속도를 제한합니다.
+    일시적 오류(429, 5xx, 타임아웃)는 공용 재시도 정책으로 다시 시도하고
+    429 응답의 Retry-After 는 재시도 대기와 토큰 버킷 양쪽에 반영합니다.
+
+    Args:
+        endpoint: 검색 종류 ("news", "blog" 등)
+        params: 쿼리 파라미터
+
+    Raises:
+        requests.RequestException: 네트워크 오류 또는 HTTP 오류 응답
+        QuotaExceededError: 일일 호출 한도 소진
+        CircuitOpenError: 연속 실패로 엔드포인트가 일시 차단됨
+    """
+    cache = _get_cache()
+    cache_key = (
+        endpoint,
+        params.get("query"),
+        params.get("display"),
+        params.get("sort"),
+        params.get("start", 1),
+    )
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("검색 캐시 적중: %s '%s'", endpoint, params.get("query"))
+            return cached
+
+    limiter, quota = _get_limiter()
+
+    def call() -> dict:
+        if not quota.consume():
+            raise QuotaExceededError(
+                f"네이버 검색 API 일일 호출 한도({quota.limit}회)를 모두 사용했습니다."
+            )
+        limiter.acquire()
+        resp = _get_session().get(
+            f"{_NAVER_API_BASE}/{endpoint}.json",
+            params=params,
+            timeout=_NAVER_TIMEOUT,
+        )
+        if resp.status_code == 429:
+            # 다른 스레드의 호출도 함께 멈춤
+            limiter.pause(parse_retry_after(resp.headers.get("Retry-After")) or 1.0)
+        resp.raise_for_status()
+        return resp.json()
+
+    data = call_with_retry(
+        call, endpoint=f"naver:{endpoint}", policy=default_policy(_NAVER_DEADLINE)
+    )
+
+    if cache is not None:
+        cache.set(cache_key, data)
+    return data
+
+
 # ── 뉴스 검색 ─────────────────────────────────────────────────────────────
 
 
@@ -49,94 +265,327 @@ def fetch_news(topic: str, count: int = 15) -> list[dict]:
 
     Returns:
         [{"title", "description", "source", "link", "date"}] 형태의 리스트
+
+    API 키가 없거나 검색에 실패하면 빈 리스트를 반환합니다.
+    저장된 기사로 대체할지는 호출 측에서 정합니다 (search_stored_news 참고).
     """
     if not _has_naver_api():
         logger.warning("NAVER_CLIENT_ID/SECRET 미설정 → 뉴스 검색 건너뜀")
         return []
 
     try:
-        resp = requests.get(
-            f"{_NAVER_API_BASE}/news.json",
-            headers=_naver_headers(),
-            params={
-                "query": topic,
-                "display": min(count, 100),
-                "sort": "date",  # 최신순
-            },
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = _naver_get("news", {
+            "query": topic,
+            "display": min(count, 100),
+            "sort": "date",  # 최신순
+        })
+    except QuotaExceededError as e:
+        logger.error("뉴스 검색 중단: %s", e)
+        return []
     except Exception as e:
         logger.warning("뉴스 검색 실패: %s", e)
         return []
 
     articles = []
     for item in data.get("items", []):
-        title = _strip_html(item.get("title", ""))
-        desc = _strip_html(item.get("description", ""))
-        link = item.get("originallink") or item.get("link", "")
+        article = _normalize_news_item(item)
+        if article:
+            articles.append(article)
 
-        # 언론사 추출 (originallink 도메인에서)
-        source = _extract_source(link)
+    _store_articles(articles, topic)
+    logger.info("뉴스 검색 완료: '%s' → %d건", topic, len(articles))
+    return articles
 
-        # 날짜 파싱
-        raw_date = item.get("pubDate", "")
-        date_str = _parse_pub_date(raw_date)
 
-        if title:
-            articles.append({
-                "title": title,
-                "description": desc,
-                "source": source,
-                "link": link,
-                "date": date_str,
-            })
+def iter_news(
+    topic: str,
+    max_items: int = 300,
+    since: "date | str | None" = None,
+    page_size: int = _NEWS_PAGE_MAX,
+) -> Iterator[dict]:
+    """뉴스 검색 결과를 여러 페이지에 걸쳐 최신순으로 하나씩 반환합니다.
 
-    logger.info("뉴스 검색 완료: '%s' → %d건", topic, len(articles))
+    fetch_news의 100건 제한 없이 start 오프셋을 넘기며 페이지를 순회합니다.
+    호출자가 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청해 둡니다.
+
+    Args:
+        topic: 검색할 주제
+        max_items: 최대 반환 기사 수 (API 한계상 최대 약 1100건)
+        since: 이 날짜보다 오래된 기사가 나오면 중단 (date 또는 "YYYY-MM-DD")
+        page_size: 페이지당 요청 건수 (최대 100)
+
+    Yields:
+        {"title", "description", "source", "link", "date"} 형태의 기사 딕셔너리
+    """
+    if not _has_naver_api():
+        logger.warning("NAVER_CLIENT_ID/SECRET 미설정 → 뉴스 검색 건너뜀")
+        return
+
+    cutoff = since.isoformat() if isinstance(since, date) else since
+    page_size = max(1, min(page_size, _NEWS_PAGE_MAX))
+
+    def fetch_page(start: int) -> dict:
+        return _naver_get("news", {
+            "query": topic,
+            "display": page_size,
+            "start": start,
+            "sort": "date",  # 최신순 — 날짜 기준 조기 종료의 전제
+        })
+
+    yielded = 0
+    start = 1
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = pool.submit(fetch_page, start)
+        while future is not None:
+            try:
+                data = future.result()
+            except QuotaExceededError as e:
+                logger.error("뉴스 검색 중단: %s", e)
+                return
+            except Exception as e:
+                logger.warning("뉴스 검색 실패 (start=%d): %s", start, e)
+                return
+
+            items = data.get("items", [])
+            total = int(data.get("total", 0) or 0)
+
+            # 다음 페이지 미리 요청
+            start += page_size
+            has_next = (
+                len(items) == page_size
+                and start <= _NEWS_START_MAX
+                and (not total or start <= total)
+                and yielded + len(items) < max_items
+            )
+            future = pool.submit(fetch_page, start) if has_next else None
+
+            page = [a for a in map(_normalize_news_item, items) if a]
+            _store_articles(page, topic)
+            for article in page:
+                if cutoff and _is_iso_date(article["date"]) and article["date"] < cutoff:
+                    logger.debug("뉴스 페이지 순회 종료 (기준일 %s 이전 도달): '%s' → %d건",
+                                cutoff, topic, yielded)
+                    return
+                yield article
+                yielded += 1
+                if yielded >= max_items:
+                    return
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("뉴스 페이지 순회 완료: '%s' → %d건", topic, yielded)
+
+
+# ── 로컬 기사 저장소 ──────────────────────────────────────────────────────
+
+
+def _get_store():
+    """로컬 기사 저장소(ArticleStore)를 반환합니다. 꺼져 있거나 열 수 없으면 None."""
+    global _store
+
+    if not Config.ARTICLE_STORE_ENABLED:
+        return None
+    with _store_lock:
+        if _store is None:
+            from .article_store import ArticleStore
+            try:
+                _store = ArticleStore(CACHE_DIR / "articles.db")
+            except Exception as e:
+                logger.warning("기사 저장소를 열 수 없습니다: %s", e)
+                return None
+        return _store
+
+
+def _store_articles(articles: list[dict], query: str) -> None:
+    """수집한 기사를 로컬 저장소에 누적합니다 (실패해도 검색 결과에는 영향 없음)."""
+    store = _get_store()
+    if store is None or not articles:
+        return
+    try:
+        store.upsert(articles, query)
+    except Exception as e:
+        logger.warning("기사 저장 실패: %s", e)
+
+
+def search_stored_news(topic: str, count: int = 15, since: str | None = None) -> list[dict]:
+    """네트워크 없이 로컬 저장소에서 주제 관련 기사를 찾습니다.
+
+    Args:
+        topic: 검색할 주제
+        count: 최대 기사 수
+        since: 이 날짜("YYYY-MM-DD") 이후 기사만
+
+    Returns:
+        fetch_news와 같은 형식의 리스트 (저장소가 꺼져 있으면 빈 리스트)
+    """
+    store = _get_store()
+    if store is None:
+        return []
+    try:
+        articles = store.search(topic, limit=count, since=since)
+    except Exception as e:
+        logger.warning("저장된 기사 검색 실패: %s", e)
+        return []
+    if articles:
+        logger.info("저장된 기사 사용: '%s' → %d건", topic, len(articles))
     return articles
 
 
-def _extract_source(url: str) -> str:
-    """URL에서 언론사 이름을 추출합니다."""
-    source_map = {
-        "chosun.com": "조선일보",
-        "joongang.co.kr": "중앙일보",
-        "donga.com": "동아일보",
-        "hani.co.kr": "한겨레",
-        "khan.co.kr": "경향신문",
-        "hankyung.com": "한국경제",
-        "mk.co.kr": "매일경제",
-        "sedaily.com": "서울경제",
-        "yna.co.kr": "연합뉴스",
-        "ytn.co.kr": "YTN",
-        "sbs.co.kr": "SBS",
-        "kbs.co.kr": "KBS",
-        "mbc.co.kr": "MBC",
-        "jtbc.co.kr": "JTBC",
-        "news1.kr": "뉴스1",
-        "newsis.com": "뉴시스",
-        "edaily.co.kr": "이데일리",
-        "mt.co.kr": "머니투데이",
-        "hankookilbo.com": "한국일보",
-        "munhwa.com": "문화일보",
-        "bbc.com": "BBC",
-        "bbc.co.uk": "BBC",
-        "cnn.com": "CNN",
-        "reuters.com": "Reuters",
-        "apnews.com": "AP",
-        "nhk.or.jp": "NHK",
-        "nytimes.com": "NYT",
-        "washingtonpost.com": "Washington Post",
-        "bloomberg.com": "Bloomberg",
+def _normalize_news_item(item: dict) -> dict | None:
+    """검색 API 응답 항목을 기사 딕셔너리로 변환합니다. 제목이 없으면 None."""
+    title = _strip_html(item.get("title", ""))
+    if not title:
+        return None
+
+    desc = _strip_html(item.get("description", ""))
+    link = item.get("originallink") or item.get("link", "")
+
+    return {
+        "title": title,
+        "description": desc,
+        # 언론사 추출 (originallink 도메인에서)
+        "source": _extract_source(link),
+        "link": link,
+        # 날짜 파싱
+        "date": _parse_pub_date(item.get("pubDate", "")),
     }
-    url_lower = url.lower()
-    for domain, name in source_map.items():
-        if domain in url_lower:
+
+
+def _is_iso_date(value: str) -> bool:
+    return bool(re.fullmatch(r"\d{4}-\d{2}-\d{2}", value))
+
+
+# ── 언론사 판별 ──────────────────────────────────────────────────────────
+
+# 기본 도메인 → 언론사 매핑. news_sources.json 으로 추가·덮어쓰기 가능
+_SOURCE_MAP = {
+    "chosun.com": "조선일보",
+    "joongang.co.kr": "중앙일보",
+    "donga.com": "동아일보",
+    "hani.co.kr": "한겨레",
+    "khan.co.kr": "경향신문",
+    "hankyung.com": "한국경제",
+    "mk.co.kr": "매일경제",
+    "sedaily.com": "서울경제",
+    "yna.co.kr": "연합뉴스",
+    "ytn.co.kr": "YTN",
+    "sbs.co.kr": "SBS",
+    "kbs.co.kr": "KBS",
+    "mbc.co.kr": "MBC",
+    "jtbc.co.kr": "JTBC",
+    "news1.kr": "뉴스1",
+    "newsis.com": "뉴시스",
+    "edaily.co.kr": "이데일리",
+    "mt.co.kr": "머니투데이",
+    "hankookilbo.com": "한국일보",
+    "munhwa.com": "문화일보",
+    "bbc.com": "BBC",
+    "bbc.co.uk": "BBC",
+    "cnn.com": "CNN",
+    "reuters.com": "Reuters",
+    "apnews.com": "AP",
+    "nhk.or.jp": "NHK",
+    "nytimes.com": "NYT",
+    "washingtonpost.com": "Washington Post",
+    "bloomberg.com": "Bloomberg",
+}
+
+# 정규화된 도메인 → 언론사 이름. 언론사 목록 파일 경로·수정 시각이 바뀌면 다시 만듦
+_source_index: dict[str, str] | None = None
+_source_index_key: tuple | None = None
+_source_lock = threading.Lock()
+# load_news_sources 로 직접 추가한 매핑 (색인을 다시 만들어도 유지)
+_extra_sources: dict[str, str] = {}
+
+
+def load_news_sources(path: "Path | str") -> int:
+    """JSON 파일의 {"도메인": "언론사"} 매핑을 언론사 색인에 추가합니다.
+
+    Returns:
+        추가(또는 갱신)된 도메인 수
+    """
+    mapping = _read_news_sources(path)
+    with _source_lock:
+        _extra_sources.update(mapping)
+        if _source_index is not None:
+            _source_index.update(mapping)
+    return len(mapping)
+
+
+def _read_news_sources(path: "Path | str") -> dict[str, str]:
+    """언론사 목록 파일을 읽어 {정규화된 도메인: 언론사} 로 반환합니다. 실패하면 빈 딕셔너리."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning("언론사 목록 파일을 읽을 수 없습니다: %s (%s)", path, e)
+        return {}
+    if not isinstance(data, dict):
+        logger.warning("언론사 목록 파일 형식 오류 ({\"도메인\": \"언론사\"} 필요): %s", path)
+        return {}
+
+    mapping = {}
+    for domain, name in data.items():
+        domain = _normalize_host(str(domain))
+        if domain and name:
+            mapping[domain] = str(name)
+    logger.debug("언론사 목록 %d건 로드: %s", len(mapping), path)
+    return mapping
+
+
+def _get_source_index() -> dict[str, str]:
+    """기본 매핑 + 언론사 목록 파일(NEWS_SOURCES_FILE)로 만든 색인을 반환합니다.
+
+    설정(Config.reload) 또는 파일 내용이 바뀌면 다음 조회 때 새로 만듭니다.
+    """
+    global _source_index, _source_index_key
+
+    sources_file = Path(Config.NEWS_SOURCES_FILE) if Config.NEWS_SOURCES_FILE else (
+        APP_DIR / "news_sources.json"
+    )
+    try:
+        mtime = sources_file.stat().st_mtime
+    except OSError:
+        mtime = None
+    key = (str(sources_file), mtime)
+
+    with _source_lock:
+        if _source_index is None or _source_index_key != key:
+            index = {_normalize_host(domain): name for domain, name in _SOURCE_MAP.items()}
+            if mtime is not None:
+                index.update(_read_news_sources(sources_file))
+            index.update(_extra_sources)
+            _source_index = index
+            _source_index_key = key
+        return _source_index
+
+
+def _normalize_host(host: str) -> str:
+    host = host.strip().lower().rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+def _extract_source(url: str) -> str:
+    """URL에서 언론사 이름을 추출합니다.
+
+    호스트명을 파싱한 뒤 "news.mk.co.kr" → "mk.co.kr" → "co.kr" 순으로
+    상위 도메인을 따라가며 색인을 조회합니다 (라벨 경계 단위 일치).
+    """
+    try:
+        host = urlsplit(url.strip()).hostname or ""
+    except ValueError:
+        host = ""
+    host = _normalize_host(host)
+    if not host:
+        return "기타"
+
+    index = _get_source_index()
+    labels = host.split(".")
+    for i in range(len(labels) - 1):
+        name = index.get(".".join(labels[i:]))
+        if name:
             return name
-    # 도메인 추출 fallback
-    m = re.search(r"https?://(?:www\.)?([^/]+)", url)
-    return m.group(1) if m else "기타"
+    # 도메인 fallback
+    return host
 
 
 def _parse_pub_date(raw: str) -> str:
@@ -168,18 +617,14 @@ def fetch_blog_references(topic: str, count: int = 5) -> list[dict]:
         return []
 
     try:
-        resp = requests.get(
-            f"{_NAVER_API_BASE}/blog.json",
-            headers=_naver_headers(),
-            params={
-                "query": topic,
-                "display": min(count, 20),
-                "sort": "sim",  # 관련도순 (인기 글이 상단)
-            },
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = _naver_get("blog", {
+            "query": topic,
+            "display": min(count, 20),
+            "sort": "sim",  # 관련도순 (인기 글이 상단)
+        })
+    except QuotaExceededError as e:
+        logger.error("블로그 검색 중단: %s", e)
+        return []
     except Exception as e:
         logger.warning("블로그 검색 실패: %s", e)
         return []
@@ -203,21 +648,93 @@ def fetch_blog_references(topic: str, count: int = 5) -> list[dict]:
     return blogs
 
 
+# ── 관련도 정렬 (BM25) ───────────────────────────────────────────────────
+
+
+def bm25_scores(items: list[dict], query_terms: list[str]) -> list[float]:
+    """제목+설명을 문서로 보고 검색어에 대한 BM25 점수를 계산합니다."""
+    if not items:
+        return []
+    query = set(tokenize(" ".join(query_terms)))
+    docs = [
+        Counter(tokenize(f"{it.get('title', '')} {it.get('description', '')}"))
+        for it in items
+    ]
+    n = len(docs)
+    avg_len = sum(sum(d.values()) for d in docs) / n or 1.0
+    df = Counter(t for d in docs for t in query if t in d)
+
+    scores = []
+    for d in docs:
+        length = sum(d.values())
+        score = 0.0
+        for t in query:
+            tf = d.get(t, 0)
+            if not tf:
+                continue
+            idf = math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5))
+            norm = tf + _BM25_K1 * (1 - _BM25_B + _BM25_B * length / avg_len)
+            score += idf * tf * (_BM25_K1 + 1) / norm
+        scores.append(score)
+    return scores
+
+
+def rank_articles(
+    articles: list[dict],
+    topic: str,
+    keywords: list[str] | None = None,
+    top_k: int | None = None,
+) -> list[dict]:
+    """주제·키워드에 대한 BM25 점수 내림차순으로 정렬해 상위 top_k건을 반환합니다.
+
+    동점이면 원래 순서(최신순)를 유지합니다.
+    """
+    scores = bm25_scores(articles, [topic, *(keywords or [])])
+    order = sorted(range(len(articles)), key=lambda i: -scores[i])
+    ranked = [articles[i] for i in order]
+    if top_k is not None and len(ranked) > top_k:
+        logger.info("관련도 상위 %d건 선택 (전체 %d건)", top_k, len(ranked))
+        ranked = ranked[:top_k]
+    return ranked
+
+
 # ── GPT 프롬프트용 컨텍스트 포맷 ──────────────────────────────────────────
 
 
+def _news_header(count: int) -> str:
+    return f"━━ 실제 뉴스 자료 ({count}건) ━━"
+
+
+def _render_news_entry(i: int, a: dict) -> str:
+    entry = (
+        f"\n[기사 {i}] ({a['source']}, {a['date']})\n"
+        f"제목: {a['title']}\n"
+        f"내용: {a['description']}"
+    )
+    if a.get("related_sources"):
+        entry += f"\n같은 내용 보도: {', '.join(a['related_sources'])}"
+    return entry
+
+
+def _blog_header(count: int) -> str:
+    return f"━━ 참고 블로그 글 ({count}건) ━━"
+
+
+def _render_blog_entry(i: int, b: dict) -> str:
+    return (
+        f"\n[블로그 {i}] {b['title']}\n"
+        f"내용 요약: {b['description']}"
+    )
+
+
 def format_news_context(articles: list[dict]) -> str:
     """수집된 뉴스 기사를 GPT 프롬프트에 포함할 텍스트로 포맷합니다."""
     if not articles:
         return ""
 
-    lines = [f"━━ 실제 뉴스 자료 ({len(articles)}건) ━━"]
+    lines = [_news_header(len(articles))]
     for i, a in enumerate(articles, 1):
-        lines.append(
-            f"\n[기사 {i}] ({a['source']}, {a['date']})\n"
-            f"제목: {a['title']}\n"
-            f"내용: {a['description']}"
-        )
+        lines.append(_render_news_entry(i, a))
     return "\n".join(lines)
 
 
@@ -226,10 +743,55 @@ def format_blog_context(blogs: list[dict]) -> str:
     if not blogs:
         return ""
 
-    lines = [f"━━ 참고 블로그 글 ({len(blogs)}건) ━━"]
+    lines = [_blog_header(len(blogs))]
     for i, b in enumerate(blogs, 1):
-        lines.append(
-            f"\n[블로그 {i}] {b['title']}\n"
-            f"내용 요약: {b['description']}"
-        )
+        lines.append(_render_blog_entry(i, b))
     return "\n".join(lines)
+
+
+def pack_news_context(
+    articles: list[dict],
+    token_budget: int,
+    topic: str = "",
+    keywords: list[str] | None = None,
+) -> PackedContext:
+    """뉴스 기사를 관련도·최신순으로 정렬해 토큰 예산 안에서 포맷합니다.
+
+    Args:
+        articles: 수집된 기사 목록
+        token_budget: 컨텍스트 최대 토큰 수 (Config.GPT_MODEL 토크나이저 기준)
+        topic: 관련도 계산에 사용할 주제
+        keywords: 관련도 계산에 사용할 SEO 키워드
+
+    Returns:
+        PackedContext(text, tokens, included, total, trimmed)
+    """
+    query_terms = [topic, *(keywords or [])]
+    ranked = rank_items(articles, bm25_scores(articles, query_terms))
+    packed = pack_items(
+        ranked, _render_news_entry, _news_header, token_budget, model=Config.GPT_MODEL
+    )
+    logger.info(
+        "뉴스 컨텍스트: %d/%d건, %d/%d 토큰 (설명 축약 %d건)",
+        packed.included, packed.total, packed.tokens, token_budget, packed.trimmed,
+    )
+    return packed
+
+
+def pack_blog_context(
+    blogs: list[dict],
+    token_budget: int,
+    topic: str = "",
+    keywords: list[str] | None = None,
+) -> PackedContext:
+    """블로그 글을 관련도·최신순으로 정렬해 토큰 예산 안에서 포맷합니다."""
+    query_terms = [topic, *(keywords or [])]
+    ranked = rank_items(blogs, bm25_scores(blogs, query_terms))
+    packed = pack_items(
+        ranked, _render_blog_entry, _blog_header, token_budget, model=Config.GPT_MODEL
+    )
+    logger.info(
+        "블로그 컨텍스트: %d/%d건, %d/%d 토큰 (설명 축약 %d건)",
+        packed.included, packed.total, packed.tokens, token_budget, packed.trimmed,
+    )
+    return packed
@@ -0,0 +1,96 @@
+"""프로세스 전역 OpenAI 클라이언트
+
+글을 생성할 때마다 OpenAI 클라이언트를 새로 만들면 연결 풀과 TLS 세션이 버려져
+매 호출마다 핸드셰이크를 다시 합니다. 하나의 httpx 연결 풀을 공유하는 클라이언트를
+지연 생성해 재사용하고, 관련 설정이 바뀌면(Config.reload) 새로 만듭니다.
+
+h2 패키지가 설치되어 있으면 HTTP/2로 한 연결에서 여러 요청을 동시에 보냅니다.
+"""
+
+import logging
+import threading
+
+import httpx
+from openai import OpenAI
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+_client: OpenAI | None = None
+_client_key: tuple | None = None
+_client_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_http_client() -> httpx.Client:
+    pool_size = max(1, Config.OPENAI_POOL_SIZE)
+    http2 = Config.OPENAI_HTTP2 and _http2_available()
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=120,
+        ),
+        # 연결은 빨리 실패하고, 응답은 긴 글 생성 시간을 기다림
+        timeout=httpx.Timeout(
+            Config.OPENAI_READ_TIMEOUT,
+            connect=Config.OPENAI_CONNECT_TIMEOUT,
+        ),
+    )
+
+
+def get_client() -> OpenAI:
+    """공유 OpenAI 클라이언트를 반환합니다.
+
+    API 키, 접속 주소, 연결 풀·타임아웃 설정이 바뀌었으면 기존 클라이언트를 닫고 새로 만듭니다.
+    """
+    global _client, _client_key
+
+    key = (
+        Config.OPENAI_API_KEY,
+        Config.OPENAI_BASE_URL,
+        Config.OPENAI_POOL_SIZE,
+        Config.OPENAI_CONNECT_TIMEOUT,
+        Config.OPENAI_READ_TIMEOUT,
+        Config.OPENAI_HTTP2,
+    )
+    with _client_lock:
+        if _client is not None and _client_key == key:
+            return _client
+
+        if _client is not None:
+            _client.close()
+
+        http_client = _build_http_client()
+        _client = OpenAI(
+            api_key=Config.OPENAI_API_KEY,
+            base_url=Config.OPENAI_BASE_URL or None,
+            # 재시도는 call_with_retry 에서 처리하므로 SDK 자체 재시도는 끔
+            max_retries=0,
+            http_client=http_client,
+        )
+        _client_key = key
+        logger.debug(
+            "OpenAI 클라이언트 생성 (풀 크기: %d, HTTP/2: %s)",
+            max(1, Config.OPENAI_POOL_SIZE),
+            "사용" if Config.OPENAI_HTTP2 and _http2_available() else "미사용",
+        )
+        return _client
+
+
+def close_client() -> None:
+    """공유 클라이언트의 연결을 모두 닫습니다. 다음 호출 시 다시 만들어집니다."""
+    global _client, _client_key
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client, _client_key = None, None
@@ -5,12 +5,12 @@
 """
 
 import logging
+from collections.abc import Iterator
 
-from openai import OpenAI
-
-from .ai_writer import _parse_title_content
 from .config import Config
-from .news_fetcher import fetch_blog_references, format_blog_context
+from .html_renderer import render_html
+from .news_fetcher import fetch_blog_references, pack_blog_context
+from .writer_engine import GenerationEngine, GenerationRequest, StreamEvent, get_engine
 
 logger = logging.getLogger(__name__)
 
@@ -45,30 +45,15 @@ OPINION_SYSTEM_PROMPT = """당신은 개인 블로그 글쓰기를 도와주는
 4. 결론 — 핵심 메시지 + 독자에게 여운을 남기는 마무리
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-■ HTML 포맷 규칙
+■ HTML 포맷 규칙 (스타일은 자동 적용)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+style 속성과 CSS는 절대 쓰지 마세요. 아래 태그와 class만 사용하면 발행 시 서식이 자동으로 입혀집니다.
 
-[섹션 헤더]
-<h2 style="font-size:20px;font-weight:bold;border-left:5px solid #8E44AD;padding-left:13px;margin:32px 0 14px;color:#4A235A;">✍️ 소제목</h2>
-
-[일반 단락]
-<p style="line-height:1.95;margin-bottom:14px;color:#333;">내용</p>
-
-[핵심 생각 강조 박스]
-<div style="background:#F5EEF8;border:1px solid #D2B4DE;border-radius:6px;padding:14px 18px;margin:16px 0;">
-💭 <strong>내 생각:</strong> 핵심 의견
-</div>
-
-[경험 인용]
-<blockquote style="border-left:4px solid #8E44AD;background:#F9F5FC;padding:13px 18px;margin:16px 0;color:#555;font-style:italic;border-radius:0 6px 6px 0;">
-개인 경험이나 에피소드
-</blockquote>
-
-[마무리 박스]
-<div style="background:#F4F6F7;border-radius:8px;padding:20px 24px;margin:32px 0 0;text-align:center;border:1px solid #EAECEE;">
-<p style="margin:0 0 6px;font-weight:bold;color:#2C3E50;">여러분의 생각은 어떠신가요? 😊</p>
-<p style="margin:0;color:#666;font-size:14px;">댓글로 의견 남겨주시면 감사하겠습니다!</p>
-</div>
+• 섹션 헤더: <h2>✍️ 소제목</h2>
+• 일반 단락: <p>내용</p>
+• 경험 인용: <blockquote>개인 경험이나 에피소드</blockquote>
+• 핵심 생각 강조 박스: <div class="my-thought">핵심 의견</div>
+• 마무리 박스 (글 최하단): <div class="cta"></div>   ← 문구 자동 삽입
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 ■ SEO & 가독성
@@ -77,6 +62,13 @@ OPINION_SYSTEM_PROMPT = """당신은 개인 블로그 글쓰기를 도와주는
 • 글 길이: 1500~3000자
 • 제목: 40자 이내, 개인적 시각이 드러나는 제목
 
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+■ 제공 자료 사용 방법
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+사용자 메시지에는 "참고 블로그 글"(있는 경우)과 "작성 요청"(주제·내 생각·키워드)이 차례로 주어집니다.
+• "참고 블로그 글"은 같은 주제의 인기 글입니다. 톤·구성·표현 방식만 참고합니다.
+• "내 생각 및 핵심 포인트"를 중심으로 내 목소리가 살아있는 블로그 글을 작성합니다.
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 ■ 출력 형식
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -88,10 +80,16 @@ OPINION_SYSTEM_PROMPT = """당신은 개인 블로그 글쓰기를 도와주는
 class OpinionWriter:
     """사용자의 생각을 바탕으로 개인 의견 블로그 글을 생성합니다."""
 
-    def __init__(self):
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    def __init__(self, engine: GenerationEngine | None = None):
+        self.engine = engine or get_engine()
 
-    def generate_post(self, topic: str, thoughts: str, keywords: list[str] | None = None) -> dict:
+    def generate_post(
+        self,
+        topic: str,
+        thoughts: str,
+        keywords: list[str] | None = None,
+        force_regenerate: bool = False,
+    ) -> dict:
         """사용자의 생각을 바탕으로 의견 글을 생성합니다.
 
         1) 네이버 블로그 검색으로 인기 글 스타일 참고
@@ -101,54 +99,70 @@ class OpinionWriter:
             topic: 글의 주제
             thoughts: 사용자의 핵심 생각, 경험, 의견
             keywords: SEO 키워드 목록 (선택사항)
+            force_regenerate: True면 생성 캐시를 무시하고 GPT로 새로 생성
 
         Returns:
             {"title": str, "content": str} 형태의 딕셔너리
         """
+        request = self.build_request(topic, thoughts, keywords)
+        post = self.engine.generate(request, force_regenerate)
+        post["content"] = render_html(post["content"], "opinion")
+
+        logger.info("개인 의견 글 생성 완료: %s (%d자)", post["title"], len(post["content"]))
+        return post
+
+    def generate_post_stream(
+        self,
+        topic: str,
+        thoughts: str,
+        keywords: list[str] | None = None,
+        force_regenerate: bool = False,
+    ) -> Iterator[StreamEvent]:
+        """generate_post 의 스트리밍 버전입니다.
+
+        GPT 응답을 도착하는 대로 "title" / "content" 이벤트로 내보내고,
+        마지막 "done" 이벤트의 post 에 스타일을 적용한 {"title", "content"} 를 담습니다.
+        "content" 조각은 스타일 적용 전의 시맨틱 마크업입니다.
+        제목이 먼저 도착해야 하므로 항상 일반 텍스트로 요청합니다
+        (GPT_STRUCTURED_OUTPUT 의 summary·keywords·tags 는 없음).
+        """
+        request = self.build_request(topic, thoughts, keywords)
+        for event in self.engine.stream(request, force_regenerate):
+            if event.kind == "done":
+                event = event._replace(
+                    post={**event.post, "content": render_html(event.post["content"], "opinion")}
+                )
+                logger.info("개인 의견 글 생성 완료: %s (%d자)",
+                            event.post["title"], len(event.post["content"]))
+            yield event
+
+    def build_request(
+        self, topic: str, thoughts: str, keywords: list[str] | None = None
+    ) -> GenerationRequest:
+        """블로그 스타일 참조를 수집해 의견 글 프롬프트를 구성합니다."""
         # ── 1단계: 블로그 스타일 참조 ──
         logger.info("블로그 스타일 참조 수집 중: %s", topic)
         blog_refs = fetch_blog_references(topic, count=5)
-        blog_context = format_blog_context(blog_refs)
+        blog_context = pack_blog_context(
+            blog_refs, Config.BLOG_CONTEXT_TOKEN_BUDGET, topic, keywords
+        ).text
 
         # ── 2단계: GPT 프롬프트 구성 ──
-        user_prompt = f"주제: {topic}\n\n내 생각 및 핵심 포인트:\n{thoughts}"
+        # 지시문은 모두 시스템 프롬프트(고정 접두부)에 있고, 여기에는 가변 자료만 넣음
+        sections = [blog_context] if blog_context else []
+        request_text = f"━━ 작성 요청 ━━\n주제: {topic}\n\n내 생각 및 핵심 포인트:\n{thoughts}"
         if keywords:
-            user_prompt += f"\n\n포함할 키워드: {', '.join(keywords)}"
-
-        if blog_context:
-            user_prompt += (
-                "\n\n아래는 같은 주제의 인기 블로그 글입니다. "
-                "글의 톤·구성·표현 방식을 참고해서 작성해주세요.\n\n"
-                f"{blog_context}"
-            )
-
-        user_prompt += "\n\n위 내용을 바탕으로 내 목소리가 살아있는 블로그 글을 작성해주세요."
+            request_text += f"\n\n포함할 키워드: {', '.join(keywords)}"
+        sections.append(request_text)
+        user_prompt = "\n\n".join(sections)
 
         logger.info("개인 의견 글 생성 요청: %s (블로그 참조 %d건)",
                      topic, len(blog_refs))
 
-        # ── 3단계: GPT 호출 ──
-        try:
-            response = self.client.chat.completions.create(
-                model=Config.GPT_MODEL,
-                max_completion_tokens=Config.GPT_MAX_COMPLETION_TOKENS,
-                reasoning_effort=Config.GPT_REASONING_EFFORT,
-                messages=[
-                    {"role": "system", "content": OPINION_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-            )
-        except Exception as e:
-            logger.error("GPT API 호출 실패: %s", e)
-            raise RuntimeError(f"GPT API 호출 실패: {e}") from e
-
-        choice = response.choices[0]
-        if choice.finish_reason == "content_filter":
-            raise RuntimeError("GPT 콘텐츠 필터에 의해 응답이 차단되었습니다.")
-        if not choice.message.content:
-            raise RuntimeError("GPT 응답이 비어있습니다. 다시 시도해주세요.")
-
-        title, content = _parse_title_content(choice.message.content)
-
-        logger.info("개인 의견 글 생성 완료: %s (%d자)", title, len(content))
-        return {"title": title, "content": content}
+        return GenerationRequest(
+            mode="opinion",
+            system_prompt=OPINION_SYSTEM_PROMPT,
+            user_prompt=user_prompt,
+            max_tokens=Config.GPT_MAX_COMPLETION_TOKENS,
+            label=topic,
+        )
@@ -26,6 +26,7 @@ SAVE_DIR = _get_save_dir()
 def save_post(title: str, content: str) -> Path:
     """글을 로컬 HTML 파일로 저장하고 경로를 반환합니다.
 
+    같은 초에 같은 제목으로 저장하면 기존 파일을 덮어쓰지 않고 "_2", "_3" 을 붙입니다.
     저장 실패 시 RuntimeError를 발생시킵니다.
     """
     try:
@@ -42,8 +43,7 @@ def save_post(title: str, content: str) -> Path:
     if not safe_title:
         safe_title = "untitled"
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{safe_title}.html"
-    file_path = SAVE_DIR / filename
+    stem = f"{timestamp}_{safe_title}"
 
     html_doc = (
         "<!DOCTYPE html>\n<html lang='ko'>\n<head>\n"
@@ -55,12 +55,21 @@ def save_post(title: str, content: str) -> Path:
         "</body>\n</html>"
     )
 
-    try:
-        file_path.write_text(html_doc, encoding="utf-8")
-    except OSError as e:
-        raise RuntimeError(
-            f"파일 저장 실패: {file_path}\n원인: {e}"
-        ) from e
+    file_path = SAVE_DIR / f"{stem}.html"
+    suffix = 2
+    while True:
+        try:
+            # "x": 이미 있으면 FileExistsError (동시에 저장하는 스레드끼리도 덮어쓰지 않음)
+            with file_path.open("x", encoding="utf-8") as f:
+                f.write(html_doc)
+            break
+        except FileExistsError:
+            file_path = SAVE_DIR / f"{stem}_{suffix}.html"
+            suffix += 1
+        except OSError as e:
+            raise RuntimeError(
+                f"파일 저장 실패: {file_path}\n원인: {e}"
+            ) from e
 
     logger.info("글 로컬 저장 완료: %s  (%d bytes)", file_path, file_path.stat().st_size)
     return file_path
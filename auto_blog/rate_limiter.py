@@ -0,0 +1,316 @@
+"""외부 API 호출 속도 제한 및 일일 호출량 관리
+
+네이버 검색 API는 초당 호출 수와 일일 호출 한도(기본 25,000회)가 있습니다.
+병렬 검색 시 한도를 넘겨 429 오류가 쏟아지지 않도록
+프로세스 전역 토큰 버킷과 파일에 저장되는 일일 카운터를 제공합니다.
+
+OpenAI API는 계정별 분당 토큰(TPM) 한도가 있고 허용 동시 호출 수가 드러나지 않으므로,
+429와 응답 지연을 보고 동시 호출 수를 조절하는 AIMD 제한기(AdaptiveLimiter)를 제공합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaExceededError(RuntimeError):
+    """일일 호출 한도를 모두 사용했을 때 발생합니다."""
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 속도 제한기입니다.
+
+    Args:
+        rate: 초당 보충되는 토큰 수 (= 평균 허용 호출 수/초)
+        burst: 버킷 최대 용량 (= 순간적으로 허용되는 연속 호출 수)
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 0.001)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """토큰 하나를 얻을 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간(초). None이면 무한 대기
+
+        Returns:
+            토큰을 얻으면 True, 시간 초과 시 False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = max(
+                    self._paused_until - now,
+                    (1 - self._tokens) / self.rate,
+                )
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(max(wait, 0.001))
+
+    def pause(self, seconds: float) -> None:
+        """서버가 Retry-After로 대기를 요청했을 때 모든 호출자를 잠시 멈춥니다."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+
+class Lease:
+    """AdaptiveLimiter.lease() 로 얻은 호출 허가. 호출이 끝나면 결과를 채웁니다.
+
+    Attributes:
+        reserved: 미리 잡아 둔 토큰 수 (입력 추정 + 최대 출력)
+        used_tokens: 실제 사용한 토큰 수 (모르면 None → 예약분 그대로 사용한 것으로 봄)
+        output_tokens: 출력 토큰 수 (지연 시간 판단용)
+        ok: 정상 응답 여부
+    """
+
+    def __init__(self, reserved: int):
+        self.reserved = reserved
+        self.used_tokens: int | None = None
+        self.output_tokens = 0
+        self.ok = False
+
+
+class AdaptiveLimiter:
+    """동시 호출 수를 AIMD로 조절하고 분당 토큰 예산을 지키는 스레드 안전 제한기입니다.
+
+    - 정상 응답마다 동시 호출 한도를 조금씩 늘립니다 (한도 L에서 +1/L, 대략 한 바퀴에 +1).
+    - 429를 받으면 한도를 절반으로 줄이고 Retry-After 동안 새 호출을 멈춥니다.
+    - 출력 토큰당 응답 시간이 평소의 latency_tolerance 배를 넘으면(서버 대기열) 한도를 10% 줄입니다.
+    - tokens_per_minute 가 있으면 호출 전에 예상 토큰(입력 + 최대 출력)을 예약하고,
+      끝나면 실제 사용량과의 차이를 돌려받습니다.
+
+    Args:
+        max_concurrency: 동시 호출 한도의 상한
+        tokens_per_minute: 분당 토큰 예산 (0 이하이면 제한 없음)
+        initial: 시작 한도 (기본값: 상한의 절반)
+        latency_tolerance: 지연으로 판단하는 배수
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        tokens_per_minute: int = 0,
+        initial: float | None = None,
+        latency_tolerance: float = 2.0,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(initial or max(1, self.max_concurrency // 2))
+        self._limit = min(max(self._limit, 1.0), self.max_concurrency)
+        self._in_flight = 0
+        self._budget = float(self.tokens_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._baseline: float | None = None  # 출력 1천 토큰당 초 (느리게 따라가는 평균)
+        self._stats = {"calls": 0, "throttles": 0, "slowdowns": 0, "waited_seconds": 0.0}
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def lease(self, tokens: int = 0) -> Iterator[Lease]:
+        """호출 허가를 얻어 with 블록 동안 유지합니다. 블록이 끝나면 결과를 반영해 반납합니다."""
+        self.acquire(tokens)
+        lease = Lease(tokens)
+        started = time.monotonic()
+        try:
+            yield lease
+        finally:
+            self.release(lease, time.monotonic() - started)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """동시 호출 자리와 토큰 예산이 생길 때까지 기다립니다."""
+        # 예산보다 큰 요청은 예산 전체가 찼을 때 보냄 (영원히 기다리지 않도록)
+        need = min(tokens, self.tokens_per_minute) if self.tokens_per_minute else 0
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0 and self._in_flight >= int(self._limit):
+                    wait = None  # 반납 알림까지 대기
+                elif wait <= 0 and self._budget < need:
+                    wait = (need - self._budget) / (self.tokens_per_minute / 60)
+                elif wait <= 0:
+                    break
+                self._cond.wait(wait)
+            self._in_flight += 1
+            self._budget -= need
+            self._stats["calls"] += 1
+            self._stats["waited_seconds"] += time.monotonic() - started
+
+    def release(self, lease: Lease, seconds: float) -> None:
+        """호출 결과를 반영하고 자리를 반납합니다."""
+        with self._cond:
+            self._in_flight -= 1
+            if self.tokens_per_minute and lease.used_tokens is not None:
+                refund = min(lease.reserved, self.tokens_per_minute) - lease.used_tokens
+                self._budget = min(self.tokens_per_minute, self._budget + refund)
+            if lease.ok:
+                if self._is_slow(seconds, lease.output_tokens):
+                    self._limit = max(1.0, self._limit * 0.9)
+                    self._stats["slowdowns"] += 1
+                else:
+                    self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """429를 받았을 때 호출합니다. 한도를 절반으로 줄이고 잠시 모든 새 호출을 멈춥니다."""
+        with self._cond:
+            self._limit = max(1.0, self._limit / 2)
+            self._paused_until = max(self._paused_until, time.monotonic() + (retry_after or 1.0))
+            self._stats["throttles"] += 1
+            logger.warning(
+                "GPT 호출 속도 제한(429) → 동시 호출 한도 %d개로 감소", int(self._limit)
+            )
+
+    def stats(self) -> dict:
+        """{"limit", "max_concurrency", "in_flight", "tokens_available", "calls",
+        "throttles", "slowdowns", "waited_seconds"} 형태의 현재 상태."""
+        with self._cond:
+            self._refill(time.monotonic())
+            return {
+                "limit": int(self._limit),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "tokens_available": int(self._budget) if self.tokens_per_minute else None,
+                **self._stats,
+            }
+
+    def _is_slow(self, seconds: float, output_tokens: int) -> bool:
+        if output_tokens < 50:
+            return False
+        per_k = seconds / output_tokens * 1000
+        baseline = self._baseline
+        self._baseline = per_k if baseline is None else 0.9 * baseline + 0.1 * per_k
+        return baseline is not None and per_k > baseline * self.latency_tolerance
+
+    def _refill(self, now: float) -> None:
+        if self.tokens_per_minute:
+            elapsed = now - self._updated
+            self._budget = min(
+                self.tokens_per_minute, self._budget + elapsed * self.tokens_per_minute / 60
+            )
+        self._updated = now
+
+
+class DailyQuota:
+    """날짜별 호출 횟수를 세고 JSON 파일에 저장합니다.
+
+    날짜가 바뀌면 카운터가 0으로 초기화됩니다.
+
+    Args:
+        limit: 하루 최대 호출 수 (0 이하이면 무제한)
+        path: 카운터 저장 파일. None이면 메모리에만 유지
+    """
+
+    def __init__(self, limit: int, path: "Path | str | None" = None):
+        self.limit = limit
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._day = date.today().isoformat()
+        self._used = 0
+        self._load()
+
+    def consume(self, n: int = 1) -> bool:
+        """호출 n회를 기록합니다. 한도를 넘으면 기록하지 않고 False를 반환합니다."""
+        with self._lock:
+            self._roll_over()
+            if self.limit > 0 and self._used + n > self.limit:
+                return False
+            self._used += n
+            self._save()
+            return True
+
+    def remaining(self) -> int | None:
+        """오늘 남은 호출 수. 무제한이면 None."""
+        with self._lock:
+            self._roll_over()
+            if self.limit <= 0:
+                return None
+            return max(0, self.limit - self._used)
+
+    def status(self) -> dict:
+        """{"date", "used", "limit", "remaining"} 형태의 현재 상태."""
+        with self._lock:
+            self._roll_over()
+            remaining = None if self.limit <= 0 else max(0, self.limit - self._used)
+            return {
+                "date": self._day,
+                "used": self._used,
+                "limit": self.limit,
+                "remaining": remaining,
+            }
+
+    def _roll_over(self) -> None:
+        today = date.today().isoformat()
+        if today != self._day:
+            self._day = today
+            self._used = 0
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("호출량 파일을 읽을 수 없습니다: %s (%s)", self.path, e)
+            return
+        if data.get("date") == self._day:
+            self._used = int(data.get("used", 0))
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps({"date": self._day, "used": self._used}),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning("호출량 파일 저장 실패: %s (%s)", self.path, e)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,268 @@
+"""외부 호출 공용 재시도 / 서킷 브레이커
+
+네이버 검색 API와 OpenAI API 호출이 일시적인 오류(타임아웃, 429, 5xx)로
+예약 발행 한 번을 통째로 날리지 않도록 지수 백오프 + 지터로 재시도하고,
+장애가 계속되는 엔드포인트는 서킷 브레이커로 즉시 실패시켜 작업이 멈춰 있지 않게 합니다.
+
+사용 예:
+    data = call_with_retry(lambda: session.get(url).json(), endpoint="naver:news")
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple, TypeVar
+
+import openai
+import requests
+
+from .config import Config
+from .rate_limiter import QuotaExceededError, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 재시도할 HTTP 상태 코드 (요청 제한, 서버 오류)
+_RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷 브레이커가 열려 있어 호출하지 않고 실패할 때 발생합니다."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """재시도를 포함한 전체 제한 시간을 넘겼을 때 발생합니다."""
+
+
+class RetryPolicy(NamedTuple):
+    """재시도 정책.
+
+    Attributes:
+        max_attempts: 최초 호출을 포함한 최대 시도 횟수
+        base_delay: 첫 재시도 대기 상한(초). 이후 2배씩 증가
+        max_delay: 한 번의 대기 상한(초)
+        deadline: 재시도를 포함한 전체 제한 시간(초). None이면 무제한
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    deadline: float | None = None
+
+
+def default_policy(deadline: float | None = None) -> RetryPolicy:
+    """Config 값을 반영한 기본 재시도 정책을 만듭니다."""
+    return RetryPolicy(
+        max_attempts=max(1, Config.RETRY_MAX_ATTEMPTS),
+        base_delay=Config.RETRY_BASE_DELAY,
+        max_delay=30.0,
+        deadline=deadline,
+    )
+
+
+# ── 서킷 브레이커 ─────────────────────────────────────────────────────────
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold 회에 이르면 reset_timeout 초 동안 호출을 막습니다.
+
+    제한 시간이 지나면 한 번의 시험 호출(half-open)을 허용하고,
+    성공하면 닫히고 실패하면 다시 열립니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """"closed" | "open" | "half-open" """
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 반환합니다."""
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("서킷 복구: %s", self.name)
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """시험 호출 결과를 판단할 수 없을 때(잘못된 요청 등) 상태는 그대로 두고 시험 기회만 돌려줍니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.error(
+                        "서킷 열림: %s (연속 실패 %d회, %.0f초간 호출 차단)",
+                        self.name, self._failures, self.reset_timeout,
+                    )
+                self._opened_at = time.monotonic()
+
+    def retry_in(self) -> float:
+        """다시 시도할 수 있을 때까지 남은 시간(초)."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(endpoint: str) -> CircuitBreaker:
+    """엔드포인트별 공유 서킷 브레이커를 반환합니다."""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                endpoint,
+                failure_threshold=Config.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=Config.CIRCUIT_RESET_SECONDS,
+            )
+            _breakers[endpoint] = breaker
+        return breaker
+
+
+def breaker_states() -> dict[str, str]:
+    """모든 엔드포인트의 서킷 상태를 반환합니다 (로그/상태 표시용)."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.state for b in breakers}
+
+
+# ── 오류 분류 ────────────────────────────────────────────────────────────
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """일시적인 오류라 다시 시도할 가치가 있는지 판단합니다."""
+    if isinstance(exc, (QuotaExceededError, CircuitOpenError)):
+        return False
+    if isinstance(exc, openai.RateLimitError):
+        # 크레딧 소진(insufficient_quota)은 기다려도 해결되지 않음
+        return getattr(exc, "code", None) != "insufficient_quota"
+    if isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, (openai.APIStatusError, requests.HTTPError)):
+        return _status_code(exc) in _RETRYABLE_STATUS
+    return isinstance(exc, (ConnectionError, TimeoutError))
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """오류 응답의 Retry-After 헤더 값을 초 단위로 반환합니다."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("Retry-After") or headers.get("retry-after"))
+
+
+# ── 재시도 실행 ──────────────────────────────────────────────────────────
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    endpoint: str,
+    policy: RetryPolicy | None = None,
+) -> T:
+    """fn을 호출하고, 일시적 오류면 백오프 후 재시도합니다.
+
+    Args:
+        fn: 인자 없는 호출 함수
+        endpoint: 서킷 브레이커 / 로그에 쓰이는 엔드포인트 이름 (예: "naver:news")
+        policy: 재시도 정책 (기본값: default_policy())
+
+    Raises:
+        CircuitOpenError: 엔드포인트 서킷이 열려 있음
+        DeadlineExceededError: 다음 재시도가 전체 제한 시간을 넘김
+        Exception: 재시도할 수 없는 오류 또는 마지막 시도의 오류
+    """
+    policy = policy or default_policy()
+    breaker = get_breaker(endpoint)
+    started = time.monotonic()
+    max_attempts = max(1, policy.max_attempts)
+
+    attempt = 0
+    while True:
+        attempt += 1
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"{endpoint} 호출이 연속으로 실패해 일시 차단되었습니다 "
+                f"({breaker.retry_in():.0f}초 후 재시도 가능)"
+            )
+        try:
+            result = fn()
+        except Exception as e:
+            retryable = is_retryable(e)
+            if retryable:
+                breaker.record_failure()
+            else:
+                # 잘못된 요청·할당량 초과 등은 엔드포인트 상태와 무관하므로 서킷에 반영하지 않음
+                breaker.release_trial()
+            if not retryable or attempt >= max_attempts:
+                raise
+
+            delay = random.uniform(0, min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1)))
+            retry_after = retry_after_seconds(e)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, policy.max_delay))
+
+            if policy.deadline is not None:
+                elapsed = time.monotonic() - started
+                if elapsed + delay >= policy.deadline:
+                    raise DeadlineExceededError(
+                        f"{endpoint} 제한 시간 {policy.deadline:.0f}초 초과 "
+                        f"({attempt}회 시도): {e}"
+                    ) from e
+
+            logger.warning(
+                "%s 호출 실패 → %.1f초 후 재시도 (%d/%d): %s",
+                endpoint, delay, attempt, max_attempts - 1, e,
+            )
+            time.sleep(delay)
+        else:
+            breaker.record_success()
+            return result
@@ -0,0 +1,180 @@
+"""공용 TTL + LRU 캐시 (선택적 SQLite 저장)
+
+튜플 키의 첫 요소(엔드포인트 이름)별로 유지 시간을 정하는 스레드 안전 캐시입니다.
+선택적으로 SQLite 파일에 저장해 프로그램을 다시 실행해도 유지됩니다.
+
+사용처:
+- 네이버 검색 API 응답 (news_fetcher) — 일일 호출량과 대기 시간 절약
+- 기사 원문 추출 결과 (article_extractor, cache/fulltext.db)
+- GPT 생성 결과 (writer_engine 생성 캐시, cache/generations.db)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """키 단위 TTL과 LRU 제거를 지원하는 스레드 안전 캐시입니다.
+
+    키는 튜플이며 첫 번째 요소(엔드포인트 이름)로 TTL을 결정합니다.
+    예: ("news", "딥시크", 15, "date")
+
+    Args:
+        max_entries: 메모리에 유지할 최대 항목 수 (초과 시 가장 오래 안 쓴 항목부터 제거)
+        ttls: 엔드포인트별 TTL(초). 없는 엔드포인트는 default_ttl 사용
+        default_ttl: 기본 TTL(초)
+        db_path: SQLite 파일 경로. 지정하면 디스크에도 저장합니다.
+        max_disk_entries: 디스크에 유지할 최대 항목 수 (초과 시 먼저 만료될 항목부터 제거, None이면 무제한)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 600,
+        db_path: "Path | str | None" = None,
+        max_disk_entries: int | None = None,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max(1, max_disk_entries) if max_disk_entries else None
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self._db: sqlite3.Connection | None = None
+        if db_path:
+            self._open_db(Path(db_path))
+
+    # ── 공개 API ──────────────────────────────────────────────────────────
+
+    def get(self, key: tuple):
+        """캐시된 값을 반환합니다. 없거나 만료됐으면 None."""
+        skey = self._serialize_key(key)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(skey)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(skey)
+                    self._stats["hits"] += 1
+                    return value
+                del self._entries[skey]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM response_cache WHERE key = ?",
+                    (skey,),
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    value = json.loads(row[0])
+                    self._put_memory(skey, row[1], value)
+                    self._stats["disk_hits"] += 1
+                    return value
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: tuple, value) -> None:
+        """값을 저장합니다. value는 JSON 직렬화가 가능해야 합니다(디스크 저장 시)."""
+        skey = self._serialize_key(key)
+        expires_at = time.time() + self._ttl_for(key)
+        with self._lock:
+            self._put_memory(skey, expires_at, value)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO response_cache "
+                        "(key, endpoint, value, expires_at) VALUES (?, ?, ?, ?)",
+                        (skey, str(key[0]), json.dumps(value, ensure_ascii=False), expires_at),
+                    )
+                    if self.max_disk_entries is not None:
+                        self._trim_disk()
+                    self._db.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    logger.warning("캐시 디스크 저장 실패: %s", e)
+
+    def clear(self) -> None:
+        """메모리와 디스크의 모든 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM response_cache")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """적중/미스 통계를 반환합니다 (캐시 크기 조정용).
+
+        Returns:
+            {"hits", "disk_hits", "misses", "evictions", "size", "max_entries", "hit_rate"}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        stats["max_entries"] = self.max_entries
+        total = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / total if total else 0.0
+        return stats
+
+    def close(self) -> None:
+        """디스크 연결을 닫습니다."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ── 내부 구현 ─────────────────────────────────────────────────────────
+
+    def _ttl_for(self, key: tuple) -> float:
+        return self.ttls.get(str(key[0]), self.default_ttl)
+
+    @staticmethod
+    def _serialize_key(key: tuple) -> str:
+        return json.dumps(list(key), ensure_ascii=False)
+
+    def _put_memory(self, skey: str, expires_at: float, value) -> None:
+        """락을 잡은 상태에서 호출해야 합니다."""
+        self._entries[skey] = (expires_at, value)
+        self._entries.move_to_end(skey)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _trim_disk(self) -> None:
+        """락을 잡은 상태에서 호출해야 합니다."""
+        size = self._db.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        excess = size - self.max_disk_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM response_cache WHERE key IN "
+                "(SELECT key FROM response_cache ORDER BY expires_at LIMIT ?)",
+                (excess,),
+            )
+            self._stats["evictions"] += excess
+
+    def _open_db(self, db_path: Path) -> None:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(db_path), check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, endpoint TEXT, value TEXT, expires_at REAL)"
+            )
+            # 만료 항목 정리
+            db.execute("DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),))
+            db.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("캐시 DB를 열 수 없어 메모리 캐시만 사용합니다: %s (%s)", db_path, e)
+            return
+        self._db = db
+        logger.debug("캐시 DB 연결: %s", db_path)
@@ -2,10 +2,42 @@ import logging
 import time
 import schedule
 
+from .config import Config
+
 logger = logging.getLogger(__name__)
 
 
-def run_scheduler(topics_file: str, run_time: str, mode: str = "write") -> None:
+def read_topics(topics_file: str, mode: str) -> list[dict]:
+    """주제 목록 파일을 읽어 [{"topic", "thoughts"(opinion 모드)}] 목록으로 반환합니다.
+
+    opinion 모드 파일 형식 (한 줄에 주제:::생각 형식):
+        AI 시대의 직업 변화:::AI가 단순 반복 업무를 대체하고 있다. 판단력이 중요해졌다.
+        재택근무의 장단점:::집중이 잘 되지만 협업이 어렵다. 루틴 관리가 핵심이다.
+    """
+    with open(topics_file, encoding="utf-8") as f:
+        raw_lines = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+    # opinion 모드는 "주제:::생각" 형식으로 파싱
+    if mode != "opinion":
+        return [{"topic": line} for line in raw_lines]
+
+    items = []
+    for line in raw_lines:
+        if ":::" in line:
+            topic, thoughts = line.split(":::", 1)
+            items.append({"topic": topic.strip(), "thoughts": thoughts.strip()})
+        else:
+            print(f"[경고] opinion 모드에서는 '주제:::생각' 형식이 필요합니다. 건너뜀: {line}")
+    return items
+
+
+def run_scheduler(
+    topics_file: str,
+    run_time: str,
+    mode: str = "write",
+    batch: bool = False,
+    regenerate: bool = False,
+) -> None:
     """주제 목록 파일에서 하나씩 읽어 매일 정해진 시간에 블로그 글을 발행합니다.
 
     Args:
@@ -14,42 +46,60 @@ def run_scheduler(topics_file: str, run_time: str, mode: str = "write") -> None:
         mode: 글쓰기 모드 ("write" | "issue" | "opinion")
               - write: 범용 글쓰기
               - issue: 이슈 정리글 (조회수 최적화)
-              - opinion: 내 생각 정리글 (opinion 모드에서는 파일 형식이 다름, 아래 참고)
-
-    opinion 모드 파일 형식 (한 줄에 주제:::생각 형식):
-        AI 시대의 직업 변화:::AI가 단순 반복 업무를 대체하고 있다. 판단력이 중요해졌다.
-        재택근무의 장단점:::집중이 잘 되지만 협업이 어렵다. 루틴 관리가 핵심이다.
+              - opinion: 내 생각 정리글 (파일 형식은 read_topics 참고)
+        batch: True면 시작할 때 모든 주제를 배치 작업으로 미리 생성해 두고
+               실행 시각에는 저장된 글을 발행만 합니다 (배치 결과가 없는 주제는 그때 생성)
+        regenerate: True면 생성 캐시를 무시하고 매번 GPT로 새로 생성
+                    (같은 주제가 캐시 유지 기간 안에 반복돼도 같은 글을 다시 발행하지 않음)
     """
     from .ai_writer import AIWriter
     from .issue_writer import IssueWriter
     from .opinion_writer import OpinionWriter
     from .naver_blog import NaverBlogClient
-    from .post_saver import save_post
-
-    with open(topics_file, encoding="utf-8") as f:
-        raw_lines = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    from .post_saver import load_post_from_file, save_post
 
-    if not raw_lines:
-        print("주제 목록이 비어 있습니다.")
+    items = read_topics(topics_file, mode)
+    if not items:
+        print("유효한 주제가 없습니다.")
         return
 
-    # opinion 모드는 "주제:::생각" 형식으로 파싱
-    if mode == "opinion":
-        items = []
-        for line in raw_lines:
-            if ":::" in line:
-                topic, thoughts = line.split(":::", 1)
-                items.append({"topic": topic.strip(), "thoughts": thoughts.strip()})
-            else:
-                print(f"[경고] opinion 모드에서는 '주제:::생각' 형식이 필요합니다. 건너뜀: {line}")
-        if not items:
-            print("유효한 항목이 없습니다.")
-            return
-    else:
-        items = [{"topic": line} for line in raw_lines]
-
     mode_label = {"write": "범용", "issue": "이슈 정리", "opinion": "내 생각 정리"}[mode]
-    state = {"index": 0}
+    # 글 생성기는 실행마다 새로 만들지 않고 재사용 (OpenAI 연결 유지)
+    writer = {"issue": IssueWriter, "opinion": OpinionWriter}.get(mode, AIWriter)()
+    state = {"index": 0, "manifest": None}
+
+    if batch:
+        from .batch_generator import BatchGenerator, manifest_name, save_manifest
+
+        generator = BatchGenerator(mode, engine=writer.engine)
+        manifest = generator.load_or_submit(items, manifest_name(topics_file, mode))
+        state["manifest"] = manifest
+        # 이전 실행에서 이미 발행한 주제는 건너뜀
+        while (
+            state["index"] < len(items)
+            and manifest["items"][state["index"]].get("published")
+        ):
+            state["index"] += 1
+        print(f"배치 작업: {manifest['batch_id']} ({manifest['status']})")
+
+        def poll():
+            try:
+                state["manifest"] = generator.refresh(state["manifest"])
+            except Exception as e:
+                logger.warning("배치 상태 확인 실패: %s", e)
+                return None
+            if state["manifest"]["status"] in ("completed", "failed", "expired", "cancelled"):
+                return schedule.CancelJob
+            return None
+
+        schedule.every(max(30, Config.BATCH_POLL_SECONDS)).seconds.do(poll)
+
+    def generate(item: dict) -> dict:
+        if mode == "opinion":
+            return writer.generate_post(
+                item["topic"], item["thoughts"], force_regenerate=regenerate
+            )
+        return writer.generate_post(item["topic"], force_regenerate=regenerate)
 
     def job():
         if state["index"] >= len(items):
@@ -68,22 +118,32 @@ def run_scheduler(topics_file: str, run_time: str, mode: str = "write") -> None:
         try:
             blog_client = NaverBlogClient()
 
-            if mode == "issue":
-                writer = IssueWriter()
-                post = writer.generate_post(topic)
-            elif mode == "opinion":
-                writer = OpinionWriter()
-                post = writer.generate_post(topic, item["thoughts"])
+            entry = state["manifest"]["items"][state["index"]] if state["manifest"] else None
+            if entry is not None and not entry.get("file"):
+                # 아직 결과를 받지 못했으면 발행 직전에 한 번 더 확인
+                try:
+                    state["manifest"] = generator.refresh(state["manifest"])
+                except Exception as e:
+                    logger.warning("배치 상태 확인 실패: %s", e)
+                entry = state["manifest"]["items"][state["index"]]
+
+            if entry is not None and entry.get("file"):
+                title, content = load_post_from_file(entry["file"])
+                post = {"title": title, "content": content}
+                print(f"배치 생성 글 사용: {entry['file']}")
             else:
-                writer = AIWriter()
-                post = writer.generate_post(topic)
-
-            saved = save_post(post["title"], post["content"])
-            print(f"로컬 저장: {saved}")
+                if entry is not None:
+                    logger.warning("배치 결과가 없어 지금 생성합니다: %s", topic)
+                post = generate(item)
+                saved = save_post(post["title"], post["content"])
+                print(f"로컬 저장: {saved}")
 
             result = blog_client.publish(post["title"], post["content"])
             print(f"발행 완료: {post['title']}")
             logger.info("발행 성공: %s", result)
+            if entry is not None:
+                entry["published"] = True
+                save_manifest(state["manifest"])
         except Exception:
             logger.exception("발행 실패: %s", topic)
             print(f"발행 실패: {topic}")
@@ -93,7 +153,7 @@ def run_scheduler(topics_file: str, run_time: str, mode: str = "write") -> None:
     schedule.every().day.at(run_time).do(job)
 
     print(f"\n스케줄러 시작: 매일 {run_time}에 실행 (모드: {mode_label})")
-    print(f"총 {len(items)}개 주제 대기 중")
+    print(f"총 {len(items) - state['index']}개 주제 대기 중")
     print("종료하려면 Ctrl+C를 누르세요.\n")
 
     try:
@@ -0,0 +1,256 @@
+"""GPT 호출 기록 (토큰·지연 시간·비용)
+
+GPT 호출마다 입력/캐시/출력/추론 토큰, 소요 시간, 첫 토큰까지 걸린 시간(스트리밍),
+종료 사유, 모델, 추정 비용을 한 줄씩 cache/telemetry.db (SQLite)에 남깁니다.
+시스템 프롬프트(고정 지시문)와 사용자 메시지(자료·주제)의 토큰 수도 따로 기록해
+어느 모드·어느 프롬프트 부분이 비용과 시간을 차지하는지 볼 수 있습니다.
+
+`python -m auto_blog.main stats` 로 모드·모델별 합계를 확인합니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from .config import CACHE_DIR, Config
+
+logger = logging.getLogger(__name__)
+
+# 모델별 100만 토큰당 가격 (USD): (입력, 캐시 적중 입력, 출력). 추론 토큰은 출력 가격
+# 날짜가 붙은 스냅샷 이름(gpt-4.1-2025-04-14 등)은 가장 긴 접두사로 찾습니다.
+MODEL_PRICES: dict[str, tuple[float, float, float]] = {
+    "gpt-5": (1.25, 0.125, 10.00),
+    "gpt-5-mini": (0.25, 0.025, 2.00),
+    "gpt-5-nano": (0.05, 0.005, 0.40),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "o3": (2.00, 0.50, 8.00),
+    "o4-mini": (1.10, 0.275, 4.40),
+}
+
+# Batch API 요청은 토큰 단가 50% 할인
+BATCH_DISCOUNT = 0.5
+
+_store: "TelemetryStore | None" = None
+_store_lock = threading.Lock()
+
+
+class GenerationRecord(NamedTuple):
+    """GPT 호출 한 건의 기록.
+
+    Attributes:
+        mode: 글쓰기 모드 ("write" | "issue" | "opinion" | "trend" | "outline" | "section")
+        model: 모델 이름
+        label: 주제 등 로그용 이름
+        ok: 사용할 수 있는 응답을 받았는지
+        error: 실패 사유
+        finish_reason: 응답 종료 사유 ("stop" | "length" | "content_filter" 등)
+        cache_hit: 생성 캐시에서 돌려줬는지 (GPT 호출 없음)
+        stream: 스트리밍 호출 여부
+        batch: Batch API 결과 여부
+        prompt_tokens: 입력 토큰 (캐시 적중 포함)
+        cached_tokens: 제공자 프롬프트 캐시에 적중한 입력 토큰
+        completion_tokens: 출력 토큰 (추론 토큰 포함)
+        reasoning_tokens: 추론 토큰
+        system_tokens: 시스템 프롬프트 토큰 수 (추정 포함)
+        user_tokens: 사용자 메시지 토큰 수 (추정 포함)
+        seconds: 재시도 포함 전체 소요 시간
+        ttft: 첫 응답 조각까지 걸린 시간 (스트리밍만, 아니면 None)
+        cost: 추정 비용 (USD, 가격표에 없는 모델이면 None)
+    """
+
+    mode: str
+    model: str
+    label: str = ""
+    ok: bool = True
+    error: str = ""
+    finish_reason: str = ""
+    cache_hit: bool = False
+    stream: bool = False
+    batch: bool = False
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+    reasoning_tokens: int = 0
+    system_tokens: int = 0
+    user_tokens: int = 0
+    seconds: float = 0.0
+    ttft: float | None = None
+    cost: float | None = None
+
+
+def model_prices(model: str) -> tuple[float, float, float] | None:
+    """모델 이름(스냅샷 포함)에 해당하는 가격을 찾습니다."""
+    matches = [name for name in MODEL_PRICES if model == name or model.startswith(name + "-")]
+    return MODEL_PRICES[max(matches, key=len)] if matches else None
+
+
+def estimate_cost(
+    model: str,
+    prompt_tokens: int,
+    cached_tokens: int,
+    completion_tokens: int,
+    batch: bool = False,
+) -> float | None:
+    """토큰 수로 비용(USD)을 계산합니다. 가격표에 없는 모델이면 None."""
+    prices = model_prices(model)
+    if prices is None:
+        return None
+    input_price, cached_price, output_price = prices
+    cost = (
+        (prompt_tokens - cached_tokens) * input_price
+        + cached_tokens * cached_price
+        + completion_tokens * output_price
+    ) / 1_000_000
+    return cost * BATCH_DISCOUNT if batch else cost
+
+
+def usage_tokens(usage) -> tuple[int, int, int, int]:
+    """응답 usage 에서 (입력, 캐시 적중 입력, 출력, 추론) 토큰 수를 꺼냅니다. 없으면 0.
+
+    usage 는 SDK 객체와 Batch 결과 파일의 딕셔너리 모두 받습니다.
+    """
+    if usage is None:
+        return 0, 0, 0, 0
+
+    def field(obj, name):
+        value = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+        return value or 0
+
+    prompt_details = field(usage, "prompt_tokens_details")
+    completion_details = field(usage, "completion_tokens_details")
+    return (
+        field(usage, "prompt_tokens"),
+        field(prompt_details, "cached_tokens") if prompt_details else 0,
+        field(usage, "completion_tokens"),
+        field(completion_details, "reasoning_tokens") if completion_details else 0,
+    )
+
+
+class TelemetryStore:
+    """호출 기록을 저장·집계하는 스레드 안전 SQLite 저장소입니다.
+
+    Args:
+        db_path: SQLite 파일 경로 (":memory:" 가능)
+    """
+
+    def __init__(self, db_path: "Path | str"):
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS generations (
+                id                INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at        REAL NOT NULL,
+                mode              TEXT NOT NULL,
+                model             TEXT NOT NULL,
+                label             TEXT,
+                ok                INTEGER NOT NULL,
+                error             TEXT,
+                finish_reason     TEXT,
+                cache_hit         INTEGER NOT NULL,
+                stream            INTEGER NOT NULL,
+                batch             INTEGER NOT NULL,
+                prompt_tokens     INTEGER NOT NULL,
+                cached_tokens     INTEGER NOT NULL,
+                completion_tokens INTEGER NOT NULL,
+                reasoning_tokens  INTEGER NOT NULL,
+                system_tokens     INTEGER NOT NULL,
+                user_tokens       INTEGER NOT NULL,
+                seconds           REAL NOT NULL,
+                ttft              REAL,
+                cost              REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_generations_created ON generations(created_at);
+            """
+        )
+        self._db.commit()
+
+    def add(self, record: GenerationRecord) -> None:
+        columns = ("created_at",) + GenerationRecord._fields
+        with self._lock:
+            self._db.execute(
+                f"INSERT INTO generations ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                (time.time(), *record),
+            )
+            self._db.commit()
+
+    def summary(self, since: float | None = None, group_by: str = "mode") -> list[dict]:
+        """기간 내 기록을 묶어 합계를 반환합니다 (비용이 큰 순).
+
+        Args:
+            since: 이 시각(epoch 초) 이후 기록만 (None이면 전체)
+            group_by: "mode" | "model" | "label"
+
+        Returns:
+            [{"key", "calls", "failures", "cache_hits", "prompt_tokens", "cached_tokens",
+              "completion_tokens", "reasoning_tokens", "system_tokens", "user_tokens",
+              "avg_seconds", "max_seconds", "avg_ttft", "cost"}]
+            system_tokens / user_tokens 는 실제 호출 1건당 평균입니다 (배치 결과 제외).
+        """
+        if group_by not in ("mode", "model", "label"):
+            raise ValueError(f"지원하지 않는 group_by: {group_by}")
+        with self._lock:
+            rows = self._db.execute(
+                f"""
+                SELECT {group_by} AS key,
+                       SUM(cache_hit = 0) AS calls,
+                       SUM(ok = 0) AS failures,
+                       SUM(cache_hit) AS cache_hits,
+                       SUM(prompt_tokens) AS prompt_tokens,
+                       SUM(cached_tokens) AS cached_tokens,
+                       SUM(completion_tokens) AS completion_tokens,
+                       SUM(reasoning_tokens) AS reasoning_tokens,
+                       AVG(CASE WHEN cache_hit = 0 AND batch = 0 THEN system_tokens END)
+                           AS system_tokens,
+                       AVG(CASE WHEN cache_hit = 0 AND batch = 0 THEN user_tokens END)
+                           AS user_tokens,
+                       AVG(CASE WHEN cache_hit = 0 AND batch = 0 THEN seconds END) AS avg_seconds,
+                       MAX(CASE WHEN cache_hit = 0 AND batch = 0 THEN seconds END) AS max_seconds,
+                       AVG(ttft) AS avg_ttft,
+                       SUM(cost) AS cost
+                FROM generations
+                WHERE created_at >= ?
+                GROUP BY {group_by}
+                ORDER BY COALESCE(SUM(cost), 0) DESC, calls DESC
+                """,
+                (since or 0,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def get_store() -> TelemetryStore | None:
+    """호출 기록 저장소를 반환합니다. TELEMETRY_ENABLED가 꺼져 있으면 None."""
+    global _store
+
+    if not Config.TELEMETRY_ENABLED:
+        return None
+
+    with _store_lock:
+        if _store is None:
+            _store = TelemetryStore(CACHE_DIR / "telemetry.db")
+        return _store
+
+
+def record(entry: GenerationRecord) -> None:
+    """호출 기록을 저장합니다. 저장 실패는 글 생성에 영향을 주지 않도록 경고만 남깁니다."""
+    try:
+        store = get_store()
+        if store is not None:
+            store.add(entry)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("GPT 호출 기록 저장 실패: %s", e)
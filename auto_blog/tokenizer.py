@@ -0,0 +1,22 @@
+"""검색용 토큰화
+
+뉴스 관련도 정렬(BM25)과 기사 저장소 전문 검색(FTS5)이 같은 규칙으로 토큰을 만들도록
+공용 토큰화 함수를 둡니다.
+"""
+
+import re
+
+
+def tokenize(text: str) -> list[str]:
+    """검색용 토큰 목록을 만듭니다.
+
+    한글 등 비 ASCII 단어는 문자 2-gram으로 쪼개 조사·어미가 붙어도 일치하게 하고
+    ("반도체가" → "반도", "도체", "체가"), 영문·숫자 단어는 그대로 사용합니다.
+    """
+    tokens = []
+    for word in re.findall(r"\w+", text.lower()):
+        if word.isascii() or len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
@@ -9,9 +9,7 @@ import logging
 import re
 from datetime import datetime
 
-from openai import OpenAI
-
-from .config import Config
+from .writer_engine import GenerationEngine, GenerationRequest, get_engine
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +32,9 @@ TREND_SYSTEM_PROMPT = """당신은 한국 디지털 미디어 트렌드를 분
 4. "이게 뭐지?", "왜 화제야?"라고 궁금해할 만한 시의성
 5. 네이버 블로그 유입에 유리한 검색 키워드 포함 여부
 
-반드시 JSON 형식으로만 응답하세요. 다른 설명이나 텍스트를 추가하지 마세요."""
-
-
-TREND_USER_TEMPLATE = """오늘 날짜: {date}
-현재 시각: {time}
-
-위 날짜·시간을 기준으로, 지금 한국에서 가장 화제가 되고 있을 가능성이 높은
-이슈/트렌드 주제 {count}개를 선정해주세요.
+사용자 메시지로 오늘 날짜·현재 시각과 선정할 주제 수가 주어지면,
+그 날짜·시간을 기준으로 지금 한국에서 가장 화제가 되고 있을 가능성이 높은
+이슈/트렌드 주제를 요청한 개수만큼 선정합니다.
 
 각 주제는 다음 정보를 포함해야 합니다:
 - 구체적인 이슈 주제명 (너무 추상적이지 않게, 실제 검색어처럼)
@@ -51,29 +44,36 @@ TREND_USER_TEMPLATE = """오늘 날짜: {date}
 - 예상 검색 볼륨 (high / medium)
 - 클릭을 유도하는 블로그 제목 예시
 
-반드시 아래 JSON 형식만 출력하세요 (```json 코드블록 없이 순수 JSON):
-{{
-  "analysis_date": "{date}",
+반드시 아래 JSON 형식만 출력하세요 (```json 코드블록 없이 순수 JSON).
+다른 설명이나 텍스트를 추가하지 마세요.
+{
+  "analysis_date": "YYYY-MM-DD (오늘 날짜)",
   "topics": [
-    {{
+    {
       "topic": "구체적인 이슈 주제명",
       "reason": "지금 화제인 이유 (2~3문장, 근거 포함)",
       "category": "정치/경제/연예/스포츠/기술/사회/라이프 중 하나",
       "keywords": ["키워드1", "키워드2", "키워드3"],
       "search_volume": "high 또는 medium",
       "hook_title": "클릭률 높은 제목 예시"
-    }}
+    }
   ],
   "best_pick_index": 0,
   "best_pick_reason": "이 주제를 최우선 추천하는 이유"
-}}"""
+}"""
+
+
+# 날짜·시각은 매번 바뀌므로 고정 지시문(시스템 프롬프트) 뒤의 사용자 메시지에만 넣음
+TREND_USER_TEMPLATE = """오늘 날짜: {date}
+현재 시각: {time}
+선정할 주제 수: {count}개"""
 
 
 class TrendFinder:
     """OpenAI GPT로 현재 트렌딩 이슈 주제를 자동 발굴합니다."""
 
-    def __init__(self):
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    def __init__(self, engine: GenerationEngine | None = None):
+        self.engine = engine or get_engine()
 
     def find_trending_topics(self, count: int = 5) -> dict:
         """현재 트렌딩 주제 목록을 분석해 반환합니다.
@@ -93,17 +93,15 @@ class TrendFinder:
 
         logger.info("트렌드 주제 분석 시작 (분석 대상: %d개)", count)
 
-        response = self.client.chat.completions.create(
-            model=Config.GPT_MODEL,
-            max_completion_tokens=2000,
-            reasoning_effort=Config.GPT_REASONING_EFFORT,
-            messages=[
-                {"role": "system", "content": TREND_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-
-        response_text = response.choices[0].message.content.strip()
+        response_text = self.engine.complete(
+            GenerationRequest(
+                mode="trend",
+                system_prompt=TREND_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+                max_tokens=2000,
+                label=f"트렌드 {count}개",
+            )
+        ).strip()
 
         # JSON 블록 추출 (```json ... ``` 코드블록 포함 대응)
         json_match = re.search(r"\{[\s\S]*\}", response_text)
@@ -0,0 +1,791 @@
+"""공용 GPT 글 생성 엔진
+
+범용·이슈·의견 글쓰기와 트렌드 분석은 프롬프트만 다를 뿐
+GPT 호출, 재시도, 응답 검사, 제목/본문 분리 과정은 같습니다.
+각 모드는 GenerationRequest(프롬프트 전략)만 만들고,
+호출과 관련된 모든 처리는 GenerationEngine 한 곳에서 담당합니다.
+
+같은 모델·설정·프롬프트의 생성 결과는 cache/generations.db 에 저장해 두고
+다시 요청하면 GPT를 호출하지 않고 바로 돌려줍니다 (발행 재시도, 미리보기 반복 등).
+
+GPT_STRUCTURED_OUTPUT이 켜져 있으면 글은 JSON 스키마 모드(title·content·summary·keywords·tags)로
+받아 검증합니다. 첫 줄 추측 파싱이 필요 없고, 형식이 어긋난 응답도 다시 생성하지 않고 복구합니다.
+
+프롬프트는 고정 접두부(시스템 프롬프트: 모든 지시문)와 가변부(사용자 메시지: 자료·주제)로
+나뉩니다. 접두부가 바이트 단위로 같아야 OpenAI 프롬프트 캐시(입력 토큰 할인, 첫 응답 단축)가
+적용되므로, 시스템 프롬프트에는 날짜·주제 같은 가변 값을 넣지 않습니다.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections.abc import Iterator
+from typing import NamedTuple
+
+import openai
+from openai import OpenAI
+
+from . import telemetry
+from .config import CACHE_DIR, Config
+from .context_packer import count_tokens
+from .model_router import ModelRouter, get_router
+from .openai_client import get_client
+from .rate_limiter import AdaptiveLimiter, Lease
+from .resilience import call_with_retry, default_policy, retry_after_seconds
+from .response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# 시스템 프롬프트(고정 접두부)를 수정하면 올립니다. 제공자 프롬프트 캐시 키에 포함됩니다.
+PROMPT_VERSION = "2"
+
+# TTL 0 이하 = 만료 없음 (사실상 무기한)
+_NO_EXPIRY = 100 * 365 * 24 * 3600
+
+# 구조화 출력 스키마. strict 모드는 모든 필드가 required 이고 추가 필드를 허용하지 않아야 함
+POST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "content": {"type": "string"},
+        "summary": {"type": "string"},
+        "keywords": {"type": "array", "items": {"type": "string"}},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["title", "content", "summary", "keywords", "tags"],
+    "additionalProperties": False,
+}
+
+POST_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "blog_post", "strict": True, "schema": POST_SCHEMA},
+}
+
+# 구조화 출력 시 시스템 프롬프트 끝에 붙이는 고정 지시문 (접두부가 바뀌지 않도록 상수로 유지)
+_STRUCTURED_INSTRUCTIONS = """
+
+■ 응답 형식 (JSON)
+위의 출력 형식 지시 중 "첫 줄에 제목"은 아래 필드로 대신합니다. 응답은 지정된 JSON 스키마로만 작성합니다.
+• title: 글 제목 한 줄 (마크다운 기호·따옴표·"제목:" 없이)
+• content: 제목 줄을 뺀 본문 전체 (위에서 지시한 형식 그대로)
+• summary: 글 내용 요약 1~2문장
+• keywords: SEO 키워드 3~5개
+• tags: 블로그 태그 5~10개 (# 없이)"""
+
+_cache: ResponseCache | None = None
+_cache_key: tuple | None = None
+_cache_lock = threading.Lock()
+
+_limiter: AdaptiveLimiter | None = None
+_limiter_key: tuple | None = None
+_limiter_lock = threading.Lock()
+
+
+class GenerationRequest(NamedTuple):
+    """모드별 프롬프트 전략이 만들어 엔진에 넘기는 생성 요청.
+
+    Attributes:
+        mode: 글쓰기 모드 ("write" | "issue" | "opinion" | "trend")
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        max_tokens: 최대 생성 토큰 수
+        label: 로그에 표시할 이름 (주제 등)
+        response_format: 응답 형식 지정 (JSON 스키마 등, None이면 일반 텍스트)
+    """
+
+    mode: str
+    system_prompt: str
+    user_prompt: str
+    max_tokens: int
+    label: str = ""
+    response_format: dict | None = None
+
+
+class StreamEvent(NamedTuple):
+    """스트리밍 생성 중 발생하는 이벤트.
+
+    Attributes:
+        kind: "title" (제목 줄 완성) | "content" (본문 조각) | "done" (생성 완료)
+        text: 제목 또는 본문 조각
+        post: "done" 이벤트에만 담기는 {"title", "content"} 최종 결과
+    """
+
+    kind: str
+    text: str = ""
+    post: dict | None = None
+
+
+def _clean_title(title_line: str) -> str:
+    """응답 첫 줄에서 제목 텍스트만 남깁니다."""
+    # 마크다운 헤더 제거: "### 제목" → "제목"
+    title = re.sub(r'^#{1,6}\s*', '', title_line.strip()).strip()
+    # 앞뒤 따옴표 제거
+    title = title.strip('"').strip("'").strip()
+    # "제목: ..." 형식 처리
+    if title.lower().startswith("제목:") or title.lower().startswith("title:"):
+        title = title.split(":", 1)[1].strip()
+    return title or "제목 없음"
+
+
+def _parse_title_content(response_text: str) -> tuple[str, str]:
+    """GPT 응답에서 제목과 본문을 분리합니다.
+
+    다양한 형식에 대응합니다:
+    - '# 제목' / '## 제목' (마크다운 헤더)
+    - '제목: ...'
+    - 첫 줄 텍스트 그대로
+    """
+    text = response_text.strip()
+    lines = text.split("\n", 1)
+
+    title = _clean_title(lines[0])
+    content = lines[1].strip() if len(lines) > 1 else ""
+
+    return title, content
+
+
+def _validate_post(data) -> dict:
+    """구조화 응답을 검증하고 정리합니다. 필수 필드가 없거나 타입이 틀리면 ValueError."""
+    if not isinstance(data, dict):
+        raise ValueError("JSON 객체가 아닙니다")
+    for key in ("title", "content"):
+        if not isinstance(data.get(key), str) or not data[key].strip():
+            raise ValueError(f"{key} 필드가 비어있습니다")
+    summary = data.get("summary", "")
+    if not isinstance(summary, str):
+        raise ValueError("summary 필드가 문자열이 아닙니다")
+    lists = {}
+    for key in ("keywords", "tags"):
+        values = data.get(key, [])
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ValueError(f"{key} 필드가 문자열 목록이 아닙니다")
+        lists[key] = [v.strip().lstrip("#").strip() for v in values if v.strip().lstrip("#").strip()]
+
+    title = _clean_title(data["title"].strip().split("\n", 1)[0])
+    content = data["content"].strip()
+    # 프롬프트의 "첫 줄에 제목" 지시를 따라 본문에도 제목을 반복한 경우 제거
+    first, _, rest = content.partition("\n")
+    if rest and _clean_title(first) == title:
+        content = rest.strip()
+    return {"title": title, "content": content, "summary": summary.strip(), **lists}
+
+
+def _json_string_field(text: str, key: str) -> str | None:
+    """잘린 JSON에서도 문자열 필드 값을 꺼냅니다 (닫는 따옴표가 없으면 끝까지)."""
+    match = re.search(rf'"{key}"\s*:\s*"((?:[^"\\]|\\.)*)', text)
+    if not match:
+        return None
+    try:
+        return json.loads(f'"{match.group(1)}"')
+    except json.JSONDecodeError:
+        return None
+
+
+def _parse_structured_post(text: str) -> dict:
+    """구조화 응답을 파싱합니다.
+
+    검증에 실패하면 추가 호출 없이 복구합니다:
+    1) 코드블록·앞뒤 잡음을 걷어낸 JSON 객체
+    2) 최대 토큰에서 잘린 JSON의 title/content 필드
+    3) 일반 텍스트로 보고 _parse_title_content
+    """
+    try:
+        return _validate_post(json.loads(text))
+    except ValueError as e:
+        error = e
+
+    match = re.search(r"\{[\s\S]*\}", text)
+    if match:
+        try:
+            post = _validate_post(json.loads(match.group()))
+            logger.info("구조화 응답 복구: JSON 앞뒤 잡음 제거")
+            return post
+        except ValueError:
+            pass
+
+    title = _json_string_field(text, "title")
+    content = _json_string_field(text, "content")
+    if title and title.strip() and content and content.strip():
+        logger.warning("구조화 응답 검증 실패(%s) → title/content 필드만 복구합니다", error)
+        return _validate_post({"title": title, "content": content})
+
+    logger.warning("구조화 응답 검증 실패(%s) → 텍스트 형식으로 파싱합니다", error)
+    title, content = _parse_title_content(text)
+    return {"title": title, "content": content, "summary": "", "keywords": [], "tags": []}
+
+
+def _prefix_name(request: GenerationRequest) -> str:
+    """고정 접두부 구분 이름. 구조화 출력은 시스템 프롬프트가 달라 별도로 취급합니다."""
+    return f"{request.mode}-json" if request.response_format is not None else request.mode
+
+
+def parse_post(text: str, structured: bool) -> dict:
+    """응답 텍스트를 {"title", "content", ...} 로 변환합니다.
+
+    Args:
+        text: GPT 응답 텍스트
+        structured: 구조화 출력(prepare() 적용) 요청의 응답인지 여부
+    """
+    if structured:
+        return _parse_structured_post(text)
+    title, content = _parse_title_content(text)
+    return {"title": title, "content": content}
+
+
+def _structured(request: GenerationRequest) -> GenerationRequest:
+    return request._replace(
+        system_prompt=request.system_prompt + _STRUCTURED_INSTRUCTIONS,
+        response_format=POST_RESPONSE_FORMAT,
+    )
+
+
+class _StreamingTitleParser:
+    """응답 조각을 받아 _parse_title_content 와 같은 결과를 점진적으로 만듭니다.
+
+    첫 줄이 끝나는 즉시 제목을 내보내고, 이후에는 본문 조각을 바로 내보냅니다.
+    본문 앞뒤 공백은 최종 결과와 같도록 잘라냅니다(끝 공백은 다음 글자가 올 때까지 보류).
+    """
+
+    def __init__(self):
+        self._head = ""
+        self._title: str | None = None
+        self._body_started = False
+        self._pending_ws = ""
+        self._content: list[str] = []
+
+    def feed(self, chunk: str) -> list[StreamEvent]:
+        events = []
+        if self._title is None:
+            self._head += chunk
+            head = self._head.lstrip()
+            if "\n" not in head:
+                return events
+            line, chunk = head.split("\n", 1)
+            self._title = _clean_title(line)
+            events.append(StreamEvent("title", self._title))
+
+        if not self._body_started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return events
+            self._body_started = True
+
+        body = chunk.rstrip()
+        if not body:
+            self._pending_ws += chunk
+            return events
+        text = self._pending_ws + body
+        self._pending_ws = chunk[len(body):]
+        self._content.append(text)
+        events.append(StreamEvent("content", text))
+        return events
+
+    def finish(self) -> tuple[str, str]:
+        if self._title is None:
+            # 줄바꿈 없이 끝난 응답: 전체가 제목
+            return _clean_title(self._head), ""
+        return self._title, "".join(self._content)
+
+
+def _get_cache() -> ResponseCache | None:
+    """생성 결과 캐시를 반환합니다. GENERATION_CACHE_ENABLED가 꺼져 있으면 None."""
+    global _cache, _cache_key
+
+    if not Config.GENERATION_CACHE_ENABLED:
+        return None
+
+    key = (Config.GENERATION_CACHE_TTL, Config.GENERATION_CACHE_MAX_ENTRIES)
+    with _cache_lock:
+        if _cache is None or _cache_key != key:
+            if _cache is not None:
+                _cache.close()
+            ttl = Config.GENERATION_CACHE_TTL if Config.GENERATION_CACHE_TTL > 0 else _NO_EXPIRY
+            max_entries = max(1, Config.GENERATION_CACHE_MAX_ENTRIES)
+            _cache = ResponseCache(
+                max_entries=min(max_entries, 32),  # 글 본문이 크므로 메모리에는 최근 것만
+                default_ttl=ttl,
+                db_path=CACHE_DIR / "generations.db",
+                max_disk_entries=max_entries,
+            )
+            _cache_key = key
+        return _cache
+
+
+def _request_digest(request: GenerationRequest, model: str) -> str:
+    """응답을 결정하는 모든 입력(모델·추론 강도·토큰 한도·프롬프트)의 SHA-256 해시."""
+    parts = [model, Config.GPT_REASONING_EFFORT, request.max_tokens,
+             request.system_prompt, request.user_prompt]
+    if request.response_format is not None:
+        parts.append(request.response_format)
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_gpt_limiter() -> AdaptiveLimiter:
+    """모든 글쓰기 모드·트렌드 분석·배치가 공유하는 GPT 동시 호출 제한기를 반환합니다."""
+    global _limiter, _limiter_key
+
+    key = (Config.GPT_MAX_CONCURRENCY, Config.GPT_TOKENS_PER_MINUTE)
+    with _limiter_lock:
+        if _limiter is None or _limiter_key != key:
+            _limiter = AdaptiveLimiter(Config.GPT_MAX_CONCURRENCY, Config.GPT_TOKENS_PER_MINUTE)
+            _limiter_key = key
+        return _limiter
+
+
+def estimate_tokens(request_body: dict) -> int:
+    """요청 본문이 분당 토큰 한도에서 차지할 양 (입력 토큰 + 최대 출력 토큰)."""
+    prompt = sum(count_tokens(m["content"], request_body["model"]) for m in request_body["messages"])
+    return prompt + request_body["max_completion_tokens"]
+
+
+def settle_lease(lease: Lease, usage) -> None:
+    """정상 응답의 실제 사용량을 제한기 허가에 기록합니다."""
+    prompt_tokens, _, completion_tokens, _ = telemetry.usage_tokens(usage)
+    lease.ok = True
+    if prompt_tokens or completion_tokens:
+        lease.used_tokens = prompt_tokens + completion_tokens
+        lease.output_tokens = completion_tokens
+
+
+def generation_cache_stats() -> dict:
+    """생성 캐시 적중/미스 통계를 반환합니다. 캐시가 꺼져 있으면 빈 딕셔너리."""
+    cache = _get_cache()
+    return cache.stats() if cache is not None else {}
+
+
+class GenerationEngine:
+    """GPT 호출·재시도·응답 검사·파싱·지표 수집을 담당하는 공용 엔진입니다."""
+
+    def __init__(self, client: OpenAI | None = None, router: ModelRouter | None = None):
+        self._client = client
+        self._router = router
+        self._metrics: dict[str, dict] = {}
+        self._metrics_lock = threading.Lock()
+        self._prefix_hashes: dict[str, str] = {}
+        # 구조화 출력(response_format)을 거부한 모델 — 이후에는 바로 일반 텍스트로 요청
+        self._structured_rejected: set[str] = set()
+
+    @property
+    def client(self) -> OpenAI:
+        """주입된 클라이언트, 없으면 프로세스 전역 공유 클라이언트 (설정 변경 시 자동 교체)."""
+        return self._client or get_client()
+
+    @property
+    def router(self) -> ModelRouter:
+        """주입된 라우터, 없으면 프로세스 전역 라우터 (설정 변경 시 자동 교체)."""
+        return self._router or get_router()
+
+    def complete(self, request: GenerationRequest, force_regenerate: bool = False) -> str:
+        """요청을 GPT에 보내고 응답 텍스트를 반환합니다.
+
+        모델은 라우터가 정한 순서대로 시도하며, 호출 자체가 실패하면(타임아웃·5xx·서킷 열림 등)
+        다음 모델로 다시 요청합니다. 잘못된 요청(400)·콘텐츠 필터·빈 응답은 대체하지 않습니다.
+
+        Args:
+            request: 생성 요청
+            force_regenerate: True면 캐시를 무시하고 새로 생성 (결과는 캐시에 덮어씀)
+
+        Raises:
+            RuntimeError: 호출 실패, 콘텐츠 필터 차단, 빈 응답
+        """
+        return self._complete(request, force_regenerate, structured=False)[0]
+
+    def _complete(
+        self, request: GenerationRequest, force_regenerate: bool, structured: bool
+    ) -> tuple[str, bool]:
+        """complete() 본체. (응답 텍스트, 구조화 출력 응답 여부)를 반환합니다.
+
+        structured=True 면 모델마다 prepare() 로 구조화 출력을 적용하고,
+        그 모델이 response_format 을 거부하면 기록한 뒤 같은 모델에 일반 텍스트로 다시 요청합니다.
+        """
+        models = self.router.candidates(request.mode)
+
+        def for_model(model: str) -> GenerationRequest:
+            return self.prepare(request, model) if structured else request
+
+        if not force_regenerate:
+            for model in models:
+                prepared = for_model(model)
+                cached = self._cached(prepared, model, _request_digest(prepared, model))
+                if cached is not None:
+                    return cached, prepared.response_format is not None
+
+        i = 0
+        while i < len(models):
+            model = models[i]
+            prepared = for_model(model)
+            try:
+                return self._complete_with(prepared, model), prepared.response_format is not None
+            except RuntimeError as e:
+                if prepared is not request and _rejects_structured(e):
+                    self._structured_rejected.add(model)
+                    logger.warning(
+                        "%s 이(가) 구조화 출력 요청을 거부해 일반 텍스트로 생성합니다: %s", model, e
+                    )
+                    continue
+                if i + 1 == len(models) or not _can_fall_back(e):
+                    raise
+                logger.warning("[%s] %s 실패 → %s 로 다시 요청합니다", request.mode, model, models[i + 1])
+                i += 1
+        raise RuntimeError("사용할 GPT 모델이 없습니다. GPT_MODEL 설정을 확인하세요.")
+
+    def _complete_with(self, request: GenerationRequest, model: str) -> str:
+        body = self.request_body(request, model)
+        with get_gpt_limiter().lease(estimate_tokens(body)) as lease:
+            # 소요 시간은 제한기 대기 후부터 (모델 응답 시간만)
+            started = time.monotonic()
+            try:
+                response = self._create(request, model)
+            except Exception as e:
+                self._record(request.mode, time.monotonic() - started, ok=False)
+                self._emit(request, model, time.monotonic() - started, ok=False, error=str(e))
+                logger.error("GPT API 호출 실패 (%s): %s", model, e)
+                raise RuntimeError(f"GPT API 호출 실패: {e}") from e
+            settle_lease(lease, getattr(response, "usage", None))
+
+        choice = response.choices[0]
+        self._check_response(
+            request, model, started, choice.finish_reason, choice.message.content,
+            getattr(response, "usage", None),
+        )
+        self._store(_request_digest(request, model), choice.message.content)
+        return choice.message.content
+
+    def stream(
+        self, request: GenerationRequest, force_regenerate: bool = False
+    ) -> Iterator[StreamEvent]:
+        """요청을 스트리밍으로 보내고 제목·본문 조각을 도착하는 대로 내보냅니다.
+
+        마지막 "done" 이벤트의 post 는 {"title", "content"} 입니다.
+        구조화 출력은 쓰지 않으므로 request 는 prepare() 를 거치지 않은 일반 텍스트 요청이어야 합니다.
+        재시도는 스트림 연결 단계까지만 적용됩니다(이미 받은 조각은 되돌릴 수 없음).
+        대체 모델도 아직 아무 이벤트도 내보내지 않았을 때만 사용합니다.
+        캐시에 있으면 저장된 응답을 한 번에 내보냅니다.
+
+        Raises:
+            RuntimeError: 호출 실패, 스트림 중단, 콘텐츠 필터 차단, 빈 응답
+        """
+        models = self.router.candidates(request.mode)
+        if not force_regenerate:
+            for model in models:
+                cached = self._cached(request, model, _request_digest(request, model))
+                if cached is not None:
+                    parser = _StreamingTitleParser()
+                    yield from parser.feed(cached)
+                    title, content = parser.finish()
+                    yield StreamEvent("done", post={"title": title, "content": content})
+                    return
+
+        for i, model in enumerate(models):
+            emitted = False
+            try:
+                for event in self._stream_with(request, model):
+                    emitted = True
+                    yield event
+                return
+            except RuntimeError as e:
+                if emitted or i + 1 == len(models) or not _can_fall_back(e):
+                    raise
+                logger.warning("[%s] %s 스트리밍 실패 → %s 로 다시 요청합니다",
+                               request.mode, model, models[i + 1])
+        raise RuntimeError("사용할 GPT 모델이 없습니다. GPT_MODEL 설정을 확인하세요.")
+
+    def _stream_with(self, request: GenerationRequest, model: str) -> Iterator[StreamEvent]:
+        parser = _StreamingTitleParser()
+        parts: list[str] = []
+        finish_reason = None
+        usage = None
+        ttft = None
+        body = self.request_body(request, model)
+        # 스트림을 다 받을 때까지 동시 호출 자리를 유지
+        with get_gpt_limiter().lease(estimate_tokens(body)) as lease:
+            started = time.monotonic()
+            try:
+                chunks = self._create(request, model, stream=True)
+                for chunk in chunks:
+                    # 사용량은 마지막 조각(choices 비어 있음)에 담겨 옴
+                    usage = getattr(chunk, "usage", None) or usage
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    finish_reason = choice.finish_reason or finish_reason
+                    delta = choice.delta.content if choice.delta else None
+                    if not delta:
+                        continue
+                    if not parts:
+                        ttft = time.monotonic() - started
+                        logger.info("GPT 첫 응답 [%s] %.1f초", request.mode, ttft)
+                    parts.append(delta)
+                    yield from parser.feed(delta)
+            except Exception as e:
+                self._record(request.mode, time.monotonic() - started, ok=False)
+                self._emit(
+                    request, model, time.monotonic() - started, ok=False, error=str(e),
+                    stream=True, ttft=ttft,
+                )
+                logger.error("GPT 스트리밍 실패 (%s): %s", model, e)
+                raise RuntimeError(f"GPT API 호출 실패: {e}") from e
+            settle_lease(lease, usage)
+
+        text = "".join(parts)
+        self._check_response(request, model, started, finish_reason, text, usage, ttft=ttft)
+        self._store(_request_digest(request, model), text)
+        title, content = parser.finish()
+        yield StreamEvent("done", post={"title": title, "content": content})
+
+    def _cached(self, request: GenerationRequest, model: str, digest: str) -> str | None:
+        cache = _get_cache()
+        text = cache.get(("generation", digest)) if cache is not None else None
+        if text:
+            logger.info("GPT 생성 캐시 사용 [%s]: %s", request.mode, request.label)
+            self._record(request.mode, 0.0, ok=True, cached=True)
+            self._emit(request, model, 0.0, ok=True, cache_hit=True)
+            return text
+        return None
+
+    @staticmethod
+    def _store(digest: str, text: str) -> None:
+        cache = _get_cache()
+        if cache is not None:
+            cache.set(("generation", digest), text)
+
+    @staticmethod
+    def request_body(request: GenerationRequest, model: str) -> dict:
+        """Chat Completions 요청 본문 (JSON). 배치 입력 파일에도 그대로 쓰입니다."""
+        body = {
+            "model": model,
+            "max_completion_tokens": request.max_tokens,
+            "reasoning_effort": Config.GPT_REASONING_EFFORT,
+            # 고정 접두부(시스템) → 가변부(사용자) 순서 유지
+            "messages": [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": request.user_prompt},
+            ],
+            # 같은 접두부 요청이 같은 캐시 서버로 가도록 라우팅 힌트 제공
+            "prompt_cache_key": f"auto_blog-{_prefix_name(request)}-v{PROMPT_VERSION}",
+        }
+        if request.response_format is not None:
+            body["response_format"] = request.response_format
+        return body
+
+    def _create(self, request: GenerationRequest, model: str, stream: bool = False):
+        self._check_prefix(request)
+        kwargs = sdk_kwargs(self.request_body(request, model))
+        if stream:
+            kwargs["stream"] = True
+            kwargs["stream_options"] = {"include_usage": True}
+        return call_with_retry(
+            lambda: limited_create(self.client, kwargs),
+            endpoint=f"openai:{model}",
+            policy=default_policy(Config.GPT_DEADLINE_SECONDS),
+        )
+
+    def _check_prefix(self, request: GenerationRequest) -> None:
+        """같은 모드의 시스템 프롬프트가 실행 중에 바뀌면 경고합니다 (프롬프트 캐시 무효화)."""
+        digest = hashlib.sha256(request.system_prompt.encode("utf-8")).hexdigest()[:12]
+        with self._metrics_lock:
+            previous = self._prefix_hashes.get(_prefix_name(request))
+            self._prefix_hashes[_prefix_name(request)] = digest
+        if previous is not None and previous != digest:
+            logger.warning(
+                "[%s] 시스템 프롬프트가 바뀌어 프롬프트 캐시가 적용되지 않습니다 (%s → %s). "
+                "가변 값은 사용자 메시지에 넣어주세요.",
+                request.mode, previous, digest,
+            )
+
+    def _check_response(
+        self,
+        request: GenerationRequest,
+        model: str,
+        started: float,
+        finish_reason: str | None,
+        text: str | None,
+        usage=None,
+        ttft: float | None = None,
+    ) -> None:
+        """응답 종료 사유를 검사하고 호출 지표·호출 기록을 남깁니다.
+
+        ttft 는 스트리밍 호출에서 첫 응답 조각까지 걸린 시간입니다 (일반 호출은 None).
+        """
+        elapsed = time.monotonic() - started
+        ok = finish_reason != "content_filter" and bool(text)
+        tokens = telemetry.usage_tokens(usage)
+        self._record(request.mode, elapsed, ok=ok, tokens=tokens)
+        self._emit(
+            request, model, elapsed, ok=ok, finish_reason=finish_reason or "",
+            stream=ttft is not None, tokens=tokens, ttft=ttft,
+        )
+
+        if ok:
+            self.router.observe(model, request.mode, elapsed)
+
+        if finish_reason == "content_filter":
+            raise RuntimeError("GPT 콘텐츠 필터에 의해 응답이 차단되었습니다.")
+        if not text:
+            raise RuntimeError("GPT 응답이 비어있습니다. 다시 시도해주세요.")
+        if finish_reason == "length":
+            logger.warning("GPT 응답이 최대 토큰(%d)에서 잘렸습니다: %s",
+                           request.max_tokens, request.label)
+
+        prompt_tokens, cached_tokens, completion_tokens, _ = tokens
+        logger.info(
+            "GPT 응답 수신 [%s] %.1f초 (%s, 입력 %d토큰 중 캐시 %d, 출력 %d토큰)",
+            request.mode, elapsed, model, prompt_tokens, cached_tokens, completion_tokens,
+        )
+
+    def generate(self, request: GenerationRequest, force_regenerate: bool = False) -> dict:
+        """요청을 GPT에 보내고 제목과 본문을 분리해 반환합니다.
+
+        GPT_STRUCTURED_OUTPUT이 켜져 있으면 JSON 스키마 모드로 요청합니다.
+        모델이 response_format 을 지원하지 않으면(400) 그 모델에는 이후 일반 텍스트로 요청합니다.
+
+        Returns:
+            {"title": str, "content": str} 형태의 딕셔너리
+            (구조화 출력이면 "summary", "keywords", "tags" 도 포함)
+        """
+        text, structured = self._complete(request, force_regenerate, structured=True)
+        return parse_post(text, structured=structured)
+
+    def prepare(self, request: GenerationRequest, model: str | None = None) -> GenerationRequest:
+        """글 생성 요청에 구조화 출력을 적용합니다 (꺼져 있거나 모델이 거부했으면 그대로).
+
+        Args:
+            request: 생성 요청
+            model: 호출할 모델 (None이면 작업의 기본 모델)
+        """
+        model = model or self.router.primary(request.mode)
+        if Config.GPT_STRUCTURED_OUTPUT and model not in self._structured_rejected:
+            return _structured(request)
+        return request
+
+    def metrics(self) -> dict[str, dict]:
+        """모드별 호출 지표 사본.
+
+        {"calls", "failures", "cache_hits", "total_seconds", "last_seconds",
+         "prompt_tokens", "cached_prompt_tokens", "completion_tokens", "reasoning_tokens"}
+        cache_hits 는 생성 캐시 적중, cached_prompt_tokens 는 제공자 프롬프트 캐시 적중 토큰입니다.
+        """
+        with self._metrics_lock:
+            return {mode: dict(m) for mode, m in self._metrics.items()}
+
+    def _record(
+        self,
+        mode: str,
+        seconds: float,
+        ok: bool,
+        cached: bool = False,
+        tokens: tuple[int, int, int, int] = (0, 0, 0, 0),
+    ) -> None:
+        with self._metrics_lock:
+            m = self._metrics.setdefault(
+                mode,
+                {"calls": 0, "failures": 0, "cache_hits": 0,
+                 "total_seconds": 0.0, "last_seconds": 0.0,
+                 "prompt_tokens": 0, "cached_prompt_tokens": 0, "completion_tokens": 0,
+                 "reasoning_tokens": 0},
+            )
+            if cached:
+                m["cache_hits"] += 1
+                return
+            m["calls"] += 1
+            if not ok:
+                m["failures"] += 1
+            m["total_seconds"] += seconds
+            m["last_seconds"] = seconds
+            m["prompt_tokens"] += tokens[0]
+            m["cached_prompt_tokens"] += tokens[1]
+            m["completion_tokens"] += tokens[2]
+            m["reasoning_tokens"] += tokens[3]
+
+    @staticmethod
+    def _emit(
+        request: GenerationRequest,
+        model: str,
+        seconds: float,
+        ok: bool,
+        error: str = "",
+        finish_reason: str = "",
+        cache_hit: bool = False,
+        stream: bool = False,
+        tokens: tuple[int, int, int, int] = (0, 0, 0, 0),
+        ttft: float | None = None,
+    ) -> None:
+        """호출 한 건을 telemetry 저장소에 기록합니다."""
+        if not Config.TELEMETRY_ENABLED:
+            return
+        prompt_tokens, cached_tokens, completion_tokens, reasoning_tokens = tokens
+        telemetry.record(telemetry.GenerationRecord(
+            mode=request.mode,
+            model=model,
+            label=request.label,
+            ok=ok,
+            error=error,
+            finish_reason=finish_reason,
+            cache_hit=cache_hit,
+            stream=stream,
+            prompt_tokens=prompt_tokens,
+            cached_tokens=cached_tokens,
+            completion_tokens=completion_tokens,
+            reasoning_tokens=reasoning_tokens,
+            system_tokens=count_tokens(request.system_prompt, model),
+            user_tokens=count_tokens(request.user_prompt, model),
+            seconds=seconds,
+            ttft=ttft,
+            cost=0.0 if cache_hit else telemetry.estimate_cost(
+                model, prompt_tokens, cached_tokens, completion_tokens
+            ),
+        ))
+
+
+def _can_fall_back(error: RuntimeError) -> bool:
+    """대체 모델로 다시 요청할 만한 실패인지 (호출 자체의 실패, 잘못된 요청 제외)."""
+    cause = error.__cause__
+    return cause is not None and not isinstance(
+        cause, (openai.BadRequestError, openai.AuthenticationError, openai.PermissionDeniedError)
+    )
+
+
+def _rejects_structured(error: RuntimeError) -> bool:
+    """구조화 출력(response_format) 자체를 지원하지 않는다는 400 인지 (문맥 길이 초과 등 다른 400 제외)."""
+    cause = error.__cause__
+    if not isinstance(cause, openai.BadRequestError):
+        return False
+    if getattr(cause, "param", None) == "response_format":
+        return True
+    message = str(cause).lower()
+    return "response_format" in message or "json_schema" in message
+
+
+def limited_create(client: OpenAI, kwargs: dict):
+    """chat.completions.create 를 호출하고, 429면 공유 제한기의 동시 호출 한도를 줄입니다."""
+    try:
+        return client.chat.completions.create(**kwargs)
+    except openai.RateLimitError as e:
+        # 크레딧 소진은 속도 문제가 아니므로 한도를 줄이지 않음
+        if getattr(e, "code", None) != "insufficient_quota":
+            get_gpt_limiter().throttled(retry_after_seconds(e))
+        raise
+
+
+def sdk_kwargs(body: dict) -> dict:
+    """요청 본문을 OpenAI SDK create() 인자로 바꿉니다 (SDK가 모르는 필드는 extra_body 로)."""
+    kwargs = dict(body)
+    kwargs["extra_body"] = {"prompt_cache_key": kwargs.pop("prompt_cache_key")}
+    return kwargs
+
+
+_engine: GenerationEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> GenerationEngine:
+    """프로세스 전역 생성 엔진을 반환합니다."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = GenerationEngine()
+        return _engine
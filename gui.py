@@ -391,6 +391,18 @@ class AutoBlogApp(tk.Tk):
                      fg=C['dim'], font=(FONT_KR, 8)).pack(anchor='w', pady=(2, 0))
         return cb
 
+    def _checkbox(self, parent, label: str, hint: str = '',
+                  value: bool = False) -> tk.BooleanVar:
+        var = tk.BooleanVar(value=value)
+        tk.Checkbutton(parent, text=label, variable=var,
+                       bg=C['surface'], fg=C['text'], selectcolor=C['input'],
+                       activebackground=C['surface'], activeforeground=C['text'],
+                       font=(FONT_KR, 10)).pack(anchor='w', pady=(12, 0))
+        if hint:
+            tk.Label(parent, text=hint, bg=C['surface'],
+                     fg=C['dim'], font=(FONT_KR, 8)).pack(anchor='w', pady=(2, 0))
+        return var
+
     def _status_label(self, parent) -> tk.Label:
         lbl = tk.Label(parent, text='', bg=C['surface'],
                        fg=C['dim'], font=(FONT_KR, 9))
@@ -462,6 +474,9 @@ class AutoBlogApp(tk.Tk):
         self._issue_category = self._combo(
             card, '카테고리  (선택)', CATEGORIES,
             '미선택 시 기본 카테고리로 발행됩니다.')
+        self._issue_regen = self._checkbox(
+            card, '새로 생성',
+            '같은 주제로 이전에 생성한 글(생성 캐시)이 있어도 GPT로 다시 작성합니다.')
 
         # 버튼 영역
         btn_row = tk.Frame(card, bg=C['surface'])
@@ -503,15 +518,24 @@ class AutoBlogApp(tk.Tk):
         kw_raw = self._issue_kw.get().strip()
         keywords = [k.strip() for k in kw_raw.split(',')] if kw_raw else None
 
+        regenerate = self._issue_regen.get()
+
         self._start_progress(self._issue_status, '글 생성 중...')
         self._log_msg(f"[이슈] 미리보기 생성 시작: {topic}")
 
         def task():
             try:
                 self._reload_config()
+                from auto_blog.config import Config
                 from auto_blog.issue_writer import IssueWriter
-                post = IssueWriter().generate_post(topic, keywords)
-                self._log_msg(f"  > 제목: {post['title']}  ({len(post['content'])}자)")
+                if Config.ISSUE_PARALLEL_SECTIONS:
+                    # 섹션 병렬 생성은 스트리밍을 지원하지 않으므로 한 번에 받음
+                    post = IssueWriter().generate_post(topic, keywords, regenerate)
+                else:
+                    post = self._consume_stream(
+                        IssueWriter().generate_post_stream(topic, keywords, regenerate),
+                        self._issue_status)
+                self._log_msg(f"  > 생성 완료 ({len(post['content'])}자)")
 
                 from auto_blog.post_saver import save_post
                 saved = save_post(post['title'], post['content'])
@@ -545,6 +569,7 @@ class AutoBlogApp(tk.Tk):
         kw_raw = self._issue_kw.get().strip()
         keywords = [k.strip() for k in kw_raw.split(',')] if kw_raw else None
         cat = self._get_issue_category()
+        regenerate = self._issue_regen.get()
 
         self._start_progress(self._issue_status, '글 생성 중...')
         self._log_msg(f"[이슈] 생성 시작: {topic}")
@@ -554,7 +579,7 @@ class AutoBlogApp(tk.Tk):
                 self._reload_config()
                 from auto_blog.issue_writer import IssueWriter
                 from auto_blog.naver_blog import NaverBlogClient
-                post = IssueWriter().generate_post(topic, keywords)
+                post = IssueWriter().generate_post(topic, keywords, regenerate)
                 self._log_msg(f"  > 제목: {post['title']}  ({len(post['content'])}자)")
 
                 from auto_blog.post_saver import save_post
@@ -581,6 +606,7 @@ class AutoBlogApp(tk.Tk):
     def _run_issue_auto(self):
         """트렌드를 자동 분석해 가장 조회수 높을 주제로 이슈 정리글을 작성 발행합니다."""
         cat = self._get_issue_category()
+        regenerate = self._issue_regen.get()
         self._start_progress(self._issue_status, '트렌드 분석 중...')
         self._log_msg("[자동 트렌드] 트렌드 분석 시작...")
 
@@ -609,7 +635,7 @@ class AutoBlogApp(tk.Tk):
                     self._issue_status, '글 생성 중...', C['warn']))
 
                 # 글 생성
-                post = IssueWriter().generate_post(topic, keywords)
+                post = IssueWriter().generate_post(topic, keywords, regenerate)
                 self._log_msg(f"  > 제목: {post['title']}  ({len(post['content'])}자)")
 
                 from auto_blog.post_saver import save_post
@@ -701,6 +727,9 @@ class AutoBlogApp(tk.Tk):
             card, 'SEO 키워드  (선택, 쉼표 구분)', '예:  AI, 직업, 미래')
         self._opinion_category = self._combo(
             card, '카테고리  (선택)', CATEGORIES)
+        self._opinion_regen = self._checkbox(
+            card, '새로 생성',
+            '같은 주제·생각으로 이전에 생성한 글(생성 캐시)이 있어도 GPT로 다시 작성합니다.')
 
         btn_row = tk.Frame(card, bg=C['surface'])
         btn_row.pack(fill='x', pady=(20, 0))
@@ -737,6 +766,8 @@ class AutoBlogApp(tk.Tk):
         kw_raw = self._opinion_kw.get().strip()
         keywords = [k.strip() for k in kw_raw.split(',')] if kw_raw else None
 
+        regenerate = self._opinion_regen.get()
+
         self._start_progress(self._opinion_status, '글 생성 중...')
         self._log_msg(f"[의견] 미리보기 생성 시작: {topic}")
 
@@ -744,8 +775,10 @@ class AutoBlogApp(tk.Tk):
             try:
                 self._reload_config()
                 from auto_blog.opinion_writer import OpinionWriter
-                post = OpinionWriter().generate_post(topic, thoughts, keywords)
-                self._log_msg(f"  > 제목: {post['title']}  ({len(post['content'])}자)")
+                post = self._consume_stream(
+                    OpinionWriter().generate_post_stream(topic, thoughts, keywords, regenerate),
+                    self._opinion_status)
+                self._log_msg(f"  > 생성 완료 ({len(post['content'])}자)")
 
                 from auto_blog.post_saver import save_post
                 saved = save_post(post['title'], post['content'])
@@ -783,6 +816,7 @@ class AutoBlogApp(tk.Tk):
         kw_raw = self._opinion_kw.get().strip()
         keywords = [k.strip() for k in kw_raw.split(',')] if kw_raw else None
         cat = self._get_opinion_category()
+        regenerate = self._opinion_regen.get()
 
         self._start_progress(self._opinion_status, '글 생성 중...')
         self._log_msg(f"[의견] 생성 시작: {topic}")
@@ -792,7 +826,7 @@ class AutoBlogApp(tk.Tk):
                 self._reload_config()
                 from auto_blog.opinion_writer import OpinionWriter
                 from auto_blog.naver_blog import NaverBlogClient
-                post = OpinionWriter().generate_post(topic, thoughts, keywords)
+                post = OpinionWriter().generate_post(topic, thoughts, keywords, regenerate)
                 self._log_msg(f"  > 제목: {post['title']}  ({len(post['content'])}자)")
 
                 from auto_blog.post_saver import save_post
@@ -867,6 +901,9 @@ class AutoBlogApp(tk.Tk):
         self._saved_category = self._combo(
             card, '카테고리  (선택)', CATEGORIES,
             '미선택 시 기본 카테고리로 발행됩니다.')
+        self._issue_regen = self._checkbox(
+            card, '새로 생성',
+            '같은 주제로 이전에 생성한 글(생성 캐시)이 있어도 GPT로 다시 작성합니다.')
 
         # 버튼 영역
         btn_row = tk.Frame(card, bg=C['surface'])
@@ -1068,6 +1105,11 @@ class AutoBlogApp(tk.Tk):
             highlightcolor=C['primary'], wrap='word')
         self._sched_topics.pack(fill='x')
 
+        self._sched_regen = self._checkbox(
+            card, '매번 새로 생성',
+            '끄면 같은 주제가 다시 나올 때 이전에 생성한 글(생성 캐시)을 그대로 발행할 수 있습니다.',
+            value=True)
+
         btn_row = tk.Frame(card, bg=C['surface'])
         btn_row.pack(fill='x', pady=(18, 0))
         self._sched_start_btn = ttk.Button(
@@ -1093,6 +1135,7 @@ class AutoBlogApp(tk.Tk):
         run_time = self._sched_time.get().strip()
         topics_raw = self._sched_topics.get('1.0', 'end').strip()
         mode = self._sched_mode.get()
+        regenerate = self._sched_regen.get()
 
         if not run_time:
             messagebox.showwarning('입력 오류', '발행 시각을 입력해주세요.', parent=self)
@@ -1126,7 +1169,7 @@ class AutoBlogApp(tk.Tk):
 
         def run():
             from auto_blog.scheduler import run_scheduler
-            run_scheduler(self._tmp_topics, run_time, mode)
+            run_scheduler(self._tmp_topics, run_time, mode, regenerate=regenerate)
 
         threading.Thread(target=run, daemon=True).start()
 
@@ -1315,6 +1358,27 @@ class AutoBlogApp(tk.Tk):
         except Exception:
             pass
 
+    def _consume_stream(self, events, status_label: tk.Label) -> dict:
+        """스트리밍 생성 이벤트를 받아 진행 상황을 표시하고 최종 글을 반환합니다.
+
+        작업 스레드에서 호출합니다. 제목은 완성 즉시 로그에, 본문 길이는 상태 표시줄에 보여줍니다.
+        """
+        received = 0
+        shown = 0
+        for event in events:
+            if event.kind == 'title':
+                self._log_msg(f"  > 제목: {event.text}")
+            elif event.kind == 'content':
+                received += len(event.text)
+                # UI 갱신은 500자마다
+                if received - shown >= 500:
+                    shown = received
+                    msg = f'글 생성 중... ({received:,}자)'
+                    self.after(0, lambda m=msg: self._set_status(status_label, m, C['warn']))
+            elif event.kind == 'done':
+                return event.post
+        raise RuntimeError('글 생성이 완료되지 않았습니다.')
+
     def _set_status(self, label: tk.Label, text: str, color: str):
         label.config(text=text, fg=color)
 